@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+import argparse
+import textwrap
+from pathlib import Path
+
+from flora.pylib import log, token_audit
+from flora.pylib.pipelines import flora_pipeline
+
+RULE_DIRS = [
+    Path(__file__).parent / "pylib" / "rules",
+    Path(__file__).parent / "pylib" / "pipelines",
+]
+
+# The flora pipeline is mostly made of traiter's pipes
+SCAN_DIRS = [*RULE_DIRS, *token_audit.package_dirs("traiter")]
+
+
+def main():
+    log.started()
+    args = parse_args()
+
+    dirs = [*SCAN_DIRS, *args.also_scan]
+    uses = token_audit.audit(token_audit.source_files(dirs))
+
+    for attr, found in sorted(uses.items()):
+        print(f"{attr} is read in {len(found)} places, it needs: ", end="")
+        print(", ".join(token_audit.PRODUCERS[attr]))
+        if args.verbose:
+            for use in found:
+                print(f"    {use.path}:{use.line}: {use.code}")
+
+    print("Model components that no rule reads:", end=" ")
+    print(", ".join(token_audit.unused(uses)))
+    print("Model components the flora pipeline excludes:", end=" ")
+    print(", ".join(flora_pipeline.MODEL_EXCLUDE))
+
+    log.finished()
+
+
+def parse_args() -> argparse.Namespace:
+    arg_parser = argparse.ArgumentParser(
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        description=textwrap.dedent(
+            """
+            List the token attributes from the statistical model that the flora
+            and traiter rules read, and the model components that nothing reads.
+            """,
+        ),
+    )
+
+    arg_parser.add_argument(
+        "--also-scan",
+        metavar="PATH",
+        type=Path,
+        action="append",
+        default=[],
+        help="""Also scan the Python files in this directory. The flora rules and
+            the installed traiter package are always scanned. You may use this
+            argument more than once.""",
+    )
+
+    arg_parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="""List every place an attribute is read.""",
+    )
+
+    args = arg_parser.parse_args()
+    return args
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Measure pipeline throughput and compare it against a stored baseline.
+
+Every pipeline is benchmarked in a fresh process so that its build time and peak
+memory are not polluted by the other pipelines.
+"""
+
+import argparse
+import json
+import logging
+import multiprocessing
+import platform
+import resource
+import sys
+import textwrap
+from datetime import datetime
+from functools import partial
+from pathlib import Path
+from time import perf_counter
+
+from flora.pylib import log
+from flora.pylib.pipelines import flora_pipeline, mimosa_pipeline
+from flora.pylib.treatment import Treatment
+
+PIPELINES = {
+    "flora": flora_pipeline.build,
+    "model_free": partial(flora_pipeline.build, model=False),
+    "mimosa": mimosa_pipeline.build,
+}
+
+# Metric: (direction, threshold argument) higher is better = 1, lower is better = -1
+METRICS = {
+    "docs_per_sec": (1, "max_slowdown"),
+    "tokens_per_sec": (1, "max_slowdown"),
+    "build_secs": (-1, "max_build_slowdown"),
+    "peak_rss_mb": (-1, "max_rss_growth"),
+}
+
+
+def main():
+    log.started()
+    args = parse_args()
+
+    texts = read_texts(args.treatment_dir, args.limit, args.encoding)
+
+    results = {}
+    ctx = multiprocessing.get_context("spawn")
+    for name in args.pipeline:
+        with ctx.Pool(1) as pool:
+            results[name] = pool.apply(benchmark, (name, texts, args.repeat))
+
+    report = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "docs": len(texts),
+        "pipelines": results,
+    }
+
+    print_results(results)
+
+    if args.save_baseline:
+        with args.save_baseline.open("w") as f:
+            json.dump(report, f, indent=4)
+
+    regressions = []
+    if args.baseline:
+        with args.baseline.open() as f:
+            baseline = json.load(f)
+        regressions = compare(baseline, report, args)
+
+    log.finished()
+
+    if regressions:
+        sys.exit(1)
+
+
+def read_texts(treatment_dir: Path, limit: int, encoding: str) -> list[str]:
+    paths = sorted(treatment_dir.glob("*"))
+    paths = paths[:limit] if limit else paths
+    return [Treatment(p).read(encoding=encoding) for p in paths]
+
+
+def benchmark(name: str, texts: list[str], repeat: int) -> dict:
+    """Run in a child process so peak memory belongs to this pipeline only."""
+    start = perf_counter()
+    nlp = PIPELINES[name]()
+    build_secs = perf_counter() - start
+
+    best = float("inf")
+    tokens = 0
+    for _ in range(repeat):
+        tokens = 0
+        start = perf_counter()
+        for doc in nlp.pipe(texts):
+            tokens += len(doc)
+        best = min(best, perf_counter() - start)
+
+    best = max(best, 1e-9)
+
+    return {
+        "build_secs": round(build_secs, 3),
+        "parse_secs": round(best, 3),
+        "docs_per_sec": round(len(texts) / best, 2),
+        "tokens_per_sec": round(tokens / best, 1),
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+    }
+
+
+def peak_rss_mb() -> float:
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes and macOS reports bytes
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def compare(baseline: dict, report: dict, args) -> list[str]:
+    """Report how much every metric changed and flag those beyond its threshold."""
+    regressions = []
+
+    print(
+        f"{'pipeline':<8} {'metric':<16} {'baseline':>12} {'current':>12} {'change':>9}"
+    )
+    for name, new in report["pipelines"].items():
+        old = baseline["pipelines"].get(name)
+        if not old:
+            msg = f"No baseline for the {name} pipeline"
+            logging.warning(msg)
+            continue
+
+        for metric, (direction, threshold_arg) in METRICS.items():
+            threshold = getattr(args, threshold_arg)
+            before, after = old[metric], new[metric]
+            if not before:
+                continue
+
+            change = (after - before) / before
+            worse = -change * direction
+            flag = "REGRESSION" if worse > threshold else ""
+            print(
+                f"{name:<8} {metric:<16} {before:>12} {after:>12} "
+                f"{100.0 * change:>+8.1f}% {flag}"
+            )
+            if flag:
+                regressions.append(f"{name} {metric}")
+
+    return regressions
+
+
+def print_results(results: dict) -> None:
+    print(f"{'pipeline':<8} " + " ".join(f"{m:>16}" for m in METRICS))
+    for name, result in results.items():
+        print(f"{name:<8} " + " ".join(f"{result[m]:>16}" for m in METRICS))
+
+
+def parse_args() -> argparse.Namespace:
+    arg_parser = argparse.ArgumentParser(
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        description=textwrap.dedent(
+            """
+            Benchmark pipeline build time, throughput, and peak memory on a set of
+            treatments. Save the results as a baseline or compare them to one.
+            """,
+        ),
+    )
+
+    arg_parser.add_argument(
+        "--treatment-dir",
+        metavar="PATH",
+        type=Path,
+        required=True,
+        help="""Directory containing the treatment text files to parse.""",
+    )
+
+    arg_parser.add_argument(
+        "--pipeline",
+        choices=list(PIPELINES),
+        action="append",
+        help="""Benchmark this pipeline. You may use this argument more than once.
+            (default: all of them)""",
+    )
+
+    arg_parser.add_argument(
+        "--limit",
+        type=int,
+        help="""Only parse this many treatments.""",
+    )
+
+    arg_parser.add_argument(
+        "--repeat",
+        type=int,
+        metavar="INT",
+        default=3,
+        help="""Parse the treatments this many times and keep the fastest run.
+            (default: %(default)s)""",
+    )
+
+    arg_parser.add_argument(
+        "--save-baseline",
+        metavar="PATH",
+        type=Path,
+        help="""Save the results to this JSON file.""",
+    )
+
+    arg_parser.add_argument(
+        "--baseline",
+        metavar="PATH",
+        type=Path,
+        help="""Compare the results to this baseline JSON file and exit with an
+            error if any metric regressed beyond its threshold.""",
+    )
+
+    arg_parser.add_argument(
+        "--max-slowdown",
+        type=float,
+        metavar="FRACTION",
+        default=0.10,
+        help="""Flag a drop in docs/sec or tokens/sec bigger than this.
+            (default: %(default)s)""",
+    )
+
+    arg_parser.add_argument(
+        "--max-build-slowdown",
+        type=float,
+        metavar="FRACTION",
+        default=0.25,
+        help="""Flag a pipeline build time increase bigger than this.
+            (default: %(default)s)""",
+    )
+
+    arg_parser.add_argument(
+        "--max-rss-growth",
+        type=float,
+        metavar="FRACTION",
+        default=0.10,
+        help="""Flag a peak memory increase bigger than this. (default: %(default)s)""",
+    )
+
+    arg_parser.add_argument(
+        "--encoding",
+        metavar="ENCODING",
+        default="utf8",
+        help="""What encoding is used for the input files. (default: %(default)s)""",
+    )
+
+    args = arg_parser.parse_args()
+    args.pipeline = args.pipeline if args.pipeline else list(PIPELINES)
+    return args
+
+
+if __name__ == "__main__":
+    main()
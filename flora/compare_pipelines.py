@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Compare the traits from the model-free pipeline with those from the full pipeline.
+
+The full pipeline is treated as the reference. A trait from the model-free pipeline
+is correct when the full pipeline found the same trait with the same label, offsets,
+and data.
+"""
+
+import argparse
+import json
+import textwrap
+from collections import Counter
+from pathlib import Path
+from time import perf_counter
+
+from flora.pylib import log
+from flora.pylib.pipelines import flora_pipeline
+from flora.pylib.treatment import Treatment
+
+PIPELINES = {"model_free": False, "full": True}
+
+
+def main():
+    log.started()
+    args = parse_args()
+
+    paths = sorted(args.treatment_dir.glob("*"))
+    paths = paths[: args.limit] if args.limit else paths
+    texts = [Treatment(p).read(encoding=args.encoding) for p in paths]
+
+    # Build the model-free pipeline first so its build time does not benefit from
+    # the imports done for the full one
+    timings = {}
+    found = {}
+    for name, model in PIPELINES.items():
+        start = perf_counter()
+        nlp = flora_pipeline.build(traits=args.traits, model=model)
+        build_secs = perf_counter() - start
+
+        start = perf_counter()
+        found[name] = [traits(doc) for doc in nlp.pipe(texts)]
+        parse_secs = max(perf_counter() - start, 1e-9)
+
+        timings[name] = {
+            "build_secs": round(build_secs, 3),
+            "parse_secs": round(parse_secs, 3),
+            "docs_per_sec": round(len(texts) / parse_secs, 2),
+        }
+
+    scores = compare(found["full"], found["model_free"])
+
+    print_timings(timings)
+    print_scores(scores)
+
+    if args.json_file:
+        report = {"docs": len(texts), "timings": timings, "scores": scores}
+        with args.json_file.open("w") as f:
+            json.dump(report, f, indent=4)
+
+    log.finished()
+
+
+def traits(doc) -> Counter:
+    """Key every trait by its label, offsets, and data."""
+    return Counter(
+        (
+            e.label_,
+            e.start_char,
+            e.end_char,
+            json.dumps(e._.trait.to_dict(), sort_keys=True, default=str),
+        )
+        for e in doc.ents
+    )
+
+
+def compare(expected: list[Counter], actual: list[Counter]) -> dict[str, dict]:
+    """Count the matching traits for every label and for all labels together."""
+    counts = Counter()
+    for want, got in zip(expected, actual, strict=True):
+        for key, n in want.items():
+            counts[key[0], "expected"] += n
+        for key, n in got.items():
+            counts[key[0], "actual"] += n
+        for key, n in (want & got).items():
+            counts[key[0], "matched"] += n
+
+    labels = sorted({label for label, _ in counts})
+    scores = {label: score(counts, [label]) for label in labels}
+    scores["all"] = score(counts, labels)
+    return scores
+
+
+def score(counts: Counter, labels: list[str]) -> dict:
+    expected = sum(counts[lb, "expected"] for lb in labels)
+    actual = sum(counts[lb, "actual"] for lb in labels)
+    matched = sum(counts[lb, "matched"] for lb in labels)
+    return {
+        "expected": expected,
+        "actual": actual,
+        "matched": matched,
+        "precision": round(matched / actual, 4) if actual else 1.0,
+        "recall": round(matched / expected, 4) if expected else 1.0,
+    }
+
+
+def print_timings(timings: dict) -> None:
+    print(f"{'pipeline':<12} {'build_secs':>12} {'parse_secs':>12} {'docs/sec':>12}")
+    for name, t in timings.items():
+        print(
+            f"{name:<12} {t['build_secs']:>12} {t['parse_secs']:>12} "
+            f"{t['docs_per_sec']:>12}"
+        )
+    print()
+
+
+def print_scores(scores: dict) -> None:
+    print(
+        f"{'trait':<20} {'full':>8} {'model_free':>10} {'matched':>8} "
+        f"{'precision':>10} {'recall':>8}"
+    )
+    for label, s in scores.items():
+        print(
+            f"{label:<20} {s['expected']:>8} {s['actual']:>10} {s['matched']:>8} "
+            f"{s['precision']:>10.3f} {s['recall']:>8.3f}"
+        )
+
+
+def parse_args() -> argparse.Namespace:
+    arg_parser = argparse.ArgumentParser(
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        description=textwrap.dedent(
+            """
+            Parse treatments with the model-free pipeline and with the full pipeline
+            and report how well the model-free traits match the full ones.
+            """,
+        ),
+    )
+
+    arg_parser.add_argument(
+        "--treatment-dir",
+        metavar="PATH",
+        type=Path,
+        required=True,
+        help="""Directory containing the treatment text files to parse.""",
+    )
+
+    arg_parser.add_argument(
+        "--limit",
+        type=int,
+        help="""Only parse this many treatments.""",
+    )
+
+    arg_parser.add_argument(
+        "--traits",
+        nargs="+",
+        choices=flora_pipeline.TRAITS,
+        metavar="TRAIT",
+        help="""Only compare these traits and the traits they need.
+            (default: all traits) Choices: %(choices)s""",
+    )
+
+    arg_parser.add_argument(
+        "--json-file",
+        metavar="PATH",
+        type=Path,
+        help="""Also save the report to this JSON file.""",
+    )
+
+    arg_parser.add_argument(
+        "--encoding",
+        metavar="ENCODING",
+        default="utf8",
+        help="""What encoding is used for the input files. (default: %(default)s)""",
+    )
+
+    args = arg_parser.parse_args()
+    return args
+
+
+if __name__ == "__main__":
+    main()
@@ -1,29 +1,120 @@
 #!/usr/bin/env python3
 import argparse
+import logging
 import textwrap
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass, field
 from pathlib import Path
 
-from flora.pylib import const, log
+from flora.pylib import chunks, const, log, term_registry
+from flora.pylib.parse_cache import DEFAULT_MAX_SIZE, ParseCache
+from flora.pylib.pipe_profiler import PipeProfiler
+from flora.pylib.pipelines import flora_pipeline
+from flora.pylib.treatment import Treatment
 from flora.pylib.treatments import Treatments
+from flora.pylib.watcher import Watcher
+from flora.pylib.writers import csv_writer, json_writer, ndjson_writer
 from flora.pylib.writers.csv_writer import write_csv
+from flora.pylib.writers.html_pages_writer import HtmlPagesWriter
 from flora.pylib.writers.html_writer import HtmlWriter
 from flora.pylib.writers.json_writer import write_json
+from flora.pylib.writers.sqlite_writer import SqliteWriter, write_sqlite
 
 
 def main():
     log.started()
     args = parse_args()
 
-    treatments: Treatments = Treatments(args.treatment_dir, args.limit, args.offset)
-    treatments.parse(encoding=args.encoding)
+    if args.gate_pipes and args.profile_pipes:
+        logging.warning("Gating is turned off while profiling pipes")
+        args.gate_pipes = False
 
-    if args.html_file:
-        writer = HtmlWriter(
-            template_dir=f"{const.ROOT_DIR}/flora/pylib/writers/templates",
-            template="treatment_html_writer.html",
-            html_file=args.html_file,
-            spotlight=args.spotlight,
+    treatments: Treatments = Treatments(
+        args.treatment_dir,
+        args.limit,
+        args.offset,
+        args.pipeline_cache,
+        gate=args.gate_pipes,
+        traits=args.traits,
+        model=not args.model_free,
+        chunk_size=args.chunk_size,
+        prefetch=args.prefetch,
+        dedupe=args.dedupe,
+    )
+
+    cache = get_cache(args)
+
+    profiler = None
+    if args.profile_pipes:
+        if args.workers:
+            logging.warning("Profiling pipes in this process instead of in workers")
+            args.workers = 0
+        profiler = PipeProfiler(treatments.nlp)
+        treatments.nlp = profiler
+
+    if args.watch or args.stream:
+        write = watch if args.watch else write_streaming
+        write(treatments, args, cache)
+    else:
+        treatments.parse(
+            encoding=args.encoding,
+            batch_size=args.batch_size,
+            workers=args.workers,
+            cache=cache,
         )
+        write_all(treatments, args)
+
+    if profiler:
+        profiler.print_report()
+        profiler.write_report(args.profile_pipes)
+
+    if args.gate_pipes and not args.workers:
+        treatments.nlp.print_report()
+
+    if args.term_report:
+        term_registry.print_report()
+
+    if cache:
+        close_cache(cache, args)
+
+    if treatments.dedupe:
+        msg = f"Skipped {treatments.dedupe.skipped} duplicate treatments"
+        logging.info(msg)
+
+    log.finished()
+
+
+def get_cache(args: argparse.Namespace) -> ParseCache | None:
+    if not args.cache_dir:
+        return None
+    # Pipelines built with other options parse differently, so keep them apart
+    variant = flora_pipeline.variant(args.traits, model=not args.model_free)
+    return ParseCache(args.cache_dir, args.cache_size, variant=variant)
+
+
+def close_cache(cache: ParseCache, args: argparse.Namespace) -> None:
+    if not args.workers:
+        msg = f"Parse cache hits {cache.hits}, misses {cache.misses}"
+        logging.info(msg)
+    cache.close()
+
+
+def get_html_writer(args) -> HtmlWriter:
+    kwargs = {
+        "template_dir": f"{const.ROOT_DIR}/flora/pylib/writers/templates",
+        "template": "treatment_html_writer.html",
+        "html_file": args.html_file,
+        "spotlight": args.spotlight,
+    }
+    if args.html_page_size:
+        return HtmlPagesWriter(**kwargs, page_size=args.html_page_size)
+    return HtmlWriter(**kwargs)
+
+
+def write_all(treatments: Treatments, args: argparse.Namespace) -> None:
+    if args.html_file:
+        writer = get_html_writer(args)
         writer.write(treatments, args)
 
     if args.csv_file:
@@ -32,7 +123,186 @@ def main():
     if args.json_dir:
         write_json(treatments, args.json_dir)
 
-    log.finished()
+    if args.sqlite_file:
+        write_sqlite(treatments, args.sqlite_file)
+
+    if args.ndjson_file:
+        ndjson_writer.write_ndjson(
+            treatments, args.ndjson_file, text_hash=args.ndjson_text_hash
+        )
+
+
+def write_streaming(
+    treatments: Treatments, args: argparse.Namespace, cache: ParseCache | None = None
+) -> None:
+    """Hand each treatment to every writer as soon as it is parsed, then drop it."""
+    writers = get_writers(args)
+
+    parsed = treatments.stream(
+        encoding=args.encoding,
+        batch_size=args.batch_size,
+        workers=args.workers,
+        cache=cache,
+    )
+    parsed = add_to_writers(parsed, writers)
+
+    # The HTML report is rendered as it pulls the treatments through the others
+    if args.html_file:
+        get_html_writer(args).write(parsed, args)
+    else:
+        for _ in parsed:
+            pass
+
+    for writer in writers:
+        writer.finish()
+
+
+def add_to_writers(parsed: Iterator[Treatment], writers: list) -> Iterator[Treatment]:
+    for treatment in parsed:
+        for writer in writers:
+            writer.add(treatment)
+        yield treatment
+
+
+def get_writers(args: argparse.Namespace) -> list:
+    """Get the writers, other than HTML, that take treatments one at a time."""
+    writers = []
+
+    if args.csv_file:
+        writers.append(csv_writer.CsvWriter(args.csv_file))
+
+    if args.json_dir:
+        writers.append(json_writer.JsonWriter(args.json_dir))
+
+    if args.sqlite_file:
+        writers.append(SqliteWriter(args.sqlite_file))
+
+    if args.ndjson_file:
+        writers.append(
+            ndjson_writer.NdjsonWriter(
+                args.ndjson_file, text_hash=args.ndjson_text_hash
+            )
+        )
+
+    return writers
+
+
+@dataclass
+class Outputs:
+    """The writers kept open while watching for changes."""
+
+    html_writer: HtmlWriter | None = None
+    sqlite_writer: SqliteWriter | None = None
+    # The rows and lines for every treatment, so these files can be rewritten
+    csv_rows: dict = field(default_factory=dict)
+    ndjson_lines: dict = field(default_factory=dict)
+
+
+def watch(
+    treatments: Treatments, args: argparse.Namespace, cache: ParseCache | None = None
+) -> None:
+    """Keep the pipeline loaded and parse treatments as they are added or changed."""
+    if args.workers:
+        logging.warning("Watching treatments in this process instead of in workers")
+        args.workers = 0
+
+    watcher = Watcher(args.treatment_dir, args.limit, args.offset)
+    outputs = Outputs(
+        html_writer=get_html_writer(args) if args.html_file else None,
+        sqlite_writer=SqliteWriter(args.sqlite_file) if args.sqlite_file else None,
+    )
+
+    if args.json_dir:
+        args.json_dir.mkdir(parents=True, exist_ok=True)
+
+    msg = f"Watching {args.treatment_dir}, press Ctrl-C to stop"
+    logging.info(msg)
+
+    try:
+        while True:
+            changed, deleted = watcher.poll()
+
+            if changed or deleted:
+                remove_outputs(deleted, args, outputs)
+
+                treatments.treatments = [Treatment(p) for p in changed]
+                update_outputs(treatments, args, cache, outputs)
+
+                msg = f"Parsed {len(changed)} treatments, removed {len(deleted)}"
+                logging.info(msg)
+
+            time.sleep(args.watch_interval)
+
+    except KeyboardInterrupt:
+        logging.info("Stopped watching")
+
+    if outputs.sqlite_writer:
+        outputs.sqlite_writer.close()
+
+
+def remove_outputs(
+    deleted: list[Path], args: argparse.Namespace, outputs: Outputs
+) -> None:
+    for path in deleted:
+        outputs.csv_rows.pop(path.stem, None)
+        outputs.ndjson_lines.pop(path.stem, None)
+
+        if outputs.html_writer:
+            outputs.html_writer.remove(path.stem)
+
+        if outputs.sqlite_writer:
+            outputs.sqlite_writer.remove(path.stem)
+
+        if args.json_dir:
+            (args.json_dir / f"{path.stem}.json").unlink(missing_ok=True)
+
+
+def update_outputs(
+    treatments: Treatments,
+    args: argparse.Namespace,
+    cache: ParseCache | None,
+    outputs: Outputs,
+) -> None:
+    """Parse the changed treatments and rewrite the outputs that hold every one."""
+    for treatment in treatments.stream(
+        encoding=args.encoding, batch_size=args.batch_size, cache=cache
+    ):
+        update_treatment(treatment, args, outputs)
+
+    if outputs.html_writer:
+        outputs.html_writer.finish(args)
+
+    if args.csv_file:
+        csv_writer.write_rows(list(outputs.csv_rows.values()), args.csv_file)
+
+    if outputs.sqlite_writer:
+        outputs.sqlite_writer.commit()
+
+    if args.ndjson_file:
+        lines = (outputs.ndjson_lines[k] for k in sorted(outputs.ndjson_lines))
+        ndjson_writer.write_lines(lines, args.ndjson_file)
+
+
+def update_treatment(treatment, args: argparse.Namespace, outputs: Outputs) -> None:
+    stem = treatment.path.stem
+
+    if outputs.html_writer:
+        outputs.html_writer.update(treatment)
+
+    if args.csv_file:
+        outputs.csv_rows[stem] = csv_writer.format_row(treatment)
+
+    if args.json_dir:
+        json_writer.write_treatment(treatment, args.json_dir)
+
+    if outputs.sqlite_writer:
+        outputs.sqlite_writer.remove(stem)
+        outputs.sqlite_writer.add(treatment)
+
+    if args.ndjson_file:
+        outputs.ndjson_lines[stem] = ndjson_writer.to_line(
+            treatment, text_hash=args.ndjson_text_hash
+        )
 
 
 def parse_args() -> argparse.Namespace:
@@ -61,6 +331,18 @@ def parse_args() -> argparse.Namespace:
         help="""Output HTML formatted results to this file.""",
     )
 
+    arg_parser.add_argument(
+        "--html-page-size",
+        type=int,
+        metavar="INT",
+        default=0,
+        help="""Split the HTML report into pages with this many treatments each. The
+            pages go into a directory named after the --html-file, and the
+            --html-file becomes an index page where treatments can be found by
+            taxon or treatment ID. The default is to put every treatment into the
+            one file. (default: %(default)s)""",
+    )
+
     arg_parser.add_argument(
         "--csv-file",
         type=Path,
@@ -76,6 +358,33 @@ def parse_args() -> argparse.Namespace:
             directory.""",
     )
 
+    arg_parser.add_argument(
+        "--sqlite-file",
+        metavar="PATH",
+        type=Path,
+        help="""Output traits to this SQLite database, one row per trait in the traits
+            table and one row per DarwinCore field in the fields table. They are
+            indexed by treatment, taxon, trait, and field value. An existing file is
+            replaced.""",
+    )
+
+    arg_parser.add_argument(
+        "--ndjson-file",
+        metavar="PATH",
+        type=Path,
+        help="""Output traits to this file with one compact JSON object per treatment
+            on each line, instead of one JSON file per treatment. It is gzip
+            compressed if the name ends with .gz and lzma compressed if it ends
+            with .xz or .lzma.""",
+    )
+
+    arg_parser.add_argument(
+        "--ndjson-text-hash",
+        action="store_true",
+        help="""Store a SHA-256 hash of the treatment text in the NDJSON file instead of
+            the text itself.""",
+    )
+
     arg_parser.add_argument(
         "--limit",
         type=int,
@@ -89,6 +398,153 @@ def parse_args() -> argparse.Namespace:
         help="""Offset for splitting data.""",
     )
 
+    arg_parser.add_argument(
+        "--batch-size",
+        type=int,
+        metavar="INT",
+        default=0,
+        help="""Parse treatments in batches of this size with spaCy's nlp.pipe. The
+            default is to parse them one at a time. (default: %(default)s)""",
+    )
+
+    arg_parser.add_argument(
+        "--workers",
+        type=int,
+        metavar="INT",
+        default=0,
+        help="""Parse treatments with this many worker processes. Each worker builds
+            its own pipeline. The default is to parse everything in this process.
+            (default: %(default)s)""",
+    )
+
+    arg_parser.add_argument(
+        "--prefetch",
+        type=int,
+        metavar="INT",
+        default=0,
+        help="""Read up to this many treatment files ahead in background threads while
+            earlier ones are parsed. This helps most on network file systems. Use at
+            least the batch size when batching. The default is to read each file
+            just before it is parsed. (default: %(default)s)""",
+    )
+
+    arg_parser.add_argument(
+        "--dedupe",
+        action="store_true",
+        help="""Only parse treatments with the same text once and copy the traits to
+            the others. Texts that only differ in whitespace are the same. With
+            --workers each worker only skips the duplicates it sees itself, the
+            --cache-dir also catches those parsed by other workers.""",
+    )
+
+    arg_parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="""Read, parse, and write treatments one at a time instead of holding
+            every parsed treatment in memory until the writers run.""",
+    )
+
+    arg_parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="""Keep running and parse treatment files as they are added to or changed
+            in the treatment directory. The pipeline is only built once. --limit and
+            --offset pick the watched files like they pick the parsed ones. JSON
+            files and the SQLite database are updated for new and changed
+            treatments only. The CSV, NDJSON, and HTML files hold every treatment,
+            so each poll that finds a change rewrites them from the results kept in
+            memory. For a large flora, use a longer --watch-interval so changes are
+            written together. Stop with Ctrl-C.""",
+    )
+
+    arg_parser.add_argument(
+        "--watch-interval",
+        type=float,
+        metavar="SECONDS",
+        default=5.0,
+        help="""How often to look for new or changed files when watching.
+            (default: %(default)s)""",
+    )
+
+    arg_parser.add_argument(
+        "--cache-dir",
+        metavar="PATH",
+        type=Path,
+        help="""Keep parse results in this directory and reuse them for treatments
+            whose text has not changed since the last run. Any change to the rules
+            or terms invalidates the cache.""",
+    )
+
+    arg_parser.add_argument(
+        "--cache-size",
+        type=int,
+        metavar="MB",
+        default=DEFAULT_MAX_SIZE,
+        help="""Limit the parse cache to this many megabytes. The least recently used
+            results are evicted first. (default: %(default)s)""",
+    )
+
+    arg_parser.add_argument(
+        "--pipeline-cache",
+        metavar="PATH",
+        type=Path,
+        help="""Save the built pipeline in this directory and load it from there on
+            later runs. It is rebuilt when any rule module or term file changes.""",
+    )
+
+    arg_parser.add_argument(
+        "--profile-pipes",
+        metavar="PATH",
+        type=Path,
+        help="""Time every pipeline component and count the entities it adds and
+            removes. Print a report at the end of the run and save it to this JSON
+            file. Profiling runs in a single process.""",
+    )
+
+    arg_parser.add_argument(
+        "--traits",
+        nargs="+",
+        choices=flora_pipeline.TRAITS,
+        metavar="TRAIT",
+        help="""Only parse these traits and the traits they need. This builds a
+            smaller, faster pipeline. (default: all traits) Choices: %(choices)s""",
+    )
+
+    arg_parser.add_argument(
+        "--chunk-size",
+        type=int,
+        metavar="CHARS",
+        default=chunks.CHUNK_SIZE,
+        help="""Parse treatments longer than this in chunks cut at sentence ends.
+            With --workers the chunks of a long treatment are parsed in parallel.
+            (default: %(default)s)""",
+    )
+
+    arg_parser.add_argument(
+        "--model-free",
+        action="store_true",
+        help="""Use a pipeline that does not load en_core_web_md and tags parts of
+            speech with rules instead. It starts much faster and parses more
+            treatments per second but it is a little less accurate. See
+            compare-pipelines.""",
+    )
+
+    arg_parser.add_argument(
+        "--gate-pipes",
+        action="store_true",
+        help="""Parse each sentence on its own and skip pattern and linker
+            components for sentences that do not have the terms they need. Traits
+            that span two sentences are not found. Print how often each component
+            was skipped when not using workers.""",
+    )
+
+    arg_parser.add_argument(
+        "--term-report",
+        action="store_true",
+        help="""Print how much memory every term file and lookup table uses. Tables
+            loaded only by worker processes are not included.""",
+    )
+
     arg_parser.add_argument(
         "--spotlight",
         metavar="TRAIT",
@@ -0,0 +1,74 @@
+"""
+Parse very long treatments in chunks instead of as one huge spaCy doc.
+
+Treatment text is compressed to single spaces when it is read, so paragraph breaks
+are gone by the time it is parsed. Chunks are cut at sentence ends instead and
+only fall back to a space when a "sentence" is longer than a whole chunk. The
+traits from every chunk are shifted by the chunk's offset so their start and end
+point into the full treatment text again.
+"""
+
+import regex as re
+
+CHUNK_SIZE = 100_000  # Characters, well below spaCy's max_length
+
+# A period after a lowercase word followed by a capitalized word. Initials and
+# abbreviations like "A. Gray" or "var. maguirei" do not end a sentence.
+SENTENCE_END = re.compile(r"(?<=[a-z]{2}[.;!?])\s+(?=[A-Z])")
+
+
+def split(text: str, size: int = CHUNK_SIZE) -> list[tuple[int, str]]:
+    """Cut the text into (offset, chunk) pairs of at most size characters."""
+    chunks = []
+    start = 0
+    while len(text) - start > size:
+        end = cut(text, start, start + size)
+        chunks.append((start, text[start:end]))
+        start = end
+        while start < len(text) and text[start].isspace():
+            start += 1
+    chunks.append((start, text[start:]))
+    return chunks
+
+
+def sentences(text: str) -> list[tuple[int, str]]:
+    """Cut the text into (offset, sentence) pairs at every sentence end."""
+    pieces = []
+    start = 0
+    for match in SENTENCE_END.finditer(text):
+        pieces.append((start, text[start : match.start()]))
+        start = match.end()
+    pieces.append((start, text[start:]))
+    return pieces
+
+
+def cut(text: str, start: int, limit: int) -> int:
+    """Find the last sentence end before the limit, or the last space."""
+    end = None
+    for match in SENTENCE_END.finditer(text, start, limit):
+        end = match.start()
+
+    if end is None:
+        end = text.rfind(" ", start, limit)
+
+    return end if end > start else limit
+
+
+def parse(nlp, texts: list[str], batch_size=None, size: int = CHUNK_SIZE) -> list:
+    """Parse the texts and return the traits for each one."""
+    jobs = [(i, o, c) for i, t in enumerate(texts) for o, c in split(t, size)]
+    docs = nlp.pipe([c for *_, c in jobs], batch_size=batch_size)
+
+    traits = [[] for _ in texts]
+    for (i, offset, _), doc in zip(jobs, docs, strict=True):
+        traits[i] += shift([e._.trait for e in doc.ents], offset)
+    return traits
+
+
+def shift(traits: list, offset: int) -> list:
+    """Move the traits from a chunk back to where they are in the full text."""
+    if offset:
+        for trait in traits:
+            trait.start += offset
+            trait.end += offset
+    return traits
@@ -0,0 +1,68 @@
+"""
+Parse treatments with the same text only once in a run.
+
+The same species text is often scraped under several families. Treatment text is
+cleaned and compressed when it is read, so texts that only differ in whitespace are
+identical by then. This keeps the traits of texts parsed so far, keyed by a hash of
+the text, and hands them to later treatments with the same text. It has the same
+get and put methods as the parse cache, which it sits in front of.
+
+Only the most recently used traits are kept, so memory stays bounded when streaming
+or watching a large flora. Duplicates that are far apart may be parsed again, unless
+the parse cache still has them.
+"""
+
+import hashlib
+import pickle
+from collections import OrderedDict
+
+DEFAULT_MAX_SIZE = 64  # MB
+
+
+class Dedupe:
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE):
+        # Pickled to keep them compact, the most recently used last
+        self.traits: OrderedDict[bytes, bytes] = OrderedDict()
+        self.max_bytes = max_size * 1024 * 1024
+        self.total = 0
+        self.cache = None
+        self.skipped = 0
+
+    def over(self, cache=None):
+        """Check the parse cache for texts that were not seen in this run."""
+        self.cache = cache
+        return self
+
+    @staticmethod
+    def key(text: str) -> bytes:
+        return hashlib.blake2b(text.encode(), digest_size=16).digest()
+
+    def get(self, text: str) -> list | None:
+        key = self.key(text)
+
+        if (blob := self.traits.get(key)) is not None:
+            self.traits.move_to_end(key)
+            self.skipped += 1
+            return pickle.loads(blob)  # noqa: S301
+
+        traits = self.cache.get(text) if self.cache else None
+        if traits is not None:
+            self.keep(key, traits)
+        return traits
+
+    def put(self, text: str, traits: list) -> None:
+        self.keep(self.key(text), traits)
+        if self.cache:
+            self.cache.put(text, traits)
+
+    def keep(self, key: bytes, traits: list) -> None:
+        if (old := self.traits.pop(key, None)) is not None:
+            self.total -= len(old)
+
+        blob = pickle.dumps(traits, protocol=pickle.HIGHEST_PROTOCOL)
+        self.traits[key] = blob
+        self.total += len(blob)
+
+        while self.total > self.max_bytes and self.traits:
+            _, old = self.traits.popitem(last=False)
+            self.total -= len(old)
@@ -0,0 +1,49 @@
+"""Fingerprint everything that can change what the pipeline extracts."""
+
+import hashlib
+import os
+from functools import cache
+from importlib import metadata
+from pathlib import Path
+
+from traiter.pylib import rules as t_rules
+
+from flora.pylib import pipelines, rules
+
+PACKAGES = ["traiter", "spacy", "en_core_web_md"]
+SUFFIXES = {".py", ".csv", ".zip"}
+
+
+def source_files() -> list[tuple[str, Path]]:
+    """Rule modules, pipeline builders, and term files for flora & traiter."""
+    dirs = {
+        "flora/rules": Path(rules.__file__).parent,
+        "flora/pipelines": Path(pipelines.__file__).parent,
+        "traiter/rules": Path(t_rules.__file__).parent,
+    }
+    files = []
+    for prefix, dir_ in dirs.items():
+        paths = sorted(p for p in dir_.rglob("*") if p.suffix in SUFFIXES)
+        files += [(f"{prefix}/{p.relative_to(dir_).as_posix()}", p) for p in paths]
+    return files
+
+
+@cache
+def pipeline_fingerprint() -> str:
+    digest = hashlib.sha256()
+
+    for package in PACKAGES:
+        try:
+            version = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            version = ""
+        digest.update(f"{package}={version}\n".encode())
+
+    # Mock taxon terms swap out the term files used by the Taxon rules
+    digest.update(f"MOCK_TRAITER={os.getenv('MOCK_TRAITER', '')}\n".encode())
+
+    for name, path in source_files():
+        digest.update(f"{name}\n".encode())
+        digest.update(path.read_bytes())
+
+    return digest.hexdigest()
@@ -0,0 +1,136 @@
+"""
+A read only, sorted, memory-mapped string to string lookup table.
+
+The big taxon lookup tables take hundreds of megabytes as Python dicts, and every
+worker process would get its own copy. A lexicon file is mapped into memory instead,
+so all processes share the same pages from the OS page cache, and lookups are a
+binary search over the sorted keys. This only covers the lookup tables. The taxon
+term matcher is built from the same term files and every process still holds its
+own patterns.
+
+Lexicon files are not in the repository. They are built the first time a table is
+used, or by add-taxa.
+
+File layout, all integers are little-endian unsigned 64-bit:
+    magic     8 bytes
+    digest    32 byte SHA-256 of the term file the lexicon was built from
+    count     number of records
+    offsets   count + 1 record offsets from the start of the records
+    records   key UTF-8 bytes, a NUL byte, value UTF-8 bytes; sorted by key bytes
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+from collections.abc import Iterable
+from pathlib import Path
+
+MAGIC = b"FLORALEX"
+DIGEST = 32
+INT = struct.Struct("<Q")
+HEADER = len(MAGIC) + DIGEST + INT.size
+SEP = b"\0"
+
+
+class Lexicon:
+    def __init__(self, path: Path):
+        self.path = path
+        self.mm = None
+        self.count = 0
+        self.records = 0
+
+    def open(self) -> None:
+        with self.path.open("rb") as f:
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self.mm[: len(MAGIC)] != MAGIC:
+            msg = f"{self.path} is not a lexicon file"
+            raise ValueError(msg)
+
+        self.count = INT.unpack_from(self.mm, HEADER - INT.size)[0]
+        self.records = HEADER + (self.count + 1) * INT.size
+
+    def __getstate__(self):
+        # Every process maps the file for itself
+        return {"path": self.path}
+
+    def __setstate__(self, state):
+        self.__init__(state["path"])
+
+    def __len__(self) -> int:
+        if self.mm is None:
+            self.open()
+        return self.count
+
+    def __contains__(self, key: str) -> bool:
+        return self.find(key) is not None
+
+    def __getitem__(self, key: str) -> str:
+        if (value := self.find(key)) is None:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: str, default: str | None = None) -> str | None:
+        value = self.find(key)
+        return default if value is None else value
+
+    def record(self, i: int) -> tuple[bytes, bytes]:
+        start, end = (
+            INT.unpack_from(self.mm, HEADER + j * INT.size)[0] for j in (i, i + 1)
+        )
+        key, _, value = self.mm[self.records + start : self.records + end].partition(
+            SEP
+        )
+        return key, value
+
+    def find(self, key: str) -> str | None:
+        if self.mm is None:
+            self.open()
+
+        target = key.encode()
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            found, value = self.record(mid)
+            if found == target:
+                return value.decode()
+            if found < target:
+                lo = mid + 1
+            else:
+                hi = mid
+
+        return None
+
+    @staticmethod
+    def write(path: Path, items: Iterable[tuple[str, str]], source: Path) -> None:
+        """Write the pairs built from the source term file. Later duplicates win."""
+        table = {k.encode(): v.encode() for k, v in items}
+        records = [k + SEP + table[k] for k in sorted(table)]
+
+        offsets = [0]
+        for record in records:
+            offsets.append(offsets[-1] + len(record))
+
+        # Worker processes may build the same lexicon at the same time
+        temp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with temp.open("wb") as f:
+            f.write(MAGIC)
+            f.write(digest(source))
+            f.write(INT.pack(len(records)))
+            f.writelines(INT.pack(o) for o in offsets)
+            f.writelines(records)
+        temp.replace(path)
+
+
+def digest(source: Path) -> bytes:
+    return hashlib.sha256(source.read_bytes()).digest()
+
+
+def is_current(lexicon: Path, source: Path) -> bool:
+    """Is the lexicon file there and built from the current source file."""
+    if not lexicon.exists() or not source.exists():
+        return False
+    with lexicon.open("rb") as f:
+        header = f.read(len(MAGIC) + DIGEST)
+    return header == MAGIC + digest(source)
@@ -0,0 +1,158 @@
+"""
+Cache parse results on disk so unchanged treatments are not parsed again.
+
+Entries are keyed by a hash of the cleaned treatment text, the pipeline
+fingerprint, and the pipeline variant, so editing any rule module or term file
+invalidates them, and model-free pipelines or pipelines built for a selection of
+traits do not share results with the full one. The cache is
+an SQLite file with a size limit, and the least recently used entries are evicted
+first.
+
+Writing the use time of every hit right away would make each lookup a write that
+waits for the database lock, so workers reading the cache would queue up behind each
+other. The use times are collected and written together instead, every so many hits
+or seconds, before evicting, and when the cache is closed.
+"""
+
+import hashlib
+import pickle
+import sqlite3
+import time
+from functools import cached_property
+from pathlib import Path
+
+from flora.pylib.fingerprint import pipeline_fingerprint
+
+DEFAULT_MAX_SIZE = 1024  # MB
+EVICT_TO = 0.9  # Fraction of the max size left after an eviction
+FLUSH_EVERY = 256  # Hits whose use times are written together
+FLUSH_SECS = 10  # Or the hits from this many seconds
+
+
+class ParseCache:
+    def __init__(
+        self, cache_dir: Path, max_size: int = DEFAULT_MAX_SIZE, *, variant: str = ""
+    ):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_size * 1024 * 1024
+        self.fingerprint = pipeline_fingerprint()
+        self.variant = variant
+        self.total = None
+        self.hits = 0
+        self.misses = 0
+        self.used: dict[str, float] = {}  # Use times not written yet
+        self.flushed = time.monotonic()
+
+    def __getstate__(self):
+        # Worker processes open their own connection
+        state = self.__dict__.copy()
+        state.pop("cxn", None)
+        state["total"] = None
+        state["used"] = {}
+        return state
+
+    @cached_property
+    def cxn(self) -> sqlite3.Connection:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self.cache_dir / "parse_cache.sqlite"
+
+        cxn = sqlite3.connect(path, timeout=60, isolation_level=None)
+        cxn.execute("pragma journal_mode = wal")
+        cxn.execute(
+            """create table if not exists parses (
+                key         text primary key,
+                fingerprint text,
+                traits      blob,
+                size        integer,
+                used        real)""",
+        )
+        cxn.execute("create index if not exists parses_used on parses (used)")
+
+        # Results from an older version of the pipeline can never be used again
+        cxn.execute("delete from parses where fingerprint <> ?", (self.fingerprint,))
+        return cxn
+
+    def key(self, text: str) -> str:
+        digest = hashlib.sha256(f"{self.fingerprint} {self.variant}\n".encode())
+        digest.update(text.encode())
+        return digest.hexdigest()
+
+    def get(self, text: str) -> list | None:
+        key = self.key(text)
+        row = self.cxn.execute(
+            "select traits from parses where key = ?", (key,)
+        ).fetchone()
+
+        if row is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.used[key] = time.time()
+        if (
+            len(self.used) >= FLUSH_EVERY
+            or time.monotonic() - self.flushed > FLUSH_SECS
+        ):
+            self.flush()
+        return pickle.loads(row[0])  # noqa: S301
+
+    def flush(self) -> None:
+        """Write the use times of the latest hits in one transaction."""
+        if self.used:
+            self.cxn.execute("begin")
+            self.cxn.executemany(
+                "update parses set used = ? where key = ?",
+                [(used, key) for key, used in self.used.items()],
+            )
+            self.cxn.execute("commit")
+            self.used = {}
+        self.flushed = time.monotonic()
+
+    def close(self) -> None:
+        self.flush()
+        self.cxn.close()
+
+    def put(self, text: str, traits: list) -> None:
+        key = self.key(text)
+        blob = pickle.dumps(traits, protocol=pickle.HIGHEST_PROTOCOL)
+        self.used.pop(key, None)  # Its use time is written below
+
+        # An entry for the same text is replaced, so its size no longer counts
+        row = self.cxn.execute(
+            "select size from parses where key = ?", (key,)
+        ).fetchone()
+        replaced = row[0] if row else 0
+
+        self.cxn.execute(
+            "insert or replace into parses values (?, ?, ?, ?, ?)",
+            (key, self.fingerprint, blob, len(blob), time.time()),
+        )
+
+        if self.total is None:
+            self.total = self.size()
+        else:
+            self.total += len(blob) - replaced
+
+        if self.total > self.max_bytes:
+            self.evict()
+
+    def size(self) -> int:
+        row = self.cxn.execute("select coalesce(sum(size), 0) from parses").fetchone()
+        return row[0]
+
+    def evict(self) -> None:
+        """Delete the least recently used entries until the cache is small enough."""
+        self.flush()
+
+        target = self.max_bytes * EVICT_TO
+        total = self.size()
+
+        keys = []
+        for key, size in self.cxn.execute("select key, size from parses order by used"):
+            if total <= target:
+                break
+            keys.append((key,))
+            total -= size
+
+        self.cxn.executemany("delete from parses where key = ?", keys)
+        self.total = total
@@ -0,0 +1,91 @@
+"""
+Skip pipeline components for sentences that do not have the entities they match on.
+
+Rules declare gates as a class variable that maps a component name to groups of
+entity labels. The component only runs on a sentence when every group has at least
+one of its labels in the sentence's entities. For instance, a linker needs both a
+parent and a child label. Components without a gate always run.
+
+Almost every treatment has sizes, counts, and links somewhere, so gating whole docs
+hardly skips anything. Each text is cut at its sentence ends instead and every
+sentence is parsed as its own doc. The sentence docs are joined back into one doc
+for each text, with the traits moved to where they are in the full text. Traits
+that would span two sentences are not found, just like at chunk boundaries.
+"""
+
+from collections import Counter
+from itertools import islice
+
+from spacy.tokens import Doc
+
+from flora.pylib import chunks
+
+DEFAULT_BATCH = 64
+
+
+class PipeGate:
+    """Stand in for the nlp object and skip the gated components when possible."""
+
+    def __init__(self, nlp, gates: dict[str, list[list[str]]]):
+        self.nlp = nlp
+        self.gates = {
+            name: [set(g) for g in groups]
+            for name, groups in gates.items()
+            if name in nlp.pipe_names
+        }
+        self.runs = Counter()
+        self.skips = Counter()
+
+    def __call__(self, text):
+        return next(self.pipe([text], batch_size=1))
+
+    def pipe(self, texts, batch_size=None):
+        batch_size = batch_size if batch_size else DEFAULT_BATCH
+        texts = iter(texts)
+        while batch := list(islice(texts, batch_size)):
+            yield from self.run(batch, batch_size)
+
+    def run(self, texts, batch_size):
+        pieces = [
+            (i, o, s) for i, t in enumerate(texts) for o, s in chunks.sentences(t)
+        ]
+        docs = [self.nlp.make_doc(s) for *_, s in pieces]
+
+        for name, proc in self.nlp.pipeline:
+            groups = self.gates.get(name)
+
+            if groups is None and hasattr(proc, "pipe"):
+                docs = list(proc.pipe(docs, batch_size=batch_size))
+                continue
+
+            for i, doc in enumerate(docs):
+                if groups is None or has_labels(doc, groups):
+                    docs[i] = proc(doc)
+                    self.runs[name] += 1
+                else:
+                    self.skips[name] += 1
+
+        return join(texts, pieces, docs)
+
+    def report(self) -> list[tuple[str, int, int]]:
+        return [(n, self.runs[n], self.skips[n]) for n in self.gates]
+
+    def print_report(self) -> None:
+        print(f"{'component':<32} {'runs':>8} {'skips':>8} {'skipped %':>10}")
+        for name, runs, skips in self.report():
+            total = (runs + skips) or 1
+            print(f"{name:<32} {runs:>8} {skips:>8} {100.0 * skips / total:>10.1f}")
+
+
+def join(texts, pieces, docs) -> list[Doc]:
+    """Join the sentence docs back into one doc for each text."""
+    sentence_docs = [[] for _ in texts]
+    for (i, offset, _), doc in zip(pieces, docs, strict=True):
+        chunks.shift([e._.trait for e in doc.ents], offset)
+        sentence_docs[i].append(doc)
+    return [Doc.from_docs(d) for d in sentence_docs]
+
+
+def has_labels(doc, groups: list[set[str]]) -> bool:
+    labels = {e.label_ for e in doc.ents}
+    return all(labels & g for g in groups)
@@ -0,0 +1,88 @@
+"""Time every component in a spaCy pipeline and count the entities it changes."""
+
+import json
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from time import perf_counter
+
+TOKENIZER = "tokenizer"
+
+
+@dataclass
+class PipeStats:
+    name: str
+    calls: int = 0
+    total: float = 0.0  # Seconds
+    longest: float = 0.0  # Seconds for the slowest doc
+    added: int = 0  # Entities
+    removed: int = 0  # Entities
+
+    def add(self, elapsed: float, before: set, after: set) -> None:
+        self.calls += 1
+        self.total += elapsed
+        self.longest = max(self.longest, elapsed)
+        self.added += len(after - before)
+        self.removed += len(before - after)
+
+    @property
+    def per_doc(self) -> float:
+        return self.total / self.calls if self.calls else 0.0
+
+
+class PipeProfiler:
+    """
+    Stand in for the nlp object and run its components one at a time.
+
+    This is slower than the real pipeline because it compares the entities before
+    and after every component, but that bookkeeping is not part of the timings.
+    """
+
+    def __init__(self, nlp):
+        self.nlp = nlp
+        self.stats = {TOKENIZER: PipeStats(TOKENIZER)}
+        self.stats |= {name: PipeStats(name) for name in nlp.pipe_names}
+
+    def __call__(self, text):
+        start = perf_counter()
+        doc = self.nlp.make_doc(text)
+        self.stats[TOKENIZER].add(perf_counter() - start, set(), set())
+
+        for name, proc in self.nlp.pipeline:
+            before = entities(doc)
+            start = perf_counter()
+            doc = proc(doc)
+            elapsed = perf_counter() - start
+            self.stats[name].add(elapsed, before, entities(doc))
+
+        return doc
+
+    def pipe(self, texts, batch_size=None):  # noqa: ARG002
+        for text in texts:
+            yield self(text)
+
+    def report(self) -> list[PipeStats]:
+        return sorted(self.stats.values(), key=lambda s: s.total, reverse=True)
+
+    def print_report(self) -> None:
+        stats = self.report()
+        grand = sum(s.total for s in stats) or 1.0
+
+        print(
+            f"{'component':<32} {'calls':>8} {'total s':>10} {'%':>6} "
+            f"{'ms/doc':>9} {'max ms':>9} {'added':>8} {'removed':>8}"
+        )
+        for s in stats:
+            print(
+                f"{s.name:<32} {s.calls:>8} {s.total:>10.3f} "
+                f"{100.0 * s.total / grand:>6.1f} {1000.0 * s.per_doc:>9.3f} "
+                f"{1000.0 * s.longest:>9.3f} {s.added:>8} {s.removed:>8}"
+            )
+
+    def write_report(self, json_file: Path) -> None:
+        output = [asdict(s) | {"per_doc": s.per_doc} for s in self.report()]
+        with json_file.open("w") as f:
+            json.dump(output, f, indent=4)
+
+
+def entities(doc) -> set[tuple[int, int, str]]:
+    return {(e.start, e.end, e.label_) for e in doc.ents}
@@ -1,7 +1,21 @@
+import hashlib
+import logging
+import re
+import shutil
+from functools import partial
+from pathlib import Path
+
 import spacy
-from traiter.pylib.pipes import extensions, sentence, tokenizer
+from spacy.lang.en import English
+from traiter.pylib.pipes import add, extensions, sentence, tokenizer
 
-from flora.pylib.rules import delete_missing, delete_too_far, post_process
+from flora.pylib.fingerprint import pipeline_fingerprint
+from flora.pylib.rules import (
+    delete_missing,
+    delete_too_far,
+    post_process,
+    rule_tagger,
+)
 from flora.pylib.rules.color import Color
 from flora.pylib.rules.count import Count
 from flora.pylib.rules.duration import Duration
@@ -36,56 +50,239 @@ from flora.pylib.rules.woodiness import Woodiness
 
 # from traiter.pylib.pipes import debug
 
+PROBES = [
+    "Leaf (12-)23-34 × 45-56 cm",
+    "Petals 5, white to pale pink, glabrous; sepals 3-5 mm.",
+    "Astragalus cobrensis A. Gray var. maguirei Kearney",
+]
+
+UNUSABLE = "unusable"
+
+# Only the entity recognizer is left out, since nothing reads the model's entities
+# (see audit-tokens). Traiter's pipes read lemmas, dependencies, and sentence starts,
+# and the flora rules read POS tags, so the rest of the model stays.
+MODEL_EXCLUDE = ["ner"]
+
+# The model-free pipeline saves its own copy under this subdirectory of the cache
+MODEL_FREE = "model_free"
+
+
+def trait_name(rule) -> str:
+    """Convert a rule class name like LeafDuration to its trait name leaf_duration."""
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", rule.__name__).lower()
+
+
+# These rules have disjoint term vocabularies and their patterns only span their
+# own terms, so a single phrase matcher pass can find the terms for all of them.
+# Sex is not here because "imperfect" is both a sex term and the start of
+# venation terms like "imperfect basal".
+SHARED_TERMS = {
+    Duration: Duration.duration_csv,
+    FlowerLocation: FlowerLocation.flower_location_csv,
+    FlowerMorphology: FlowerMorphology.flower_morphology_csv,
+    LeafDuration: LeafDuration.leaf_duration_csv,
+    LeafFolding: LeafFolding.leaf_folding_csv,
+    Morphology: Morphology.morphology_csv,
+    Odor: Odor.odor_csv,
+    PlantDuration: PlantDuration.plant_duration_csv,
+    Reproduction: Reproduction.reproduction_csv,
+    Venation: Venation.venation_csv,
+    Woodiness: Woodiness.woodiness_csv,
+}
+
+
+def shared_terms_pipe(nlp, rules=None):
+    """Match the terms for all simple rules at once and then run their patterns."""
+    rules = rules if rules else list(SHARED_TERMS)
+    add.term_pipe(nlp, name="shared_terms", path=[SHARED_TERMS[r] for r in rules])
+    for rule in rules:
+        rule.patterns_pipe(nlp)
+    add.cleanup_pipe(nlp, name="shared_cleanup")
+
+
+SHARED = "shared_terms"
+
+# Rules in pipeline order
+STEPS = [
+    ("part", Part.pipe),
+    ("subpart", Subpart.pipe),
+    ("color", Color.pipe),
+    ("sex", Sex.pipe),
+    (SHARED, shared_terms_pipe),
+    ("name", partial(Name.pipe, overwrite=["subpart", "color", "admin_unit"])),
+    ("range", Range.pipe),
+    ("size", Size.pipe),
+    ("count", Count.pipe),
+    ("habit", Habit.pipe),
+    ("margin", Margin.pipe),
+    ("shape", Shape.pipe),
+    ("surface", Surface.pipe),
+    ("taxon", partial(Taxon.pipe, extend=2, overwrite=["habitat", "color"])),
+    ("part_location", PartLocation.pipe),
+    ("taxon_like", TaxonLike.pipe),
+]
+
+TRAITS = [
+    *(t for t, _ in STEPS if t != SHARED),
+    *(trait_name(r) for r in SHARED_TERMS),
+]
+
+# Linkers run when their parent trait is parsed
+LINKERS = {
+    "part": PartLinker,
+    "subpart": SubpartLinker,
+    "sex": SexLinker,
+    "part_location": PartLocationLinker,
+    "taxon_like": TaxonLikeLinker,
+}
+
+# The traits whose entities a trait's patterns use. The traits it can be linked to
+# come from the linkers.
+NEEDS = {
+    "subpart": ["part"],
+    "name": ["color"],
+    "size": ["range"],
+    "count": ["range"],
+    "taxon": ["name"],
+    "part_location": ["part", "subpart"],
+    "taxon_like": ["taxon"],
+}
 
-def build():
+GATED = [
+    Part,
+    Subpart,
+    Sex,
+    *SHARED_TERMS,
+    Size,
+    Habit,
+    Margin,
+    Surface,
+    PartLocation,
+    TaxonLike,
+    PartLinker,
+    SubpartLinker,
+    SexLinker,
+    PartLocationLinker,
+    TaxonLikeLinker,
+]
+
+
+def gates() -> dict[str, list[list[str]]]:
+    """Get the entity labels that each gated component needs to run."""
+    return {name: groups for rule in GATED for name, groups in rule.gates.items()}
+
+
+def build(
+    cache_dir: Path | None = None,
+    traits: list[str] | None = None,
+    *,
+    model: bool = True,
+):
     extensions.add_extensions()
 
-    nlp = spacy.load("en_core_web_md", exclude=["ner"])
+    if cache_dir and not model:
+        cache_dir = cache_dir / MODEL_FREE
 
-    tokenizer.setup_tokenizer(nlp)
+    if cache_dir and traits:
+        # Every selection of traits gets its own saved pipeline
+        key = " ".join(sorted(required(traits)))
+        cache_dir = cache_dir / hashlib.sha256(key.encode()).hexdigest()[:16]
 
-    config = {"base_model": "en_core_web_md"}
-    nlp.add_pipe(sentence.SENTENCES, config=config, before="parser")
+    if cache_dir and (nlp := load_cached(cache_dir)):
+        return nlp
+
+    nlp = assemble(traits, model=model)
+
+    if cache_dir:
+        save_cached(nlp, cache_dir)
+
+    return nlp
+
+
+def load_cached(cache_dir: Path):
+    """Load the pipeline saved by an earlier build if no rule or term changed."""
+    fingerprint = cache_dir / "fingerprint.txt"
+    if not fingerprint.exists():
+        return None
+
+    if fingerprint.read_text().strip() != pipeline_fingerprint():
+        return None
+
+    model_dir = cache_dir / "pipeline"
+    if not model_dir.exists():
+        return None
 
-    Part.pipe(nlp)
-    Subpart.pipe(nlp)
+    try:
+        return spacy.load(model_dir)
+    except (OSError, ValueError) as err:
+        msg = f"Could not load the pipeline from {cache_dir}: {err}"
+        logging.warning(msg)
+        return None
 
-    Color.pipe(nlp)
 
-    Duration.pipe(nlp)
-    FlowerLocation.pipe(nlp)
-    FlowerMorphology.pipe(nlp)
-    LeafDuration.pipe(nlp)
-    LeafFolding.pipe(nlp)
-    Morphology.pipe(nlp)
-    Odor.pipe(nlp)
-    PlantDuration.pipe(nlp)
-    Reproduction.pipe(nlp)
-    Sex.pipe(nlp)
-    Venation.pipe(nlp)
-    Woodiness.pipe(nlp)
+def save_cached(nlp, cache_dir: Path) -> None:
+    """Save the pipeline and only keep it if it parses the same as the built one."""
+    fingerprint = cache_dir / "fingerprint.txt"
+    model_dir = cache_dir / "pipeline"
+    temp_dir = cache_dir / "pipeline.tmp"
 
-    Name.pipe(nlp, overwrite=["subpart", "color", "admin_unit"])
+    # Do not keep trying to save a pipeline that cannot be round-tripped
+    if fingerprint.exists() and fingerprint.read_text().split() == [
+        pipeline_fingerprint(),
+        UNUSABLE,
+    ]:
+        return
 
-    Range.pipe(nlp)
-    Size.pipe(nlp)
-    Count.pipe(nlp)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    shutil.rmtree(temp_dir, ignore_errors=True)
 
-    Habit.pipe(nlp)
-    Margin.pipe(nlp)
-    Shape.pipe(nlp)
-    Surface.pipe(nlp)
+    try:
+        nlp.to_disk(temp_dir)
+        loaded = spacy.load(temp_dir)
+        usable = all(ents(nlp(p)) == ents(loaded(p)) for p in PROBES)
+    except (OSError, TypeError, ValueError) as err:
+        msg = f"Could not save the pipeline to {cache_dir}: {err}"
+        logging.warning(msg)
+        usable = False
 
-    Taxon.pipe(nlp, extend=2, overwrite=["habitat", "color"])
+    shutil.rmtree(model_dir, ignore_errors=True)
 
-    PartLocation.pipe(nlp)
-    TaxonLike.pipe(nlp)
+    if not usable:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        fingerprint.write_text(f"{pipeline_fingerprint()} {UNUSABLE}\n")
+        return
 
-    PartLinker.pipe(nlp)
-    SubpartLinker.pipe(nlp)
-    SexLinker.pipe(nlp)
-    PartLocationLinker.pipe(nlp)
-    TaxonLikeLinker.pipe(nlp)
+    try:
+        temp_dir.rename(model_dir)
+    except OSError:  # Another process saved it first
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        return
+
+    fingerprint.write_text(f"{pipeline_fingerprint()}\n")
+
+
+def ents(doc) -> list[tuple]:
+    return [(e.start_char, e.end_char, e.label_, e._.trait) for e in doc.ents]
+
+
+def assemble(traits: list[str] | None = None, *, model: bool = True):
+    selected = required(traits) if traits else set(TRAITS)
+
+    nlp = load_model() if model else load_blank()
+
+    for trait, add_pipes in STEPS:
+        if trait == SHARED:
+            if rules := [r for r in SHARED_TERMS if trait_name(r) in selected]:
+                add_pipes(nlp, rules)
+        elif trait in selected:
+            add_pipes(nlp)
+        elif trait == "count" and "range" in selected:
+            # Count also deletes the leftover ranges
+            add.cleanup_pipe(nlp, name="range_cleanup", delete=Count.delete)
+
+    for parent, linker in LINKERS.items():
+        if parent in selected:
+            linker.pipe(nlp)
 
     delete_missing.pipe(nlp)
     delete_too_far.pipe(nlp)
@@ -93,3 +290,58 @@ def build():
     post_process.pipe(nlp)
 
     return nlp
+
+
+def load_model():
+    nlp = spacy.load("en_core_web_md", exclude=MODEL_EXCLUDE)
+
+    tokenizer.setup_tokenizer(nlp)
+
+    config = {"base_model": "en_core_web_md"}
+    nlp.add_pipe(sentence.SENTENCES, config=config, before="parser")
+
+    return nlp
+
+
+def load_blank():
+    """Start from a blank pipeline and tag parts of speech with rules."""
+    nlp = English()
+
+    tokenizer.setup_tokenizer(nlp)
+
+    nlp.add_pipe(sentence.SENTENCES, config={"abbrev": tokenizer.ABBREVS})
+
+    rule_tagger.pipe(nlp)
+
+    return nlp
+
+
+def required(traits: list[str]) -> set[str]:
+    """Get the traits and all of the traits that they need to be parsed correctly."""
+    selected = set()
+    todo = list(traits)
+    while todo:
+        trait = todo.pop()
+        if trait not in TRAITS:
+            msg = f"Unknown trait: {trait}"
+            raise ValueError(msg)
+        if trait not in selected:
+            selected.add(trait)
+            todo += NEEDS.get(trait, [])
+            todo += linked_to(trait)
+    return selected
+
+
+def variant(traits: list[str] | None = None, *, model: bool = True) -> str:
+    """Name the pipeline built for the options so its results are not mixed up."""
+    name = " ".join(sorted(required(traits))) if traits else "all"
+    return name if model else f"{MODEL_FREE} {name}"
+
+
+def linked_to(trait: str) -> list[str]:
+    """Get the parent traits that a linker can link the trait to."""
+    return [
+        parent
+        for parent, linker in LINKERS.items()
+        if trait in linker.children or trait in getattr(linker, "child_once", [])
+    ]
@@ -0,0 +1,40 @@
+"""
+Read treatment files in background threads while earlier ones are being parsed.
+
+Reading, cleaning, and compressing a file mostly waits on the file system, which is
+slow on network storage. Threads read up to depth treatments ahead of the parser,
+and no more, so memory stays bounded. Treatments come out in their original order.
+"""
+
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+MAX_THREADS = 8
+
+
+def read_ahead(
+    treatments: Iterable, encoding: str = "utf8", depth: int = 0
+) -> Iterator:
+    """Yield the treatments in order after their text was read."""
+    if not depth:
+        for treatment in treatments:
+            treatment.read(encoding=encoding)
+            yield treatment
+        return
+
+    with ThreadPoolExecutor(min(depth, MAX_THREADS)) as pool:
+        pending = deque()
+
+        for treatment in treatments:
+            pending.append((treatment, pool.submit(treatment.read, encoding=encoding)))
+            if len(pending) >= depth:
+                yield done(*pending.popleft())
+
+        while pending:
+            yield done(*pending.popleft())
+
+
+def done(treatment, future):
+    future.result()  # Raise any error from reading the file
+    return treatment
@@ -5,13 +5,15 @@ from typing import ClassVar
 from spacy import registry
 from spacy.language import Language
 from traiter.pylib import const as t_const
-from traiter.pylib import term_util
 from traiter.pylib import util as t_util
 from traiter.pylib.darwin_core import DarwinCore
 from traiter.pylib.pattern_compiler import Compiler
 from traiter.pylib.pipes import add, reject_match
 from traiter.pylib.rules import terms as t_terms
 
+from flora.pylib import term_registry
+
+from .lazy_terms import LazyTerms
 from .linkable import Linkable
 
 
@@ -34,14 +36,13 @@ class Count(Linkable):
     and_: ClassVar[list[str]] = ["&", "and", "et"]
     cross: ClassVar[list[str]] = t_const.CROSS + t_const.COMMA
     every: ClassVar[list[str]] = """ every per each or more """.split()
-    not_count_prefix: ClassVar[
-        list[str]
-    ] = """ chapter figure fig nos no # sec sec. """.split()
-    not_count_symbol: ClassVar[list[str]] = t_const.CROSS + t_const.SLASH
-    replace: ClassVar[dict[str, str]] = term_util.look_up_table(all_csvs, "replace")
-    suffix_term: ClassVar[dict[str, str]] = term_util.look_up_table(
-        all_csvs, "suffix_term"
+    not_count_prefix: ClassVar[list[str]] = (
+        """ chapter figure fig nos no # sec sec. """.split()
     )
+    not_count_symbol: ClassVar[list[str]] = t_const.CROSS + t_const.SLASH
+    delete: ClassVar[list[str]] = ["range", "per_count", "num_label"]
+    replace = LazyTerms(term_registry.look_up_table, all_csvs, "replace")
+    suffix_term = LazyTerms(term_registry.look_up_table, all_csvs, "suffix_term")
     not_count: ClassVar[list[str]] = """
         not_numeric metric_mass imperial_mass metric_dist imperial_dist imperial_length
         metric_length
@@ -91,7 +92,7 @@ class Count(Linkable):
         add.cleanup_pipe(
             nlp,
             name="count_cleanup",
-            delete=["range", "per_count", "num_label"],
+            delete=cls.delete,
         )
 
     @classmethod
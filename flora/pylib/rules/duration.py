@@ -4,13 +4,14 @@ from typing import ClassVar
 
 from spacy import Language, registry
 from traiter.pylib import const as t_const
-from traiter.pylib import term_util
 from traiter.pylib.darwin_core import DarwinCore
 from traiter.pylib.pattern_compiler import Compiler
 from traiter.pylib.pipes import add
 
+from flora.pylib import term_registry
 from flora.pylib.trait_util import clean_trait
 
+from .lazy_terms import LazyTerms
 from .linkable import Linkable
 
 
@@ -20,7 +21,8 @@ class Duration(Linkable):
     duration_csv: ClassVar[Path] = (
         Path(__file__).parent / "terms" / "duration_terms.csv"
     )
-    replace: ClassVar[dict[str, str]] = term_util.look_up_table(duration_csv, "replace")
+    replace = LazyTerms(term_registry.look_up_table, duration_csv, "replace")
+    gates: ClassVar[dict[str, list[list[str]]]] = {"duration_patterns": [["duration"]]}
     # ---------------------
 
     duration: str = None
@@ -35,13 +37,17 @@ class Duration(Linkable):
     @classmethod
     def pipe(cls, nlp: Language):
         add.term_pipe(nlp, name="duration_terms", path=cls.duration_csv)
+        cls.patterns_pipe(nlp)
+        add.cleanup_pipe(nlp, name="duration_cleanup")
+
+    @classmethod
+    def patterns_pipe(cls, nlp: Language):
         add.trait_pipe(
             nlp,
             name="duration_patterns",
             compiler=cls.duration_patterns(),
             overwrite=["duration"],
         )
-        add.cleanup_pipe(nlp, name="duration_cleanup")
 
     @classmethod
     def duration_patterns(cls):
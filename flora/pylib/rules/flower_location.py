@@ -4,13 +4,14 @@ from typing import ClassVar
 
 from spacy import Language, registry
 from traiter.pylib import const as t_const
-from traiter.pylib import term_util
 from traiter.pylib.darwin_core import DarwinCore
 from traiter.pylib.pattern_compiler import Compiler
 from traiter.pylib.pipes import add
 
+from flora.pylib import term_registry
 from flora.pylib.trait_util import clean_trait
 
+from .lazy_terms import LazyTerms
 from .linkable import Linkable
 
 
@@ -20,10 +21,14 @@ class FlowerLocation(Linkable):
     flower_location_csv: ClassVar[Path] = (
         Path(__file__).parent / "terms" / "flower_location_terms.csv"
     )
-    replace: ClassVar[dict[str, str]] = term_util.look_up_table(
+    replace = LazyTerms(
+        term_registry.look_up_table,
         flower_location_csv,
         "replace",
     )
+    gates: ClassVar[dict[str, list[list[str]]]] = {
+        "flower_location_patterns": [["flower_location"]]
+    }
     # ---------------------
 
     flower_location: str = None
@@ -38,13 +43,17 @@ class FlowerLocation(Linkable):
     @classmethod
     def pipe(cls, nlp: Language):
         add.term_pipe(nlp, name="flower_location_terms", path=cls.flower_location_csv)
+        cls.patterns_pipe(nlp)
+        add.cleanup_pipe(nlp, name="flower_location_cleanup")
+
+    @classmethod
+    def patterns_pipe(cls, nlp: Language):
         add.trait_pipe(
             nlp,
             name="flower_location_patterns",
             compiler=cls.flower_location_patterns(),
             overwrite=["flower_location"],
         )
-        add.cleanup_pipe(nlp, name="flower_location_cleanup")
 
     @classmethod
     def flower_location_patterns(cls):
@@ -4,13 +4,14 @@ from typing import ClassVar
 
 from spacy import Language, registry
 from traiter.pylib import const as t_const
-from traiter.pylib import term_util
 from traiter.pylib.darwin_core import DarwinCore
 from traiter.pylib.pattern_compiler import Compiler
 from traiter.pylib.pipes import add
 
+from flora.pylib import term_registry
 from flora.pylib.trait_util import clean_trait
 
+from .lazy_terms import LazyTerms
 from .linkable import Linkable
 
 
@@ -20,10 +21,14 @@ class FlowerMorphology(Linkable):
     flower_morphology_csv: ClassVar[Path] = (
         Path(__file__).parent / "terms" / "flower_morphology_terms.csv"
     )
-    replace: ClassVar[dict[str, str]] = term_util.look_up_table(
+    replace = LazyTerms(
+        term_registry.look_up_table,
         flower_morphology_csv,
         "replace",
     )
+    gates: ClassVar[dict[str, list[list[str]]]] = {
+        "flower_morphology_patterns": [["flower_morphology"]]
+    }
     # ---------------------
 
     flower_morphology: str = None
@@ -42,13 +47,17 @@ class FlowerMorphology(Linkable):
             name="flower_morphology_terms",
             path=cls.flower_morphology_csv,
         )
+        cls.patterns_pipe(nlp)
+        add.cleanup_pipe(nlp, name="flower_morphology_cleanup")
+
+    @classmethod
+    def patterns_pipe(cls, nlp: Language):
         add.trait_pipe(
             nlp,
             name="flower_morphology_patterns",
             compiler=cls.flower_morphology_patterns(),
             overwrite=["flower_morphology"],
         )
-        add.cleanup_pipe(nlp, name="flower_morphology_cleanup")
 
     @classmethod
     def flower_morphology_patterns(cls):
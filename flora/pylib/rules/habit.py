@@ -4,12 +4,14 @@ from typing import ClassVar
 
 from spacy import Language, registry
 from traiter.pylib import const as t_const
-from traiter.pylib import term_util
 from traiter.pylib.darwin_core import DarwinCore
 from traiter.pylib.pattern_compiler import Compiler
 from traiter.pylib.pipes import add
 from traiter.pylib.rules.base import Base
 
+from flora.pylib import term_registry
+from flora.pylib.rules.lazy_terms import LazyTerms
+
 
 @dataclass(eq=False)
 class Habit(Base):
@@ -18,7 +20,10 @@ class Habit(Base):
         Path(__file__).parent / "terms" / "habit_terms.csv",
         Path(__file__).parent / "terms" / "shape_terms.csv",
     ]
-    replace: ClassVar[dict[str, str]] = term_util.look_up_table(all_csvs, "replace")
+    replace = LazyTerms(term_registry.look_up_table, all_csvs, "replace")
+    gates: ClassVar[dict[str, list[list[str]]]] = {
+        "habit_patterns": [["habit_term", "habit_tree"]]
+    }
     # ---------------------
 
     habit: str = None
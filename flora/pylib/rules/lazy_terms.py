@@ -0,0 +1,32 @@
+from collections.abc import Callable
+from typing import Any
+
+
+class LazyTerms:
+    """
+    A class variable built from term files the first time that it is used.
+
+    Reading the term files when a rule module is imported makes every import slow,
+    even for tools that never run that rule. Use it like:
+        replace = LazyTerms(term_util.look_up_table, csv_path, "replace")
+
+    Do not annotate it with ClassVar. The dataclass decorator gets the default for
+    every annotated name from the class, and that would load the table right away.
+    """
+
+    def __init__(self, loader: Callable, *args, **kwargs):
+        self.loader = loader
+        self.args = args
+        self.kwargs = kwargs
+        self.name = ""
+        self.loaded = False
+        self.value = None
+
+    def __set_name__(self, owner, name):
+        self.name = f"{owner.__name__}.{name}"
+
+    def __get__(self, instance, owner=None) -> Any:
+        if not self.loaded:
+            self.value = self.loader(*self.args, **self.kwargs)
+            self.loaded = True
+        return self.value
@@ -4,13 +4,14 @@ from typing import ClassVar
 
 from spacy import Language, registry
 from traiter.pylib import const as t_const
-from traiter.pylib import term_util
 from traiter.pylib.darwin_core import DarwinCore
 from traiter.pylib.pattern_compiler import Compiler
 from traiter.pylib.pipes import add
 
+from flora.pylib import term_registry
 from flora.pylib.trait_util import clean_trait
 
+from .lazy_terms import LazyTerms
 from .linkable import Linkable
 
 
@@ -20,10 +21,14 @@ class LeafDuration(Linkable):
     leaf_duration_csv: ClassVar[Path] = (
         Path(__file__).parent / "terms" / "leaf_duration_terms.csv"
     )
-    replace: ClassVar[dict[str, str]] = term_util.look_up_table(
+    replace = LazyTerms(
+        term_registry.look_up_table,
         leaf_duration_csv,
         "replace",
     )
+    gates: ClassVar[dict[str, list[list[str]]]] = {
+        "leaf_duration_patterns": [["leaf_duration"]]
+    }
     # ---------------------
 
     leaf_duration: str = None
@@ -38,13 +43,17 @@ class LeafDuration(Linkable):
     @classmethod
     def pipe(cls, nlp: Language):
         add.term_pipe(nlp, name="leaf_duration_terms", path=cls.leaf_duration_csv)
+        cls.patterns_pipe(nlp)
+        add.cleanup_pipe(nlp, name="leaf_duration_cleanup")
+
+    @classmethod
+    def patterns_pipe(cls, nlp: Language):
         add.trait_pipe(
             nlp,
             name="leaf_duration_patterns",
             compiler=cls.leaf_duration_patterns(),
             overwrite=["leaf_duration"],
         )
-        add.cleanup_pipe(nlp, name="leaf_duration_cleanup")
 
     @classmethod
     def leaf_duration_patterns(cls):
@@ -4,13 +4,14 @@ from typing import ClassVar
 
 from spacy import Language, registry
 from traiter.pylib import const as t_const
-from traiter.pylib import term_util
 from traiter.pylib.darwin_core import DarwinCore
 from traiter.pylib.pattern_compiler import Compiler
 from traiter.pylib.pipes import add
 
+from flora.pylib import term_registry
 from flora.pylib.trait_util import clean_trait
 
+from .lazy_terms import LazyTerms
 from .linkable import Linkable
 
 
@@ -20,9 +21,10 @@ class LeafFolding(Linkable):
     leaf_folding_csv: ClassVar[Path] = (
         Path(__file__).parent / "terms" / "leaf_folding_terms.csv"
     )
-    replace: ClassVar[dict[str, str]] = term_util.look_up_table(
-        leaf_folding_csv, "replace"
-    )
+    replace = LazyTerms(term_registry.look_up_table, leaf_folding_csv, "replace")
+    gates: ClassVar[dict[str, list[list[str]]]] = {
+        "leaf_folding_patterns": [["leaf_folding"]]
+    }
     # ---------------------
 
     leaf_folding: str = None
@@ -37,13 +39,17 @@ class LeafFolding(Linkable):
     @classmethod
     def pipe(cls, nlp: Language):
         add.term_pipe(nlp, name="leaf_folding_terms", path=cls.leaf_folding_csv)
+        cls.patterns_pipe(nlp)
+        add.cleanup_pipe(nlp, name="leaf_folding_cleanup")
+
+    @classmethod
+    def patterns_pipe(cls, nlp: Language):
         add.trait_pipe(
             nlp,
             name="leaf_folding_patterns",
             compiler=cls.leaf_folding_patterns(),
             overwrite=["leaf_folding"],
         )
-        add.cleanup_pipe(nlp, name="leaf_folding_cleanup")
 
     @classmethod
     def leaf_folding_patterns(cls):
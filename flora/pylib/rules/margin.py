@@ -4,11 +4,13 @@ from typing import ClassVar
 
 from spacy import Language, registry
 from traiter.pylib import const as t_const
-from traiter.pylib import term_util
 from traiter.pylib.darwin_core import DarwinCore
 from traiter.pylib.pattern_compiler import Compiler
 from traiter.pylib.pipes import add
 
+from flora.pylib import term_registry
+
+from .lazy_terms import LazyTerms
 from .linkable import Linkable
 
 
@@ -16,7 +18,10 @@ from .linkable import Linkable
 class Margin(Linkable):
     # Class vars ----------
     margin_csv: ClassVar[Path] = Path(__file__).parent / "terms" / "margin_terms.csv"
-    replace: ClassVar[dict[str, str]] = term_util.look_up_table(margin_csv, "replace")
+    replace = LazyTerms(term_registry.look_up_table, margin_csv, "replace")
+    gates: ClassVar[dict[str, list[list[str]]]] = {
+        "margin_patterns": [["margin_term", "margin_follower"]]
+    }
     # ---------------------
 
     margin: str = None
@@ -4,12 +4,13 @@ from typing import ClassVar
 
 from spacy import Language, registry
 from traiter.pylib import const as t_const
-from traiter.pylib import term_util
 from traiter.pylib.darwin_core import DarwinCore
 from traiter.pylib.pattern_compiler import Compiler
 from traiter.pylib.pipes import add
 from traiter.pylib.rules.base import Base
 
+from flora.pylib import term_registry
+from flora.pylib.rules.lazy_terms import LazyTerms
 from flora.pylib.trait_util import clean_trait
 
 
@@ -19,9 +20,10 @@ class Morphology(Base):
     morphology_csv: ClassVar[Path] = (
         Path(__file__).parent / "terms" / "morphology_terms.csv"
     )
-    replace: ClassVar[dict[str, str]] = term_util.look_up_table(
-        morphology_csv, "replace"
-    )
+    replace = LazyTerms(term_registry.look_up_table, morphology_csv, "replace")
+    gates: ClassVar[dict[str, list[list[str]]]] = {
+        "morphology_patterns": [["morphology"]]
+    }
     # ---------------------
 
     morphology: str = None
@@ -36,13 +38,17 @@ class Morphology(Base):
     @classmethod
     def pipe(cls, nlp: Language):
         add.term_pipe(nlp, name="morphology_terms", path=cls.morphology_csv)
+        cls.patterns_pipe(nlp)
+        add.cleanup_pipe(nlp, name="morphology_cleanup")
+
+    @classmethod
+    def patterns_pipe(cls, nlp: Language):
         add.trait_pipe(
             nlp,
             name="morphology_patterns",
             compiler=cls.morphology_patterns(),
             overwrite=["morphology"],
         )
-        add.cleanup_pipe(nlp, name="morphology_cleanup")
 
     @classmethod
     def morphology_patterns(cls):
@@ -4,13 +4,14 @@ from typing import ClassVar
 
 from spacy import Language, registry
 from traiter.pylib import const as t_const
-from traiter.pylib import term_util
 from traiter.pylib.darwin_core import DarwinCore
 from traiter.pylib.pattern_compiler import Compiler
 from traiter.pylib.pipes import add
 
+from flora.pylib import term_registry
 from flora.pylib.trait_util import clean_trait
 
+from .lazy_terms import LazyTerms
 from .linkable import Linkable
 
 
@@ -18,7 +19,8 @@ from .linkable import Linkable
 class Odor(Linkable):
     # Class vars ----------
     odor_csv: ClassVar[Path] = Path(__file__).parent / "terms" / "odor_terms.csv"
-    replace: ClassVar[dict[str, str]] = term_util.look_up_table(odor_csv, "replace")
+    replace = LazyTerms(term_registry.look_up_table, odor_csv, "replace")
+    gates: ClassVar[dict[str, list[list[str]]]] = {"odor_patterns": [["odor"]]}
     # ---------------------
 
     odor: str = None
@@ -33,13 +35,17 @@ class Odor(Linkable):
     @classmethod
     def pipe(cls, nlp: Language):
         add.term_pipe(nlp, name="odor_terms", path=cls.odor_csv)
+        cls.patterns_pipe(nlp)
+        add.cleanup_pipe(nlp, name="odor_cleanup")
+
+    @classmethod
+    def patterns_pipe(cls, nlp: Language):
         add.trait_pipe(
             nlp,
             name="odor_patterns",
             compiler=cls.odor_patterns(),
             overwrite=["odor"],
         )
-        add.cleanup_pipe(nlp, name="odor_cleanup")
 
     @classmethod
     def odor_patterns(cls):
@@ -4,13 +4,15 @@ from typing import ClassVar
 
 from spacy import Language, registry
 from traiter.pylib import const as t_const
-from traiter.pylib import term_util
 from traiter.pylib.darwin_core import DarwinCore
 from traiter.pylib.pattern_compiler import Compiler
 from traiter.pylib.pipes import add
 from traiter.pylib.pipes.reject_match import REJECT_MATCH
 from traiter.pylib.rules import terms as t_terms
 
+from flora.pylib import term_registry
+
+from .lazy_terms import LazyTerms
 from .linkable import Linkable
 
 
@@ -23,9 +25,10 @@ class Part(Linkable):
         Path(t_terms.__file__).parent / "missing_terms.csv",
     ]
 
-    replace: ClassVar[dict[str, str]] = term_util.look_up_table(all_csvs, "replace")
-    type_: ClassVar[dict[str, str]] = term_util.look_up_table(part_csv, "type")
-    labels: ClassVar[list[str]] = term_util.get_labels(part_csv)
+    replace = LazyTerms(term_registry.look_up_table, all_csvs, "replace")
+    type_ = LazyTerms(term_registry.look_up_table, part_csv, "type")
+    labels = LazyTerms(term_registry.get_labels, part_csv)
+    gates: ClassVar[dict[str, list[list[str]]]] = {"part_patterns": [["part_term"]]}
     # ---------------------
 
     # part in base class
@@ -31,6 +31,10 @@ class PartLinker(Linker):
         "any": {},
         "clause": {"TEXT": {"NOT_IN": list(".;:,")}},
     }
+    gates: ClassVar[dict[str, list[list[str]]]] = {
+        "link_part": [parents, children],
+        "link_part_once": [parents, child_once],
+    }
     # ---------------------
 
     @classmethod
@@ -4,12 +4,14 @@ from typing import ClassVar
 
 from spacy import Language, registry
 from traiter.pylib import const as t_const
-from traiter.pylib import term_util as tu
 from traiter.pylib.darwin_core import DarwinCore
 from traiter.pylib.pattern_compiler import Compiler
 from traiter.pylib.pipes import add
 from traiter.pylib.rules import terms as t_terms
 
+from flora.pylib import term_registry
+
+from .lazy_terms import LazyTerms
 from .linkable import Linkable
 
 
@@ -22,13 +24,18 @@ class PartLocation(Linkable):
     units_csv: ClassVar[Path] = Path(t_terms.__file__).parent / "unit_length_terms.csv"
     all_csvs: ClassVar[list[Path]] = [location_csv, units_csv]
 
-    replace: ClassVar[dict[str, str]] = tu.look_up_table(location_csv, "replace")
-    overwrite: ClassVar[list[str]] = [
-        "part",
-        "subpart",
-        *tu.get_labels(location_csv),
-        *tu.get_labels(units_csv),
-    ]
+    replace = LazyTerms(term_registry.look_up_table, location_csv, "replace")
+    overwrite = LazyTerms(
+        lambda: [
+            "part",
+            "subpart",
+            *term_registry.get_labels(PartLocation.location_csv),
+            *term_registry.get_labels(PartLocation.units_csv),
+        ]
+    )
+    gates: ClassVar[dict[str, list[list[str]]]] = {
+        "location_patterns": [["location_leader", "location"]]
+    }
     # ---------------------
 
     part_location: str = None
@@ -16,6 +16,7 @@ class PartLocationLinker(Linker):
         color count joined margin multiple_parts part shape size
         subpart surface venation woodiness
         """.split()
+    gates: ClassVar[dict[str, list[list[str]]]] = {"link_location": [parents, children]}
     # ---------------------
 
     @classmethod
@@ -4,12 +4,13 @@ from typing import ClassVar
 
 from spacy import Language, registry
 from traiter.pylib import const as t_const
-from traiter.pylib import term_util
 from traiter.pylib.darwin_core import DarwinCore
 from traiter.pylib.pattern_compiler import Compiler
 from traiter.pylib.pipes import add
 from traiter.pylib.rules.base import Base
 
+from flora.pylib import term_registry
+from flora.pylib.rules.lazy_terms import LazyTerms
 from flora.pylib.trait_util import clean_trait
 
 
@@ -19,10 +20,14 @@ class PlantDuration(Base):
     plant_duration_csv: ClassVar[Path] = (
         Path(__file__).parent / "terms" / "plant_duration_terms.csv"
     )
-    replace: ClassVar[dict[str, str]] = term_util.look_up_table(
+    replace = LazyTerms(
+        term_registry.look_up_table,
         plant_duration_csv,
         "replace",
     )
+    gates: ClassVar[dict[str, list[list[str]]]] = {
+        "plant_duration_patterns": [["plant_duration"]]
+    }
     # ---------------------
 
     plant_duration: str = None
@@ -37,13 +42,17 @@ class PlantDuration(Base):
     @classmethod
     def pipe(cls, nlp: Language):
         add.term_pipe(nlp, name="plant_duration_terms", path=cls.plant_duration_csv)
+        cls.patterns_pipe(nlp)
+        add.cleanup_pipe(nlp, name="plant_duration_cleanup")
+
+    @classmethod
+    def patterns_pipe(cls, nlp: Language):
         add.trait_pipe(
             nlp,
             name="plant_duration_patterns",
             compiler=cls.plant_duration_patterns(),
             overwrite=["plant_duration"],
         )
-        add.cleanup_pipe(nlp, name="plant_duration_cleanup")
 
     @classmethod
     def plant_duration_patterns(cls):
@@ -4,12 +4,13 @@ from typing import ClassVar
 
 from spacy import Language, registry
 from traiter.pylib import const as t_const
-from traiter.pylib import term_util
 from traiter.pylib.darwin_core import DarwinCore
 from traiter.pylib.pattern_compiler import Compiler
 from traiter.pylib.pipes import add
 from traiter.pylib.rules.base import Base
 
+from flora.pylib import term_registry
+from flora.pylib.rules.lazy_terms import LazyTerms
 from flora.pylib.trait_util import clean_trait
 
 
@@ -19,9 +20,10 @@ class Reproduction(Base):
     reproduction_csv: ClassVar[Path] = (
         Path(__file__).parent / "terms" / "reproduction_terms.csv"
     )
-    replace: ClassVar[dict[str, str]] = term_util.look_up_table(
-        reproduction_csv, "replace"
-    )
+    replace = LazyTerms(term_registry.look_up_table, reproduction_csv, "replace")
+    gates: ClassVar[dict[str, list[list[str]]]] = {
+        "reproduction_patterns": [["reproduction"]]
+    }
     # ---------------------
 
     reproduction: str = None
@@ -36,13 +38,17 @@ class Reproduction(Base):
     @classmethod
     def pipe(cls, nlp: Language):
         add.term_pipe(nlp, name="reproduction_terms", path=cls.reproduction_csv)
+        cls.patterns_pipe(nlp)
+        add.cleanup_pipe(nlp, name="reproduction_cleanup")
+
+    @classmethod
+    def patterns_pipe(cls, nlp: Language):
         add.trait_pipe(
             nlp,
             name="reproduction_patterns",
             compiler=cls.reproduction_patterns(),
             overwrite=["reproduction"],
         )
-        add.cleanup_pipe(nlp, name="reproduction_cleanup")
 
     @classmethod
     def reproduction_patterns(cls):
@@ -0,0 +1,95 @@
+"""
+Tag parts of speech with word lists and suffixes instead of a statistical model.
+
+The flora rules only read a few POS tags (see audit-tokens): ADP and CCONJ to join
+phrases, ADJ for part locations, and PROPN or NOUN for unknown taxon names. Treatment
+text is terse and mostly made of terms, so closed word classes and suffixes get
+those tags right often enough for a pipeline that does not load en_core_web_md.
+Lemmas and dependencies, which some of traiter's pipes read, are left unset, so
+compare-pipelines is the way to tell how close the traits are.
+"""
+
+from operator import attrgetter
+
+import regex as re
+from spacy.language import Language
+from spacy.tokens import Doc
+from traiter.pylib.pipes import add
+
+ADP = """
+    about above across after against along among amongst around at before behind
+    below beneath beside besides between beyond by during except for from in inside
+    into near of off on onto out outside over per through throughout to toward
+    towards under until up upon via with within without
+    """.split()
+
+CCONJ = """ & and but either neither nor or plus yet """.split()
+
+DET = """
+    a an another any both each every few many more most much no other several some
+    such that the these this those
+    """.split()
+
+PRON = """
+    he her him his it its itself one ones she their them they which who
+    """.split()
+
+ADV = """
+    almost also always ca. commonly especially frequently generally mostly never not
+    occasionally often only rarely seldom sometimes somewhat too usually very
+    """.split()
+
+AUX = """ are be been being is was were """.split()
+
+# Adjective endings in English and in the Latin used for descriptions
+ADJ_RE = re.compile(
+    r"""
+    (?: ous | ose | ate | ic | al | ar | ary | ful | less | ish | ive | ile | oid
+    | form | like | ent | ant | ed | id )$
+    """,
+    flags=re.VERBOSE,
+)
+ADV_RE = re.compile(r"[a-z]{3,}ly$")
+
+WORDS = {
+    **dict.fromkeys(ADP, "ADP"),
+    **dict.fromkeys(CCONJ, "CCONJ"),
+    **dict.fromkeys(DET, "DET"),
+    **dict.fromkeys(PRON, "PRON"),
+    **dict.fromkeys(ADV, "ADV"),
+    **dict.fromkeys(AUX, "AUX"),
+}
+
+# Tags for words not in the lists, the first test that passes wins
+SHAPES = [
+    (attrgetter("like_num"), "NUM"),
+    (attrgetter("is_punct"), "PUNCT"),
+    (attrgetter("is_space"), "SPACE"),
+    (lambda t: not t.is_alpha, "X"),
+    (lambda t: t.is_title and not t.is_sent_start, "PROPN"),
+    (lambda t: ADV_RE.search(t.lower_), "ADV"),
+    (lambda t: ADJ_RE.search(t.lower_), "ADJ"),
+]
+
+
+def pipe(nlp: Language):
+    add.custom_pipe(nlp, "rule_tagger")
+
+
+@Language.factory("rule_tagger")
+class RuleTagger:
+    def __init__(self, nlp: Language, name: str):
+        super().__init__()
+        self.nlp = nlp
+        self.name = name
+
+    def __call__(self, doc: Doc) -> Doc:
+        for token in doc:
+            token.pos_ = tag(token)
+        return doc
+
+
+def tag(token) -> str:
+    if pos := WORDS.get(token.lower_):
+        return pos
+    return next((pos for test, pos in SHAPES if test(token)), "NOUN")
@@ -5,12 +5,13 @@ from typing import ClassVar
 import traiter.pylib.darwin_core as t_dwc
 from spacy import Language, registry
 from traiter.pylib import const as t_const
-from traiter.pylib import term_util
 from traiter.pylib.darwin_core import DarwinCore
 from traiter.pylib.pattern_compiler import Compiler
 from traiter.pylib.pipes import add
 from traiter.pylib.rules.base import Base
 
+from flora.pylib import term_registry
+from flora.pylib.rules.lazy_terms import LazyTerms
 from flora.pylib.trait_util import clean_trait
 
 
@@ -18,7 +19,8 @@ from flora.pylib.trait_util import clean_trait
 class Sex(Base):
     # Class vars ----------
     sex_csv: ClassVar[Path] = Path(__file__).parent / "terms" / "sex_terms.csv"
-    replace: ClassVar[dict[str, str]] = term_util.look_up_table(sex_csv, "replace")
+    replace = LazyTerms(term_registry.look_up_table, sex_csv, "replace")
+    gates: ClassVar[dict[str, list[list[str]]]] = {"sex_patterns": [["sex"]]}
     # ---------------------
 
     sex: str = None
@@ -27,6 +27,7 @@ class SexLinker(Linker):
         margin multiple_parts part_location part plant_morphology shape
         size subpart surface venation woodiness
         """.split()
+    gates: ClassVar[dict[str, list[list[str]]]] = {"link_sex": [parents, children]}
     # ---------------------
 
     @classmethod
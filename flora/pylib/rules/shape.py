@@ -5,11 +5,13 @@ from typing import ClassVar
 
 from spacy import Language, registry
 from traiter.pylib import const as t_const
-from traiter.pylib import term_util
 from traiter.pylib.darwin_core import DarwinCore
 from traiter.pylib.pattern_compiler import Compiler
 from traiter.pylib.pipes import add
 
+from flora.pylib import term_registry
+
+from .lazy_terms import LazyTerms
 from .linkable import Linkable
 
 
@@ -18,7 +20,7 @@ class Shape(Linkable):
     # Class vars ----------
     shape_csv: ClassVar[Path] = Path(__file__).parent / "terms" / "shape_terms.csv"
     shape_loc: ClassVar[list[str]] = ["shape_term", "shape_leader", "part_location"]
-    replace: ClassVar[dict[str, str]] = term_util.look_up_table(shape_csv, "replace")
+    replace = LazyTerms(term_registry.look_up_table, shape_csv, "replace")
     # ---------------------
 
     shape: str = None
@@ -5,12 +5,14 @@ from typing import ClassVar
 from spacy import registry
 from spacy.language import Language
 from traiter.pylib import const as t_const
-from traiter.pylib import term_util
 from traiter.pylib.darwin_core import DarwinCore
 from traiter.pylib.pattern_compiler import Compiler
 from traiter.pylib.pipes import add, reject_match
 from traiter.pylib.rules import terms as t_terms
 
+from flora.pylib import term_registry
+
+from .lazy_terms import LazyTerms
 from .linkable import Linkable
 
 TOO_BIG = 100.0
@@ -29,6 +31,12 @@ ALL_CSVS = [
 ]
 
 
+def get_factors_cm() -> dict[str, float]:
+    factors_cm = dict(term_registry.look_up_table(ALL_CSVS, "factor_cm", float))
+    factors_cm["in"] = 2.54
+    return factors_cm
+
+
 @dataclass(eq=False)
 class Dimension:
     dim: str = None
@@ -45,15 +53,13 @@ class Dimension:
 class Size(Linkable):
     # Class vars ----------
     cross: ClassVar[list[str]] = t_const.CROSS + t_const.COMMA
-    factors_cm: ClassVar[dict[str, float]] = term_util.look_up_table(
-        ALL_CSVS, "factor_cm", float
-    )
-    factors_cm["in"] = 2.54
+    factors_cm = LazyTerms(get_factors_cm)
     not_numeric: ClassVar[list[str]] = """
         not_numeric metric_mass imperial_mass metric_dist imperial_dist
         """.split()
-    replace: ClassVar[dict[str, str]] = term_util.look_up_table(ALL_CSVS, "replace")
+    replace = LazyTerms(term_registry.look_up_table, ALL_CSVS, "replace")
     lengths: ClassVar[list[str]] = ["metric_length", "imperial_length"]
+    gates: ClassVar[dict[str, list[list[str]]]] = {"size_patterns": [lengths]}
     # ---------------------
 
     dims: list[Dimension] = field(default_factory=list)
@@ -4,12 +4,14 @@ from typing import ClassVar
 
 from spacy import Language, registry
 from traiter.pylib import const as t_const
-from traiter.pylib import term_util
 from traiter.pylib.darwin_core import DarwinCore
 from traiter.pylib.pattern_compiler import Compiler
 from traiter.pylib.pipes import add
 from traiter.pylib.rules import terms as t_terms
 
+from flora.pylib import term_registry
+
+from .lazy_terms import LazyTerms
 from .linkable import Linkable
 
 
@@ -22,7 +24,10 @@ class Subpart(Linkable):
         Path(t_terms.__file__).parent / "missing_terms.csv",
     ]
 
-    replace = term_util.look_up_table(all_csvs, "replace")
+    replace = LazyTerms(term_registry.look_up_table, all_csvs, "replace")
+    gates: ClassVar[dict[str, list[list[str]]]] = {
+        "subpart_patterns": [["subpart_term"]]
+    }
     # ---------------------
 
     # subpart in base class
@@ -23,6 +23,10 @@ class SubpartLinker(Linker):
         "any": {},
         "clause": {"TEXT": {"NOT_IN": list(".;:,")}},
     }
+    gates: ClassVar[dict[str, list[list[str]]]] = {
+        "link_subpart": [parents, children],
+        "link_subpart_once": [parents, child_once],
+    }
     # ---------------------
 
     @classmethod
@@ -1,13 +1,16 @@
 from dataclasses import dataclass
 from pathlib import Path
+from typing import ClassVar
 
 from spacy import Language, registry
 from traiter.pylib import const as t_const
-from traiter.pylib import term_util
 from traiter.pylib.darwin_core import DarwinCore
 from traiter.pylib.pattern_compiler import Compiler
 from traiter.pylib.pipes import add
 
+from flora.pylib import term_registry
+
+from .lazy_terms import LazyTerms
 from .linkable import Linkable
 
 
@@ -15,7 +18,10 @@ from .linkable import Linkable
 class Surface(Linkable):
     # Class vars ----------
     surface_csv = Path(__file__).parent / "terms" / "surface_terms.csv"
-    replace = term_util.look_up_table(surface_csv, "replace")
+    replace = LazyTerms(term_registry.look_up_table, surface_csv, "replace")
+    gates: ClassVar[dict[str, list[list[str]]]] = {
+        "surface_patterns": [["surface_term"]]
+    }
     # ---------------------
 
     surface: str = None
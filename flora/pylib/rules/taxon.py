@@ -1,21 +1,24 @@
 import os
 import re
 from dataclasses import asdict, dataclass
+from functools import partial
 from pathlib import Path
 from typing import ClassVar
 
 import traiter.pylib.darwin_core as t_dwc
 from spacy import Language, registry
 from traiter.pylib import const as t_const
-from traiter.pylib import taxon_util, term_util
+from traiter.pylib import taxon_util
 from traiter.pylib.darwin_core import DarwinCore
 from traiter.pylib.pattern_compiler import ACCUMULATOR, Compiler
 from traiter.pylib.pipes import add, reject_match
 from traiter.pylib.rules import terms as t_terms
 from traiter.pylib.rules.base import Base
 
-from flora.pylib import const
+from flora.pylib import const, term_registry
+from flora.pylib.lexicon import Lexicon, is_current
 from flora.pylib.rules import terms as f_terms
+from flora.pylib.rules.lazy_terms import LazyTerms
 
 NAME_LEN: int = 2
 
@@ -46,46 +49,76 @@ def get_csvs() -> dict[str, Path]:
     return csvs
 
 
+def rank_labels(rank_csv: Path, level: str | None = None) -> list[str]:
+    ranks = term_registry.read_terms(rank_csv)
+    return sorted({r["label"] for r in ranks if level in (None, r["level"])})
+
+
+def lexicon_or_table(source: Path, loader, *args) -> Lexicon | dict[str, str]:
+    """
+    Use the memory-mapped lexicon built from the term file.
+
+    The lexicon is built from the table the first time it is needed, and again when
+    the term file changes. The mock term files and read-only installs use the table.
+    """
+    lexicon = source.with_suffix(".lex")
+    if is_current(lexicon, source):
+        return Lexicon(lexicon)
+
+    table = loader(source, *args)
+    if source.suffix != ".zip":
+        return table
+
+    try:
+        Lexicon.write(lexicon, table.items(), source)
+    except OSError:
+        return table
+    return Lexicon(lexicon)
+
+
 @dataclass(eq=False)
 class Taxon(Base):
     # Class vars ----------
     all_csvs: ClassVar[dict[str, Path]] = get_csvs()
 
-    rank_terms: ClassVar[list[dict]] = term_util.read_terms(all_csvs["rank_terms"])
+    rank_terms = LazyTerms(term_registry.read_terms, all_csvs["rank_terms"])
 
     abbrev_re: ClassVar[str] = r"^[A-Z]?[.,_]?[A-Z][.,_]$"
     and_: ClassVar[list[str]] = ["&", "and", "et", "ex"]
-    any_rank: ClassVar[list[str]] = sorted({r["label"] for r in rank_terms})
+    any_rank = LazyTerms(rank_labels, all_csvs["rank_terms"])
     auth3: ClassVar[list[str]] = [
         s for s in t_const.NAME_SHAPES if len(s) > NAME_LEN and s[-1] != "."
     ]
     auth3_upper: ClassVar[list[str]] = [
         s for s in t_const.NAME_AND_UPPER if len(s) > NAME_LEN and s[-1] != "."
     ]
-    binomial_abbrev: ClassVar[dict[str, str]] = taxon_util.abbrev_binomial_term(
+    binomial_abbrev = LazyTerms(
+        lexicon_or_table,
         all_csvs["binomial_terms"],
+        partial(term_registry.table, taxon_util.abbrev_binomial_term),
     )
     ambiguous: ClassVar[list[str]] = ["us_county", "color"]
-    higher_rank: ClassVar[list[str]] = sorted(
-        {r["label"] for r in rank_terms if r["level"] == "higher"},
-    )
-    level: ClassVar[dict[str, str]] = term_util.look_up_table(
+    higher_rank = LazyTerms(rank_labels, all_csvs["rank_terms"], "higher")
+    level = LazyTerms(
+        term_registry.look_up_table,
         all_csvs["rank_terms"],
         "level",
     )
     linnaeus: ClassVar[list[str]] = "l l. lin lin. linn linn. linnaeus".split()
-    lower_rank: ClassVar[list[str]] = sorted(
-        {r["label"] for r in rank_terms if r["level"] == "lower"},
-    )
-    monomial_ranks: ClassVar[dict[str, str]] = term_util.look_up_table(
+    lower_rank = LazyTerms(rank_labels, all_csvs["rank_terms"], "lower")
+    monomial_ranks = LazyTerms(
+        lexicon_or_table,
         all_csvs["monomial_terms"],
+        term_registry.look_up_table,
         "ranks",
     )
-    rank_abbrev: ClassVar[dict[str, str]] = term_util.look_up_table(
+    rank_abbrev = LazyTerms(
+        term_registry.look_up_table,
         all_csvs["rank_terms"],
         "abbrev",
     )
-    rank_replace: ClassVar[dict[str, str]] = term_util.look_up_table(
+    rank_replace = LazyTerms(
+        term_registry.look_up_table,
         all_csvs["rank_terms"],
         "replace",
     )
@@ -3,12 +3,14 @@ from pathlib import Path
 from typing import ClassVar
 
 from spacy import Language, registry
-from traiter.pylib import term_util
 from traiter.pylib.darwin_core import DarwinCore
 from traiter.pylib.pattern_compiler import Compiler
 from traiter.pylib.pipes import add
 from traiter.pylib.rules.base import Base
 
+from flora.pylib import term_registry
+from flora.pylib.rules.lazy_terms import LazyTerms
+
 
 @dataclass(eq=False)
 class TaxonLike(Base):
@@ -16,11 +18,12 @@ class TaxonLike(Base):
     taxon_like_csv: ClassVar[Path] = (
         Path(__file__).parent / "terms" / "taxon_like_terms.csv"
     )
-    replace: ClassVar[dict[str, str]] = term_util.look_up_table(
-        taxon_like_csv, "replace"
-    )
+    replace = LazyTerms(term_registry.look_up_table, taxon_like_csv, "replace")
 
     taxon_labels: ClassVar[list[str]] = ["taxon", "multi_taxon"]
+    gates: ClassVar[dict[str, list[list[str]]]] = {
+        "taxon_like_patterns": [["similar"], taxon_labels]
+    }
     # ---------------------
 
     taxon_like: str | list[str] = None
@@ -13,6 +13,9 @@ class TaxonLikeLinker(Linker):
     # Class vars ----------
     parents: ClassVar[list[str]] = ["taxon_like"]
     children: ClassVar[list[str]] = ["taxon"]
+    gates: ClassVar[dict[str, list[list[str]]]] = {
+        "link_taxon_like_patterns": [parents, children]
+    }
     # ---------------------
 
     @classmethod
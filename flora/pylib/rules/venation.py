@@ -4,13 +4,14 @@ from typing import ClassVar
 
 from spacy import Language, registry
 from traiter.pylib import const as t_const
-from traiter.pylib import term_util
 from traiter.pylib.darwin_core import DarwinCore
 from traiter.pylib.pattern_compiler import Compiler
 from traiter.pylib.pipes import add
 
+from flora.pylib import term_registry
 from flora.pylib.trait_util import clean_trait
 
+from .lazy_terms import LazyTerms
 from .linkable import Linkable
 
 
@@ -20,7 +21,8 @@ class Venation(Linkable):
     venation_csv: ClassVar[Path] = (
         Path(__file__).parent / "terms" / "venation_terms.csv"
     )
-    replace: ClassVar[dict[str, str]] = term_util.look_up_table(venation_csv, "replace")
+    replace = LazyTerms(term_registry.look_up_table, venation_csv, "replace")
+    gates: ClassVar[dict[str, list[list[str]]]] = {"venation_patterns": [["venation"]]}
     # ---------------------
 
     venation: str = None
@@ -35,13 +37,17 @@ class Venation(Linkable):
     @classmethod
     def pipe(cls, nlp: Language):
         add.term_pipe(nlp, name="venation_terms", path=cls.venation_csv)
+        cls.patterns_pipe(nlp)
+        add.cleanup_pipe(nlp, name="venation_cleanup")
+
+    @classmethod
+    def patterns_pipe(cls, nlp: Language):
         add.trait_pipe(
             nlp,
             name="venation_patterns",
             compiler=cls.venation_patterns(),
             overwrite=["venation"],
         )
-        add.cleanup_pipe(nlp, name="venation_cleanup")
 
     @classmethod
     def venation_patterns(cls):
@@ -4,13 +4,14 @@ from typing import ClassVar
 
 from spacy import Language, registry
 from traiter.pylib import const as t_const
-from traiter.pylib import term_util
 from traiter.pylib.darwin_core import DarwinCore
 from traiter.pylib.pattern_compiler import Compiler
 from traiter.pylib.pipes import add
 
+from flora.pylib import term_registry
 from flora.pylib.trait_util import clean_trait
 
+from .lazy_terms import LazyTerms
 from .linkable import Linkable
 
 
@@ -20,9 +21,10 @@ class Woodiness(Linkable):
     woodiness_csv: ClassVar[Path] = (
         Path(__file__).parent / "terms" / "woodiness_terms.csv"
     )
-    replace: ClassVar[dict[str, str]] = term_util.look_up_table(
-        woodiness_csv, "replace"
-    )
+    replace = LazyTerms(term_registry.look_up_table, woodiness_csv, "replace")
+    gates: ClassVar[dict[str, list[list[str]]]] = {
+        "woodiness_patterns": [["woodiness"]]
+    }
     # ---------------------
 
     woodiness: str = None
@@ -37,13 +39,17 @@ class Woodiness(Linkable):
     @classmethod
     def pipe(cls, nlp: Language):
         add.term_pipe(nlp, name="woodiness_terms", path=cls.woodiness_csv)
+        cls.patterns_pipe(nlp)
+        add.cleanup_pipe(nlp, name="woodiness_cleanup")
+
+    @classmethod
+    def patterns_pipe(cls, nlp: Language):
         add.trait_pipe(
             nlp,
             name="woodiness_patterns",
             compiler=cls.woodiness_patterns(),
             overwrite=["woodiness"],
         )
-        add.cleanup_pipe(nlp, name="woodiness_cleanup")
 
     @classmethod
     def woodiness_patterns(cls):
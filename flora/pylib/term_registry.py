@@ -0,0 +1,145 @@
+"""
+One place to read term files so that each one is parsed only once per process.
+
+Several rules read the same term files, like the numeric, unit, and month terms,
+and build lookup tables from them. The registry keeps the parsed rows of every file
+and every table derived from them, and hands the same objects to all callers. So
+treat the returned rows and tables as read only and copy them before changing them.
+"""
+
+import sys
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from traiter.pylib import term_util
+
+
+@dataclass
+class Entry:
+    name: str
+    value: Any
+    uses: int = 0
+
+
+ROWS: dict[Path, Entry] = {}
+TABLES: dict[tuple, Entry] = {}
+
+
+def read_terms(csv_path: Path | Iterable[Path]) -> list[dict]:
+    """Get the rows for the term files, parsing every file only the first time."""
+    rows = []
+    for path in as_paths(csv_path):
+        key = path.resolve()
+        if key not in ROWS:
+            ROWS[key] = Entry(path.name, term_util.read_terms(path))
+        ROWS[key].uses += 1
+        rows += ROWS[key].value
+    return rows
+
+
+def look_up_table(
+    csv_path: Path | Iterable[Path], column: str, type_: Callable = str
+) -> dict[str, Any]:
+    """Map term patterns to the values in a column for terms that have one."""
+    return derived(
+        f"{column} {names(csv_path)}",
+        lambda: {
+            t["pattern"]: type_(t[column])
+            for t in read_terms(csv_path)
+            if t.get(column)
+        },
+        "look_up_table",
+        as_key(csv_path),
+        column,
+        type_,
+    )
+
+
+def get_labels(csv_path: Path | Iterable[Path]) -> list[str]:
+    """Get the sorted, unique term labels from the term files."""
+    return derived(
+        f"labels {names(csv_path)}",
+        lambda: sorted({t["label"] for t in read_terms(csv_path)}),
+        "get_labels",
+        as_key(csv_path),
+    )
+
+
+def table(loader: Callable, *args) -> Any:
+    """Build a table with a loader that reads term files itself, but only once."""
+    name = f"{loader.__name__} {' '.join(names(a) for a in args)}"
+    key = (loader.__module__, loader.__qualname__, *(as_key(a) for a in args))
+    return derived(name, lambda: loader(*args), *key)
+
+
+def derived(name: str, build: Callable, *key) -> Any:
+    if key not in TABLES:
+        TABLES[key] = Entry(name, build())
+    TABLES[key].uses += 1
+    return TABLES[key].value
+
+
+def as_paths(csv_path: Path | Iterable[Path]) -> list[Path]:
+    return [csv_path] if isinstance(csv_path, Path) else list(csv_path)
+
+
+def as_key(arg: Any) -> Any:
+    if isinstance(arg, Path):
+        return arg.resolve()
+    if isinstance(arg, list | tuple):
+        return tuple(as_key(a) for a in arg)
+    return arg
+
+
+def names(arg: Any) -> str:
+    if isinstance(arg, Path):
+        return arg.name
+    if isinstance(arg, list | tuple):
+        return ",".join(names(a) for a in arg)
+    return str(arg)
+
+
+def deep_size(obj: Any, seen: set[int] | None = None) -> int:
+    """Approximate the bytes used by an object and everything it holds."""
+    seen = seen if seen is not None else set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_size(k, seen) + deep_size(v, seen) for k, v in obj.items())
+    elif isinstance(obj, list | tuple | set | frozenset):
+        size += sum(deep_size(v, seen) for v in obj)
+    return size
+
+
+def report() -> list[dict]:
+    """Memory used by every parsed file and table, biggest first."""
+    rows = [("rows", e) for e in ROWS.values()]
+    rows += [("table", e) for e in TABLES.values()]
+    output = [
+        {
+            "kind": kind,
+            "name": e.name,
+            "entries": len(e.value),
+            "uses": e.uses,
+            "bytes": deep_size(e.value),
+        }
+        for kind, e in rows
+    ]
+    return sorted(output, key=lambda r: r["bytes"], reverse=True)
+
+
+def print_report() -> None:
+    output = report()
+    print(f"{'kind':<6} {'name':<48} {'entries':>8} {'uses':>5} {'MB':>8}")
+    for r in output:
+        print(
+            f"{r['kind']:<6} {r['name'][:48]:<48} {r['entries']:>8} "
+            f"{r['uses']:>5} {r['bytes'] / (1024 * 1024):>8.2f}"
+        )
+    total = sum(r["bytes"] for r in output) / (1024 * 1024)
+    print(f"{'total':<6} {'':<48} {'':>8} {'':>5} {total:>8.2f}")
@@ -0,0 +1,128 @@
+"""
+Find which token attributes set by the statistical model the rules read.
+
+The rules read token attributes in two ways: as keys in matcher patterns, like
+{"POS": "ADP"}, and as Python attributes, like token.pos_. This scans the rule
+sources for both and maps each attribute to the model components that set it. Model
+components that nothing reads can be left out of the pipeline.
+
+Most of the pipes are built by traiter, so its installed rules and pipes are scanned
+too. Leaving them out would hide the lemma, dependency, and sentence reads there.
+"""
+
+import ast
+import importlib.util
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+
+# Model components that set an attribute. The en_core_web_md tok2vec layer reads
+# the static vectors, so everything that listens to it needs them too.
+LISTENER = ["vectors", "tok2vec"]
+PRODUCERS = {
+    "POS": [*LISTENER, "tagger", "attribute_ruler"],
+    "TAG": [*LISTENER, "tagger"],
+    "MORPH": [*LISTENER, "tagger", "attribute_ruler"],
+    "LEMMA": [*LISTENER, "tagger", "attribute_ruler", "lemmatizer"],
+    "DEP": [*LISTENER, "parser"],
+    "HEAD": [*LISTENER, "parser"],
+    "SENT_START": [*LISTENER, "parser"],
+    "VECTOR": ["vectors"],
+}
+
+MODEL_COMPONENTS = [
+    "vectors",
+    "tok2vec",
+    "tagger",
+    "parser",
+    "attribute_ruler",
+    "lemmatizer",
+    "ner",
+]
+
+# Pattern keys and Python token attributes for each model attribute
+PATTERN_KEYS = {
+    "POS": "POS",
+    "TAG": "TAG",
+    "MORPH": "MORPH",
+    "LEMMA": "LEMMA",
+    "DEP": "DEP",
+    "IS_SENT_START": "SENT_START",
+    "SENT_START": "SENT_START",
+}
+PYTHON_ATTRS = {
+    "pos": "POS",
+    "pos_": "POS",
+    "tag": "TAG",
+    "tag_": "TAG",
+    "morph": "MORPH",
+    "lemma": "LEMMA",
+    "lemma_": "LEMMA",
+    "dep": "DEP",
+    "dep_": "DEP",
+    "head": "HEAD",
+    "subtree": "HEAD",
+    "noun_chunks": "DEP",
+    "sent": "SENT_START",
+    "sents": "SENT_START",
+    "is_sent_start": "SENT_START",
+    "vector": "VECTOR",
+    "has_vector": "VECTOR",
+    "similarity": "VECTOR",
+}
+
+
+@dataclass
+class Use:
+    attr: str
+    path: Path
+    line: int
+    code: str
+
+
+def audit(paths: list[Path]) -> dict[str, list[Use]]:
+    """Get every place in the Python files that reads a model attribute."""
+    uses = defaultdict(list)
+    for path in paths:
+        source = path.read_text()
+        lines = source.splitlines()
+        for node in ast.walk(ast.parse(source)):
+            attr = None
+            if isinstance(node, ast.Dict):
+                keys = [k.value for k in node.keys if isinstance(k, ast.Constant)]
+                attr = next((PATTERN_KEYS[k] for k in keys if k in PATTERN_KEYS), None)
+            elif (
+                isinstance(node, ast.Attribute)
+                and node.attr in PYTHON_ATTRS
+                and isinstance(node.ctx, ast.Load)
+                and not is_class_var(node)
+            ):
+                attr = PYTHON_ATTRS[node.attr]
+            if attr:
+                code = lines[node.lineno - 1].strip()
+                uses[attr].append(Use(attr, path, node.lineno, code))
+    return dict(uses)
+
+
+def is_class_var(node: ast.Attribute) -> bool:
+    """Rule attributes like cls.children are not token attributes."""
+    return isinstance(node.value, ast.Name) and node.value.id in {"cls", "self"}
+
+
+def needed(uses: dict[str, list[Use]]) -> set[str]:
+    return {c for attr in uses for c in PRODUCERS[attr]}
+
+
+def unused(uses: dict[str, list[Use]]) -> list[str]:
+    keep = needed(uses)
+    return [c for c in MODEL_COMPONENTS if c not in keep]
+
+
+def source_files(dirs: list[Path]) -> list[Path]:
+    return sorted(p for d in dirs for p in d.rglob("*.py"))
+
+
+def package_dirs(name: str) -> list[Path]:
+    """Get the directories of an installed package, like traiter."""
+    spec = importlib.util.find_spec(name)
+    return [Path(d) for d in spec.submodule_search_locations]
@@ -0,0 +1,45 @@
+"""
+Convert each trait to DarwinCore once and share it with all of the writers.
+
+A trait's to_dwc builds its key and formats its values, and the HTML, CSV, SQLite,
+and JSON writers all need it. The DarwinCore for each trait is kept with its
+treatment. It also remembers what the trait added to it, so the DarwinCore for a
+whole treatment can be put together from the traits without converting them again.
+"""
+
+from traiter.pylib.darwin_core import DarwinCore
+
+
+class TraitDwc(DarwinCore):
+    def __init__(self):
+        super().__init__()
+        self.calls: list[tuple[bool, dict]] = []  # (is dynamic, fields) in order
+
+    def add(self, **kwargs):
+        self.calls.append((False, kwargs))
+        return super().add(**kwargs)
+
+    def add_dyn(self, **kwargs):
+        self.calls.append((True, kwargs))
+        return super().add_dyn(**kwargs)
+
+
+def convert(traits: list) -> list[TraitDwc]:
+    dwcs = []
+    for trait in traits:
+        dwc = TraitDwc()
+        trait.to_dwc(dwc)
+        dwcs.append(dwc)
+    return dwcs
+
+
+def combine(dwcs: list[TraitDwc]) -> DarwinCore:
+    """Add the traits to one DarwinCore just like to_dwc would have."""
+    combined = DarwinCore()
+    for dwc in dwcs:
+        for dyn, kwargs in dwc.calls:
+            if dyn:
+                combined.add_dyn(**kwargs)
+            else:
+                combined.add(**kwargs)
+    return combined
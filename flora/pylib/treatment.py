@@ -6,6 +6,7 @@ from traiter.pylib import const as t_const
 from traiter.pylib import util as t_util
 from traiter.pylib.rules.base import Base
 
+from flora.pylib import chunks, trait_dwc
 from flora.pylib.rules.linkable import Linkable
 
 
@@ -16,15 +17,64 @@ class Treatment:
     traits: list[Base | Linkable] = field(default_factory=list)
     formatted_text: str = ""
     formatted_traits: list[str] = field(default_factory=list)
+    _dwc: list[trait_dwc.TraitDwc] | None = field(default=None, init=False, repr=False)
 
-    def parse(self, nlp, encoding="utf8"):
+    def parse(self, nlp, encoding="utf8", cache=None, chunk_size=chunks.CHUNK_SIZE):
+        self.read(encoding=encoding)
+        self.parse_text(nlp, cache=cache, chunk_size=chunk_size)
+
+    def parse_text(self, nlp, cache=None, chunk_size=chunks.CHUNK_SIZE):
+        """Parse the text after it was read."""
+        self._dwc = None
+
+        if cache and self.restore(cache):
+            return
+
+        if len(self.text) > chunk_size:
+            self.traits = chunks.parse(nlp, [self.text], size=chunk_size)[0]
+        else:
+            doc = nlp(self.text)
+            self.add_traits(doc)
+
+        if cache:
+            cache.put(self.text, self.traits)
+
+    def read(self, encoding="utf8"):
         with self.path.open(encoding=encoding) as f:
             self.text = f.read()
             self.text = self.clean()
             self.text = t_util.compress(self.text)
+        return self.text
 
-        doc = nlp(self.text)
+    def add_traits(self, doc):
         self.traits = [e._.trait for e in doc.ents]
 
+    @property
+    def dwc(self) -> list[trait_dwc.TraitDwc]:
+        """Get the DarwinCore for each trait, converting them the first time."""
+        if self._dwc is None:
+            self._dwc = trait_dwc.convert(self.traits)
+        return self._dwc
+
+    def dwc_dict(self) -> dict:
+        """Get the DarwinCore for all the traits together."""
+        return trait_dwc.combine(self.dwc).to_dict()
+
+    def restore(self, cache) -> bool:
+        """Get the traits from the parse cache, if they are there."""
+        traits = cache.get(self.text)
+        if traits is None:
+            return False
+        self.traits = traits
+        return True
+
+    def release(self):
+        """Drop the parse results once all writers are done with them."""
+        self.text = ""
+        self.traits = []
+        self.formatted_text = ""
+        self.formatted_traits = []
+        self._dwc = None
+
     def clean(self):
         return re.sub(t_const.DASH_RE, "-", self.text)
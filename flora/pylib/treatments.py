@@ -1,20 +1,72 @@
+import copy
+from collections import deque
+from functools import cached_property
+from itertools import groupby, islice
+from multiprocessing import Pool
+
 from tqdm import tqdm
 
+from flora.pylib import chunks
+from flora.pylib.dedupe import Dedupe
+from flora.pylib.pipe_gate import PipeGate
+from flora.pylib.prefetch import read_ahead
 from flora.pylib.treatment import Treatment
 
 from .pipelines import flora_pipeline
 
+WORKER_CHUNK = 16  # Treatments sent to a worker at a time when not batching
+JOBS_PER_WORKER = 4  # Jobs submitted but not yet handed on, for each worker
+
+NLP = None  # Each worker process builds its own pipeline once
+CACHE = None  # And opens its own connection to the parse cache
+DEDUPE = None  # And skips the duplicates it sees itself
+
+FILES = "files"  # A worker job that reads and parses a group of treatment files
+PIECE = "piece"  # A worker job that parses one chunk of a long treatment
+
 
 class Treatments:
-    def __init__(self, treatment_dir, limit, offset):
+    def __init__(
+        self,
+        treatment_dir,
+        limit,
+        offset,
+        pipeline_cache=None,
+        *,
+        gate=False,
+        traits=None,
+        model=True,
+        chunk_size=chunks.CHUNK_SIZE,
+        prefetch=0,
+        dedupe=False,
+    ):
         self.treatments: list[Treatment] = self.get_treatments(
             treatment_dir, limit, offset
         )
-        self.nlp = flora_pipeline.build()
+        self.pipeline_cache = pipeline_cache
+        self.gates = flora_pipeline.gates() if gate else None
+        self.traits = traits
+        self.model = model
+        self.chunk_size = chunk_size
+        self.prefetch = prefetch
+        self.dedupe = Dedupe() if dedupe else None
 
     def __iter__(self):
         yield from self.treatments
 
+    @cached_property
+    def nlp(self):
+        return build(**self.pipeline_args)
+
+    @property
+    def pipeline_args(self) -> dict:
+        return {
+            "pipeline_cache": self.pipeline_cache,
+            "gates": self.gates,
+            "traits": self.traits,
+            "model": self.model,
+        }
+
     @staticmethod
     def get_treatments(treatment_dir, limit, offset):
         labels = [Treatment(p) for p in sorted(treatment_dir.glob("*"))]
@@ -24,6 +76,231 @@ class Treatments:
 
         return labels
 
-    def parse(self, encoding="utf8"):
-        for lb in tqdm(self.treatments, desc="parse"):
-            lb.parse(self.nlp, encoding=encoding)
+    def parse(self, encoding="utf8", batch_size=0, workers=0, cache=None):
+        parsed = self.parsed(encoding, batch_size, workers, cache)
+        for _ in tqdm(parsed, total=len(self.treatments), desc="parse"):
+            pass
+
+    def stream(self, encoding="utf8", batch_size=0, workers=0, cache=None):
+        """Yield parsed treatments one at a time and release them afterwards."""
+        parsed = self.parsed(encoding, batch_size, workers, cache)
+        for treatment in tqdm(parsed, total=len(self.treatments), desc="parse"):
+            yield treatment
+            treatment.release()
+
+    def parsed(self, encoding="utf8", batch_size=0, workers=0, cache=None):
+        if workers:
+            yield from self.parse_workers(encoding, batch_size, workers, cache)
+        else:
+            yield from parse_treatments(
+                self.nlp,
+                self.treatments,
+                encoding,
+                batch_size,
+                self.dedupe.over(cache) if self.dedupe else cache,
+                chunk_size=self.chunk_size,
+                prefetch=self.prefetch,
+            )
+
+    def parse_workers(self, encoding="utf8", batch_size=0, workers=2, cache=None):
+        """Spread the parsing over worker processes and gather results in order."""
+        # Long treatments are read and checked for duplicates here
+        local = self.dedupe.over(cache) if self.dedupe else cache
+
+        # Save the pipeline once here instead of racing to save it in every worker
+        if self.pipeline_cache:
+            flora_pipeline.build(
+                cache_dir=self.pipeline_cache, traits=self.traits, model=self.model
+            )
+
+        with Pool(
+            workers,
+            initializer=init_worker,
+            initargs=(cache, self.pipeline_args, bool(self.dedupe)),
+        ) as pool:
+            # Only submit more jobs when earlier results have been handed on, so
+            # results do not pile up here when the writers are slower than workers
+            pending = deque()
+            in_flight = 0
+
+            for treatments, offsets, jobs in self.worker_jobs(
+                encoding, batch_size, local
+            ):
+                results = [pool.apply_async(parse_job, (j,)) for j in jobs]
+                pending.append((treatments, offsets, results))
+                in_flight += len(results)
+
+                while in_flight > workers * JOBS_PER_WORKER:
+                    treatments, offsets, results = pending.popleft()
+                    in_flight -= len(results)
+                    yield from gather(treatments, offsets, results, local)
+
+            while pending:
+                yield from gather(*pending.popleft(), local)
+
+    def worker_jobs(self, encoding="utf8", batch_size=0, cache=None):
+        """
+        Group short treatments into jobs and split long ones into a job per chunk.
+
+        Yield the treatments for each group, the chunk offsets of a long treatment,
+        and the jobs. Long treatments are only read when their jobs are due.
+        """
+        size = batch_size if batch_size else WORKER_CHUNK
+
+        for long, group in groupby(self.treatments, key=self.may_be_long):
+            if not long:
+                while short := list(islice(group, size)):
+                    paths = [t.path for t in short]
+                    job = (
+                        FILES,
+                        paths,
+                        encoding,
+                        batch_size,
+                        self.chunk_size,
+                        self.prefetch,
+                    )
+                    yield short, None, [job]
+                continue
+
+            for treatment in group:
+                treatment.read(encoding=encoding)
+                pieces = []
+                if not (cache and treatment.restore(cache)):
+                    pieces = chunks.split(treatment.text, self.chunk_size)
+                yield (
+                    [treatment],
+                    [o for o, _ in pieces],
+                    [(PIECE, c) for _, c in pieces],
+                )
+
+    def may_be_long(self, treatment) -> bool:
+        # A file has at least as many bytes as its text has characters, so only
+        # bigger files can be long. The ones that are not get a single chunk.
+        return treatment.path.stat().st_size > self.chunk_size
+
+
+def parse_treatments(
+    nlp,
+    treatments,
+    encoding="utf8",
+    batch_size=0,
+    cache=None,
+    *,
+    chunk_size=chunks.CHUNK_SIZE,
+    prefetch=0,
+):
+    """Parse treatments one at a time or with nlp.pipe & yield them as they finish."""
+    # The next treatments are read while the current ones are parsed
+    treatments = read_ahead(treatments, encoding, prefetch)
+
+    if not batch_size:
+        for treatment in treatments:
+            treatment.parse_text(nlp, cache=cache, chunk_size=chunk_size)
+            yield treatment
+        return
+
+    while batch := list(islice(treatments, batch_size)):
+        todo, copies = split_batch(batch, cache)
+        texts = [t.text for t in todo]
+        parsed = chunks.parse(nlp, texts, batch_size=batch_size, size=chunk_size)
+
+        for treatment, traits in zip(todo, parsed, strict=True):
+            treatment.traits = traits
+            if cache:
+                cache.put(treatment.text, treatment.traits)
+
+        # The copies get the traits just put into the cache, unless they did not fit
+        parsed = {t.text: t.traits for t in todo}
+        for treatment in copies:
+            if not treatment.restore(cache):
+                treatment.traits = copy.deepcopy(parsed[treatment.text])
+
+        yield from batch
+
+
+def split_batch(batch, cache=None):
+    """Split a batch into treatments to parse and copies of them to restore later."""
+    if not cache:
+        return batch, []
+
+    todo, copies, texts = [], [], set()
+    for treatment in batch:
+        if treatment.restore(cache):
+            continue
+        if treatment.text in texts:
+            copies.append(treatment)
+        else:
+            texts.add(treatment.text)
+            todo.append(treatment)
+    return todo, copies
+
+
+def build(pipeline_cache=None, gates=None, traits=None, *, model=True):
+    nlp = flora_pipeline.build(cache_dir=pipeline_cache, traits=traits, model=model)
+    return PipeGate(nlp, gates) if gates else nlp
+
+
+def init_worker(cache=None, pipeline_args=None, dedupe=False):  # noqa: FBT002
+    global NLP, CACHE, DEDUPE
+    NLP = build(**pipeline_args)
+    DEDUPE = Dedupe() if dedupe else None
+    CACHE = DEDUPE.over(cache) if dedupe else cache
+
+
+def gather(treatments, offsets, results, cache=None):
+    """Put the results from the workers into the treatments for a job."""
+    if offsets is None:
+        rows, skipped = results[0].get()
+        # Only workers that dedupe skip any, and then the cache here dedupes too
+        if skipped:
+            cache.skipped += skipped
+        for treatment, (text, traits) in zip(treatments, rows, strict=True):
+            treatment.text = text
+            treatment.traits = traits
+            yield treatment
+        return
+
+    # The chunks of a long treatment were parsed by several workers
+    treatment = treatments[0]
+    if offsets:
+        treatment.traits = [
+            t
+            for o, r in zip(offsets, results, strict=True)
+            for t in chunks.shift(r.get(), o)
+        ]
+        if cache:
+            cache.put(treatment.text, treatment.traits)
+    yield treatment
+
+
+def parse_job(job):
+    kind, *args = job
+    return parse_chunk(*args) if kind == FILES else parse_piece(*args)
+
+
+def parse_chunk(paths, encoding, batch_size, chunk_size, prefetch):
+    """
+    Parse a chunk of treatment files in a worker and return only the results.
+
+    Also return how many of them were duplicates that were not parsed again.
+    """
+    chunk = [Treatment(p) for p in paths]
+    skipped = DEDUPE.skipped if DEDUPE else 0
+    parsed = parse_treatments(
+        NLP,
+        chunk,
+        encoding,
+        batch_size,
+        CACHE,
+        chunk_size=chunk_size,
+        prefetch=prefetch,
+    )
+    rows = [(t.text, t.traits) for t in parsed]
+    skipped = DEDUPE.skipped - skipped if DEDUPE else 0
+    return rows, skipped
+
+
+def parse_piece(text):
+    """Parse one chunk of a long treatment in a worker."""
+    doc = NLP(text)
+    return [e._.trait for e in doc.ents]
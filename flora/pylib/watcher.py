@@ -0,0 +1,55 @@
+"""
+Poll the treatment directory for new, changed, and deleted files.
+
+A file is changed when its size or modification time differs from when it was last
+parsed. Curators may still be copying a file when it is first seen, so it is only
+reported once it looks the same on two polls in a row. With a limit, only the same
+slice of the sorted file names that a run without watching would parse is watched.
+"""
+
+from pathlib import Path
+
+Signature = tuple[int, int]
+
+
+class Watcher:
+    def __init__(self, treatment_dir: Path, limit: int = 0, offset: int = 0):
+        self.treatment_dir = treatment_dir
+        self.limit = limit
+        self.offset = offset
+        self.parsed: dict[Path, Signature] = {}  # Signatures when files were parsed
+        self.seen: dict[Path, Signature] = self.scan()  # And on the last poll
+
+    def scan(self) -> dict[Path, Signature]:
+        paths = sorted(self.treatment_dir.glob("*"))
+        if self.limit:
+            paths = paths[self.offset : self.limit + self.offset]
+
+        files = {}
+        for path in paths:
+            try:
+                stat = path.stat()
+            except FileNotFoundError:  # Deleted while scanning
+                continue
+            if path.is_file():
+                files[path] = (stat.st_size, stat.st_mtime_ns)
+        return files
+
+    def poll(self) -> tuple[list[Path], list[Path]]:
+        """Get the files that changed since they were parsed and the deleted ones."""
+        now = self.scan()
+
+        changed = [
+            p
+            for p, sig in now.items()
+            if self.parsed.get(p) != sig and self.seen.get(p) == sig
+        ]
+        deleted = [p for p in self.parsed if p not in now]
+
+        for path in changed:
+            self.parsed[path] = now[path]
+        for path in deleted:
+            del self.parsed[path]
+
+        self.seen = now
+        return changed, deleted
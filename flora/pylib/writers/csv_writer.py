@@ -1,8 +1,14 @@
+import csv
+import heapq
+import pickle
 import sys
+import tempfile
 from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from operator import itemgetter
 from pathlib import Path
+from typing import Any
 
-import pandas as pd
 from traiter.pylib.darwin_core import DarwinCore
 
 from flora.pylib.treatments import Treatments
@@ -10,54 +16,133 @@ from flora.pylib.treatments import Treatments
 TAXON = "dwc:scientificName"
 FIRST = ["taxon", "treatment"]
 
+RUN_SIZE = 10_000  # Rows sorted in memory before they are spilled to a file
+SORT_KEY = itemgetter(0, 1)  # Taxon and then the order the rows were added
+
 
 def write_csv(treatments: Treatments, csv_file: Path):
-    rows = []
-    for treatment in treatments:
-        grouped = group_traits(treatment)
-        flattened = flatten_traits(grouped)
-        formatted = remove_duplicates(flattened)
-        add_row_fields(treatment, formatted)
-        rows.append(formatted)
+    with CsvWriter(csv_file) as writer:
+        for treatment in treatments:
+            writer.add(treatment)
+
+
+def format_row(treatment) -> dict[tuple, dict]:
+    grouped = group_traits(treatment)
+    flattened = flatten_traits(grouped)
+    formatted = remove_duplicates(flattened)
+    add_row_fields(treatment, formatted)
+    return formatted
+
+
+def write_rows(rows: Iterable[dict[tuple, dict]], csv_file: Path):
+    with CsvWriter(csv_file) as writer:
+        for row in rows:
+            writer.add_row(row)
+
 
-    max_indexes = get_max_indexes(rows)
-    rows = number_columns(rows, max_indexes)
+class CsvWriter:
+    """
+    Write rows sorted by taxon without keeping all of them in memory.
 
-    df = pd.DataFrame(rows)
+    Rows are sorted in runs that are spilled to temporary files and merged when the
+    CSV is written. The column names depend on how often each trait repeats in any
+    row, so they are collected as the rows are added.
+    """
 
-    columns = FIRST
-    columns += sorted(c for c in df.columns if c not in FIRST)
-    df = df[columns]
+    def __init__(self, csv_file: Path, run_size: int = RUN_SIZE):
+        self.csv_file = csv_file
+        self.run_size = run_size
+        self.temp_dir = None
+        self.runs: list[Path] = []
+        self.buffer: list[tuple] = []
+        self.count = 0
+        self.max_indexes = defaultdict(int)
+        self.fields: set[tuple] = set()
 
-    df = df.sort_values(by="taxon")
+    def __enter__(self):
+        return self
 
-    df.to_csv(csv_file, index=False)
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.finish()
+        else:
+            self.cleanup()
 
+    def add(self, treatment) -> None:
+        self.add_row(format_row(treatment))
 
-def number_columns(rows, max_indexes):
-    new_rows = []
-    for row in rows:
+    def add_row(self, row: dict[tuple, dict]) -> None:
+        for (key, i), value in row.items():
+            self.max_indexes[key] = max(i, self.max_indexes[key])
+            self.fields.update((key, i, col) for col in value)
+
+        # The count keeps rows with the same taxon in the order they were added
+        self.buffer.append((row[("taxon", 1)]["taxon"], self.count, row))
+        self.count += 1
+
+        if len(self.buffer) >= self.run_size:
+            self.spill()
+
+    def spill(self) -> None:
+        if not self.temp_dir:
+            self.temp_dir = tempfile.TemporaryDirectory(prefix="csv_writer_")
+
+        self.buffer.sort(key=SORT_KEY)
+
+        path = Path(self.temp_dir.name) / f"run_{len(self.runs)}.pickle"
+        with path.open("wb") as f:
+            for item in self.buffer:
+                pickle.dump(item, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        self.runs.append(path)
+        self.buffer = []
+
+    def finish(self) -> None:
+        """Merge the sorted runs into the CSV file and remove them."""
+        try:
+            self.buffer.sort(key=SORT_KEY)
+            runs = [read_run(p) for p in self.runs]
+            merged = heapq.merge(*runs, self.buffer, key=SORT_KEY)
+
+            names = {self.column_name(k, i, c) for k, i, c in self.fields}
+            columns = [*FIRST, *sorted(c for c in names if c not in FIRST)]
+
+            with self.csv_file.open("w", newline="") as f:
+                writer = csv.DictWriter(f, fieldnames=columns)
+                writer.writeheader()
+                for *_, row in merged:
+                    writer.writerow(self.number_columns(row))
+        finally:
+            self.cleanup()
+
+    def cleanup(self) -> None:
+        if self.temp_dir:
+            self.temp_dir.cleanup()
+            self.temp_dir = None
+        self.runs = []
+        self.buffer = []
+
+    def column_name(self, key: str, i: int, col: str) -> str:
+        parts = col.split("_")
+        if self.max_indexes[key] > 1:
+            parts.insert(1, str(i))
+        return "_".join(parts)
+
+    def number_columns(self, row: dict[tuple, dict]) -> dict[str, Any]:
         new_row = {}
         for (key, i), value in row.items():
-            use_index = max_indexes[key] > 1
             for col, val in value.items():
-                parts = col.split("_")
-                if use_index:
-                    parts.insert(1, str(i))
-                name = "_".join(parts)
-
-                new_row[name] = val
-
-        new_rows.append(new_row)
-    return new_rows
+                new_row[self.column_name(key, i, col)] = val
+        return new_row
 
 
-def get_max_indexes(rows):
-    max_index = defaultdict(int)
-    for row in rows:
-        for key, i in row:
-            max_index[key] = max(i, max_index[key])
-    return max_index
+def read_run(path: Path) -> Iterator[tuple]:
+    with path.open("rb") as f:
+        while True:
+            try:
+                yield pickle.load(f)  # noqa: S301
+            except EOFError:
+                return
 
 
 def remove_duplicates(flattened):
@@ -97,10 +182,8 @@ def add_row_fields(treatment, formatted: dict[tuple, dict]) -> None:
 
 def group_traits(treatment) -> dict[str, list[DarwinCore]]:
     grouped: dict[str, list[DarwinCore]] = defaultdict(list)
-    for trait in treatment.traits:
-        dwc = DarwinCore()
-        dwc_trait = trait.to_dwc(dwc)
-        grouped[trait.key].append(dwc_trait)
+    for trait, dwc in zip(treatment.traits, treatment.dwc, strict=True):
+        grouped[trait.key].append(dwc)
     return grouped
 
 
@@ -108,13 +191,17 @@ def flatten_traits(grouped) -> dict[str, list]:
     flattened = defaultdict(list)
     for name, dwc_list in grouped.items():
         for dwc_value in dwc_list:
-            new = {}
-            flat = dwc_value.flatten()
-            for key, value in flat.items():
-                if isinstance(value, dict):
-                    for field, val in value.items():
-                        new[f"{key}_{field}"] = val
-                else:
-                    new[key] = value
-            flattened[name].append(new)
+            flattened[name].append(flatten_dwc(dwc_value))
     return flattened
+
+
+def flatten_dwc(dwc_value) -> dict[str, Any]:
+    new = {}
+    flat = dwc_value.flatten()
+    for key, value in flat.items():
+        if isinstance(value, dict):
+            for field, val in value.items():
+                new[f"{key}_{field}"] = val
+        else:
+            new[key] = value
+    return new
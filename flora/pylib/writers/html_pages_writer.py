@@ -0,0 +1,109 @@
+"""
+Write the HTML report as an index page and pages with a few treatments each.
+
+One HTML file for a whole flora can be hundreds of megabytes, and browsers freeze
+while opening it. The pages go into a directory next to the index page and each one
+is rendered as soon as it has all of its treatments. The index page has a table of
+contents that finds treatments by taxon or treatment ID in the browser and links to
+the page that has them. Everything is linked with plain relative links, so the
+report also works when it is opened straight from disk.
+"""
+
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from typing import NamedTuple
+
+from tqdm import tqdm
+
+from flora.pylib.treatment import Treatment
+from flora.pylib.writers import csv_writer
+from flora.pylib.writers.html_writer import TOTAL, HtmlWriter, HtmlWriterRow
+
+PAGE_SIZE = 100  # Treatments per page
+INDEX_TEMPLATE = "treatment_html_index.html"
+PAGES = "Pages:"
+
+
+class Page(NamedTuple):
+    href: str
+    first: str
+    last: str
+
+
+class HtmlPagesWriter(HtmlWriter):
+    def __init__(
+        self, template_dir, template, html_file, spotlight="", *, page_size=PAGE_SIZE
+    ):
+        super().__init__(template_dir, template, html_file, spotlight)
+        self.page_size = page_size
+
+    @property
+    def pages_dir(self):
+        return self.html_file.with_name(f"{self.html_file.stem}_pages")
+
+    def write(self, treatments: Iterable[Treatment], args=None):
+        """Render each page as soon as it is full and the index page at the end."""
+        rows = (self.format_row(t) for t in tqdm(treatments, desc="write"))
+        self.write_pages(rows, args)
+
+    def finish(self, args=None):
+        self.write_pages(iter(self.formatted), args)
+
+    def format_row(self, treat) -> HtmlWriterRow:
+        row = super().format_row(treat)
+        row.taxon = get_taxon(treat)
+        return row
+
+    def write_pages(self, rows: Iterator[HtmlWriterRow], args=None) -> None:
+        self.pages_dir.mkdir(parents=True, exist_ok=True)
+        for old in self.pages_dir.glob("page_*.html"):
+            old.unlink()
+
+        pages = []
+        contents = []
+
+        # Hold one page back to know if it needs a link to the next one
+        page = list(islice(rows, self.page_size))
+        while page:
+            following = list(islice(rows, self.page_size))
+            number = len(pages) + 1
+            name = page_name(number)
+
+            self.render(
+                self.template,
+                self.pages_dir / name,
+                file_name=f"{self.file_name(args)}: page {number}",
+                image_dir="",
+                rows=page,
+                summary={TOTAL: len(page)},
+                nav={
+                    "index": f"../{self.html_file.name}",
+                    "prev": page_name(number - 1) if number > 1 else "",
+                    "next": page_name(number + 1) if following else "",
+                },
+            )
+
+            href = f"{self.pages_dir.name}/{name}"
+            pages.append(Page(href, page[0].treatment_id, page[-1].treatment_id))
+            contents += [[r.taxon, r.treatment_id, href] for r in page]
+            page = following
+
+        self.render(
+            INDEX_TEMPLATE,
+            self.html_file,
+            file_name=self.file_name(args),
+            summary={TOTAL: len(contents), PAGES: len(pages)},
+            pages=pages,
+            contents=sorted(contents),
+        )
+
+
+def page_name(number: int) -> str:
+    return f"page_{number:04d}.html"
+
+
+def get_taxon(treat) -> str:
+    for dwc in treat.dwc:
+        if taxon := dwc.flatten().get(csv_writer.TAXON):
+            return taxon
+    return "unknown"
@@ -1,19 +1,22 @@
 import html
 import itertools
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import datetime
+from pathlib import Path
 from typing import Any, NamedTuple
 
 import jinja2
 from tqdm import tqdm
-from traiter.pylib.darwin_core import DYN, DarwinCore
+from traiter.pylib.darwin_core import DYN
 
-from flora.pylib.label import Label
-from flora.pylib.treatments import Treatments
+from flora.pylib.treatment import Treatment
 
 COLOR_COUNT = 14
 BACKGROUNDS = itertools.cycle([f"cc{i}" for i in range(COLOR_COUNT)])
 
+TOTAL = "Total treatments:"
+
 
 class TraitRow(NamedTuple):
     label: str
@@ -23,7 +26,7 @@ class TraitRow(NamedTuple):
 class Sortable(NamedTuple):
     key: str
     start: int
-    dwc: str
+    dwc: dict
     title: str
 
 
@@ -32,6 +35,7 @@ class HtmlWriterRow:
     formatted_text: str
     formatted_traits: list[TraitRow] = field(default_factory=list)
     treatment_id: str = ""
+    taxon: str = ""
 
 
 class CssClasses:
@@ -55,29 +59,50 @@ class HtmlWriter:
         self.css_classes = CssClasses(spotlight)
         self.formatted = []
 
-    def write(self, treatments: Treatments, args=None):
-        for treat in tqdm(treatments.treatments, desc="write"):
-            self.formatted.append(
-                HtmlWriterRow(
-                    treatment_id=treat.path.stem,
-                    formatted_text=self.format_text(treat, exclude=["trs"]),
-                    formatted_traits=self.format_traits(treat),
-                ),
-            )
+    def write(self, treatments: Iterable[Treatment], args=None):
+        """Render the report while the treatments are still coming in."""
+        summary = {TOTAL: 0}
+        rows = self.rows(tqdm(treatments, desc="write"), summary)
+        self.write_template(self.file_name(args), summary=summary, rows=rows)
+
+    def rows(self, treatments: Iterable[Treatment], summary: dict):
+        for treat in treatments:
+            summary[TOTAL] += 1
+            yield self.format_row(treat)
+
+    def add(self, treat):
+        self.formatted.append(self.format_row(treat))
+
+    def format_row(self, treat) -> HtmlWriterRow:
+        return HtmlWriterRow(
+            treatment_id=treat.path.stem,
+            formatted_text=self.format_text(treat, exclude=["trs"]),
+            formatted_traits=self.format_traits(treat),
+        )
 
-        summary = {
-            "Total treatments:": len(treatments.treatments),
-        }
+    def update(self, treat):
+        """Add a treatment or replace the row it got when it was parsed before."""
+        self.remove(treat.path.stem)
+        self.add(treat)
+        self.formatted.sort(key=lambda r: r.treatment_id)
 
-        self.write_template(args.html_file, summary=summary)
+    def remove(self, treatment_id: str):
+        self.formatted = [r for r in self.formatted if r.treatment_id != treatment_id]
 
-    def format_text(self, row: Label, exclude=None):
+    def finish(self, args=None):
+        summary = {TOTAL: len(self.formatted)}
+        self.write_template(self.file_name(args), summary=summary)
+
+    def file_name(self, args=None):
+        return args.html_file if args else self.html_file
+
+    def format_text(self, row: Treatment, exclude=None):
         """Wrap traits in the text with <spans> that can be formatted with CSS."""
         exclude = exclude if exclude else []
         frags = []
         prev = 0
 
-        for trait in row.traits:
+        for trait, dwc in zip(row.traits, row.dwc, strict=True):
             if trait._trait in exclude:
                 continue
 
@@ -89,10 +114,7 @@ class HtmlWriter:
 
             cls = self.css_classes[trait.key]
 
-            dwc = DarwinCore()
-            dwc = trait.to_dwc(dwc).to_dict()
-
-            title = ", ".join(f"{k}:&nbsp;{v}" for k, v in dwc.items())
+            title = ", ".join(f"{k}:&nbsp;{v}" for k, v in dwc.to_dict().items())
 
             frags.extend(
                 (
@@ -114,13 +136,12 @@ class HtmlWriter:
         traits = []
 
         sortable = []
-        for trait in row.traits:
-            dwc = DarwinCore()
+        for trait, dwc in zip(row.traits, row.dwc, strict=True):
             sortable.append(
                 Sortable(
                     trait.key,
                     trait.start,
-                    trait.to_dwc(dwc),
+                    dwc.to_dict(),
                     row.text[trait.start : trait.end],
                 ),
             )
@@ -133,7 +154,7 @@ class HtmlWriter:
             trait_list = []
             for trait in grouped:
                 fields = {}
-                dwc_dict = trait.dwc.to_dict()
+                dwc_dict = trait.dwc
                 for k, v in dwc_dict.items():
                     fields = v if k == DYN else dwc_dict
                 fields = ", ".join(
@@ -150,20 +171,26 @@ class HtmlWriter:
 
         return traits
 
-    def write_template(self, in_file_name="", image_dir="", summary=None):
-        summary = summary if summary else {}
+    def write_template(self, in_file_name="", image_dir="", summary=None, rows=None):
+        self.render(
+            self.template,
+            self.html_file,
+            file_name=in_file_name,
+            image_dir=image_dir,
+            rows=self.formatted if rows is None else rows,
+            summary=summary if summary else {},
+        )
+
+    def render(self, template: str, html_file: Path, **context) -> None:
         env = jinja2.Environment(
             loader=jinja2.FileSystemLoader(self.template_dir),
             autoescape=True,
         )
 
-        template = env.get_template(self.template).render(
-            now=datetime.strftime(datetime.now(), "%Y-%m-%d %H:%M"),
-            file_name=in_file_name,
-            image_dir=image_dir,
-            rows=self.formatted,
-            summary=summary,
+        # Stream the rendered template into the file instead of building one string
+        stream = env.get_template(template).stream(
+            now=datetime.strftime(datetime.now(), "%Y-%m-%d %H:%M"), **context
         )
 
-        with self.html_file.open("w") as html_file:
-            html_file.write(template)
+        with html_file.open("w") as out:
+            stream.dump(out)
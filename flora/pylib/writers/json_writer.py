@@ -1,8 +1,7 @@
 import json
 from pathlib import Path
 
-from traiter.pylib.darwin_core import DarwinCore
-
+from flora.pylib.treatment import Treatment
 from flora.pylib.treatments import Treatments
 
 
@@ -10,11 +9,30 @@ def write_json(treatments: Treatments, json_dir: Path) -> None:
     json_dir.mkdir(parents=True, exist_ok=True)
 
     for treatment in treatments:
-        dwc = DarwinCore()
-        _ = [t.to_dwc(dwc) for t in treatment.traits]
-
-        path = json_dir / f"{treatment.path.stem}.json"
-        with path.open("w") as f:
-            output = dwc.to_dict()
-            output["text"] = treatment.text
-            json.dump(output, f, indent=4)
+        write_treatment(treatment, json_dir)
+
+
+class JsonWriter:
+    """Write a JSON file for each treatment as it is parsed."""
+
+    def __init__(self, json_dir: Path):
+        self.json_dir = json_dir
+        self.json_dir.mkdir(parents=True, exist_ok=True)
+
+    def add(self, treatment: Treatment) -> None:
+        write_treatment(treatment, self.json_dir)
+
+    def finish(self) -> None:
+        pass
+
+
+def write_treatment(treatment: Treatment, json_dir: Path) -> None:
+    path = json_dir / f"{treatment.path.stem}.json"
+    with path.open("w") as f:
+        output = to_dict(treatment)
+        output["text"] = treatment.text
+        json.dump(output, f, indent=4)
+
+
+def to_dict(treatment: Treatment) -> dict:
+    return treatment.dwc_dict()
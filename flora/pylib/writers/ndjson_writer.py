@@ -0,0 +1,69 @@
+"""
+Write all treatments to a single newline delimited JSON file.
+
+Each line is a compact JSON object with the same DarwinCore fields as the per
+treatment JSON files, plus the treatment name. A file name ending in .gz is gzip
+compressed and one ending in .xz or .lzma is lzma compressed.
+"""
+
+import gzip
+import hashlib
+import json
+import lzma
+from collections.abc import Iterable
+from pathlib import Path
+from typing import TextIO
+
+from flora.pylib.treatment import Treatment
+from flora.pylib.treatments import Treatments
+from flora.pylib.writers import json_writer
+
+OPENERS = {
+    ".gz": gzip.open,
+    ".xz": lzma.open,
+    ".lzma": lzma.open,
+}
+
+
+def write_ndjson(
+    treatments: Treatments, ndjson_file: Path, *, text_hash: bool = False
+) -> None:
+    write_lines((to_line(t, text_hash=text_hash) for t in treatments), ndjson_file)
+
+
+def write_lines(lines: Iterable[str], ndjson_file: Path) -> None:
+    with open_output(ndjson_file) as f:
+        for line in lines:
+            f.write(line)
+
+
+class NdjsonWriter:
+    def __init__(self, ndjson_file: Path, *, text_hash: bool = False):
+        self.file = open_output(ndjson_file)
+        self.text_hash = text_hash
+
+    def add(self, treatment: Treatment) -> None:
+        self.file.write(to_line(treatment, text_hash=self.text_hash))
+
+    def finish(self) -> None:
+        self.file.close()
+
+
+def open_output(ndjson_file: Path) -> TextIO:
+    opener = OPENERS.get(ndjson_file.suffix)
+    if opener:
+        return opener(ndjson_file, "wt", encoding="utf8")
+    return ndjson_file.open("w", encoding="utf8")
+
+
+def to_line(treatment: Treatment, *, text_hash: bool = False) -> str:
+    """Format the treatment as one line of JSON."""
+    output = {"treatment": treatment.path.stem}
+    output |= json_writer.to_dict(treatment)
+
+    if text_hash:
+        output["text_sha256"] = hashlib.sha256(treatment.text.encode()).hexdigest()
+    else:
+        output["text"] = treatment.text
+
+    return json.dumps(output, ensure_ascii=False, separators=(",", ":")) + "\n"
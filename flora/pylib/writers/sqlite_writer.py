@@ -0,0 +1,125 @@
+"""
+Write traits to an SQLite database that can be queried without loading the CSV.
+
+Every trait gets a row in the traits table with its treatment, the treatment's
+taxon, the trait key, and its offsets in the text. Its flattened DarwinCore fields
+go into the fields table, one row per field. Numbers are stored as numbers, so a
+query like "leaf lengths over 10 cm" can use the index on field & value.
+"""
+
+import json
+import sqlite3
+from pathlib import Path
+
+from flora.pylib.treatments import Treatments
+from flora.pylib.writers import csv_writer
+
+BATCH = 10_000  # Traits inserted with each executemany
+
+SCHEMA = """
+    create table if not exists traits (
+        trait_id  integer primary key,
+        treatment text,
+        taxon     text,
+        trait     text,
+        start     integer,
+        end       integer);
+    create table if not exists fields (
+        trait_id integer references traits (trait_id),
+        field    text,
+        value);
+    """
+
+INDEXES = """
+    create index if not exists traits_treatment on traits (treatment);
+    create index if not exists traits_taxon on traits (taxon);
+    create index if not exists traits_trait on traits (trait);
+    create index if not exists fields_trait_id on fields (trait_id);
+    create index if not exists fields_field_value on fields (field, value);
+    """
+
+
+def write_sqlite(treatments: Treatments, sqlite_file: Path) -> None:
+    writer = SqliteWriter(sqlite_file)
+    for treatment in treatments:
+        writer.add(treatment)
+    writer.finish()
+
+
+class SqliteWriter:
+    def __init__(self, sqlite_file: Path):
+        sqlite_file.unlink(missing_ok=True)
+        self.cxn = sqlite3.connect(sqlite_file)
+        # The file is rebuilt on every run, so it does not need to survive a crash
+        self.cxn.execute("pragma journal_mode = off")
+        self.cxn.execute("pragma synchronous = off")
+        self.cxn.executescript(SCHEMA)
+        self.trait_id = 0
+        self.traits: list[tuple] = []
+        self.fields: list[tuple] = []
+
+    def add(self, treatment) -> None:
+        rows = [
+            (trait, csv_writer.flatten_dwc(dwc))
+            for trait, dwc in zip(treatment.traits, treatment.dwc, strict=True)
+        ]
+
+        taxon = next(
+            (f[csv_writer.TAXON] for _, f in rows if csv_writer.TAXON in f), "unknown"
+        )
+
+        for trait, fields in rows:
+            self.trait_id += 1
+            self.traits.append(
+                (
+                    self.trait_id,
+                    treatment.path.stem,
+                    taxon,
+                    trait.key,
+                    trait.start,
+                    trait.end,
+                )
+            )
+            self.fields += [(self.trait_id, k, to_value(v)) for k, v in fields.items()]
+
+        if len(self.traits) >= BATCH:
+            self.flush()
+
+    def remove(self, treatment_id: str) -> None:
+        """Delete the traits of a treatment before it is added again."""
+        self.flush()
+        with self.cxn:
+            self.cxn.execute(
+                """delete from fields where trait_id in (
+                    select trait_id from traits where treatment = ?)""",
+                (treatment_id,),
+            )
+            self.cxn.execute("delete from traits where treatment = ?", (treatment_id,))
+
+    def flush(self) -> None:
+        with self.cxn:
+            self.cxn.executemany(
+                "insert into traits values (?, ?, ?, ?, ?, ?)", self.traits
+            )
+            self.cxn.executemany("insert into fields values (?, ?, ?)", self.fields)
+        self.traits = []
+        self.fields = []
+
+    def commit(self) -> None:
+        """Write the remaining traits and index them."""
+        self.flush()
+        # Building the indexes after the bulk insert is faster than updating them
+        self.cxn.executescript(INDEXES)
+
+    def finish(self) -> None:
+        self.commit()
+        self.close()
+
+    def close(self) -> None:
+        self.cxn.close()
+
+
+def to_value(value):
+    if value is None or isinstance(value, str | int | float):
+        return value
+    return json.dumps(value)
@@ -0,0 +1,47 @@
+// Entries are [taxon, treatment ID, page] sorted by taxon
+const contents = JSON.parse(document.getElementById('contents').textContent);
+const found = document.getElementById('found');
+const foundCount = document.getElementById('found-count');
+const MAX_FOUND = 500;
+
+function show(entries) {
+    found.replaceChildren();
+    entries.slice(0, MAX_FOUND).forEach(function([taxon, treatmentId, page]) {
+        const a = document.createElement('a');
+        a.href = `${page}#${encodeURIComponent(treatmentId)}`;
+        a.textContent = `${taxon} (${treatmentId})`;
+        const li = document.createElement('li');
+        li.append(a);
+        found.append(li);
+    });
+    foundCount.textContent = entries.length > MAX_FOUND
+        ? `Showing ${MAX_FOUND} of ${entries.length} treatments`
+        : `${entries.length} treatments`;
+}
+
+document.getElementById('find')
+    .addEventListener('input', function(event) {
+        const query = event.target.value.trim().toLowerCase();
+        if (! query) { show([]); return; }
+        show(contents.filter(function([taxon, treatmentId]) {
+            return taxon.toLowerCase().includes(query)
+                || treatmentId.toLowerCase().includes(query);
+        }));
+    });
+
+const letters = document.getElementById('letters');
+[...new Set(contents.map(function([taxon]) { return taxon.charAt(0).toUpperCase(); }))]
+    .forEach(function(letter) {
+        const button = document.createElement('button');
+        button.textContent = letter;
+        button.dataset.letter = letter;
+        letters.append(button);
+    });
+
+letters.addEventListener('click', function(event) {
+    if (! event.target.matches('button')) { return; }
+    const letter = event.target.dataset.letter;
+    show(contents.filter(function([taxon]) {
+        return taxon.charAt(0).toUpperCase() === letter;
+    }));
+});
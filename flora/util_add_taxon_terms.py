@@ -22,10 +22,12 @@ from zipfile import ZIP_DEFLATED, ZipFile
 
 import regex
 from tqdm import tqdm
+from traiter.pylib import taxon_util
 from traiter.pylib import term_util as tu
 from traiter.pylib.rules import terms as t_terms
 
 from flora.pylib import const, log
+from flora.pylib.lexicon import Lexicon
 from flora.pylib.rules import terms
 
 ITIS_SPECIES_ID = 220
@@ -152,11 +154,16 @@ class Taxa:
 def main():
     log.started()
 
+    args = parse_args()
+
+    if args.lexicon_only:
+        write_lexicons()
+        log.finished()
+        return
+
     ranks = Ranks()
     taxa = Taxa(ranks)
 
-    args = parse_args()
-
     read_taxa(args, taxa)
 
     taxa.remove_problem_taxa(args.show_rejected)
@@ -166,6 +173,7 @@ def main():
     sort_ranks(counts, records, taxa)
 
     write_csv(records)
+    write_lexicons()
 
     log.finished()
 
@@ -245,6 +253,21 @@ def write_csv(rows):
         zippy.write(binomial_csv, arcname=binomial_csv.name)
 
 
+def write_lexicons():
+    """Build memory-mapped lexicons from the term zip files for fast lookups."""
+    logging.info("Writing lexicons")
+    monomial_zip = Path(terms.__file__).parent / "monomial_terms.zip"
+    binomial_zip = Path(terms.__file__).parent / "binomial_terms.zip"
+
+    if monomial_zip.exists():
+        ranks = tu.look_up_table(monomial_zip, "ranks")
+        Lexicon.write(monomial_zip.with_suffix(".lex"), ranks.items(), monomial_zip)
+
+    if binomial_zip.exists():
+        abbrevs = taxon_util.abbrev_binomial_term(binomial_zip)
+        Lexicon.write(binomial_zip.with_suffix(".lex"), abbrevs.items(), binomial_zip)
+
+
 def read_taxa(args, taxa):
     if args.itis_db:
         read_itis_taxa(args.itis_db, taxa)
@@ -333,6 +356,13 @@ def parse_args():
         help="""Get even more taxa from this CSV file.""",
     )
 
+    arg_parser.add_argument(
+        "--lexicon-only",
+        action="store_true",
+        help="""Only rebuild the memory-mapped lexicon files from the existing taxon
+            term zip files.""",
+    )
+
     arg_parser.add_argument(
         "--show-rejected",
         action="store_true",
@@ -0,0 +1,67 @@
+import argparse
+import contextlib
+import io
+import unittest
+
+from flora import benchmark
+
+ARGS = argparse.Namespace(
+    max_slowdown=0.10, max_build_slowdown=0.25, max_rss_growth=0.10
+)
+
+BASELINE = {
+    "docs_per_sec": 100.0,
+    "tokens_per_sec": 10_000.0,
+    "build_secs": 10.0,
+    "peak_rss_mb": 1_000.0,
+}
+
+
+def compare(current: dict, baseline: dict | None = None) -> list[str]:
+    baseline = {"pipelines": {"flora": baseline if baseline else BASELINE}}
+    report = {"pipelines": {"flora": BASELINE | current}}
+    with contextlib.redirect_stdout(io.StringIO()):
+        return benchmark.compare(baseline, report, ARGS)
+
+
+class TestBenchmark(unittest.TestCase):
+    def test_benchmark_01(self):
+        """Nothing is flagged when every metric stays within its threshold."""
+        self.assertEqual(compare({"docs_per_sec": 95.0, "build_secs": 12.0}), [])
+
+    def test_benchmark_02(self):
+        """Lower throughput is a regression."""
+        self.assertEqual(compare({"docs_per_sec": 80.0}), ["flora docs_per_sec"])
+
+    def test_benchmark_03(self):
+        """Higher build time and memory are regressions."""
+        self.assertEqual(
+            compare({"build_secs": 13.0, "peak_rss_mb": 1_200.0}),
+            ["flora build_secs", "flora peak_rss_mb"],
+        )
+
+    def test_benchmark_04(self):
+        """Improvements are never regressions."""
+        current = {
+            "docs_per_sec": 200.0,
+            "tokens_per_sec": 20_000.0,
+            "build_secs": 1.0,
+            "peak_rss_mb": 500.0,
+        }
+        self.assertEqual(compare(current), [])
+
+    def test_benchmark_05(self):
+        """A pipeline without a baseline is skipped with a warning."""
+        report = {"pipelines": {"mimosa": BASELINE}}
+        with (
+            self.assertLogs(level="WARNING"),
+            contextlib.redirect_stdout(io.StringIO()),
+        ):
+            regressions = benchmark.compare({"pipelines": {}}, report, ARGS)
+        self.assertEqual(regressions, [])
+
+    def test_benchmark_06(self):
+        """A metric that was zero in the baseline is not compared."""
+        self.assertEqual(
+            compare({"docs_per_sec": 1.0}, BASELINE | {"docs_per_sec": 0}), []
+        )
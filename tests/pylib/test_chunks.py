@@ -0,0 +1,42 @@
+import unittest
+
+from traiter.pylib.util import compress
+
+from flora.pylib import chunks
+from tests.setup import PIPELINE, parse
+
+TEXT = compress(
+    """
+    Leaf (12-)23-34 × 45-56 cm. Petals 5, white to pale pink, glabrous; sepals
+    3-5 mm. Astragalus cobrensis A. Gray var. maguirei Kearney. Stems often
+    caespitose.
+    """
+)
+
+
+class TestChunks(unittest.TestCase):
+    def test_chunks_01(self):
+        """Chunks are cut at sentence ends and their offsets point into the text."""
+        pieces = chunks.split(TEXT, size=60)
+        self.assertGreater(len(pieces), 1)
+        for offset, chunk in pieces:
+            self.assertLessEqual(len(chunk), 60)
+            self.assertEqual(TEXT[offset : offset + len(chunk)], chunk)
+            self.assertTrue(chunk.endswith("."))
+
+    def test_chunks_02(self):
+        """Initials in a taxon name do not end a chunk."""
+        pieces = chunks.split(TEXT, size=80)
+        self.assertTrue(any("A. Gray var. maguirei" in c for _, c in pieces))
+
+    def test_chunks_03(self):
+        """Traits from chunks have the same offsets as traits from the whole text."""
+        traits = chunks.parse(PIPELINE, [TEXT], size=60)[0]
+        self.assertEqual(traits, parse(TEXT))
+
+    def test_chunks_04(self):
+        """Sentences are cut at every sentence end and keep their offsets."""
+        pieces = chunks.sentences(TEXT)
+        self.assertEqual(len(pieces), 4)
+        for offset, sentence in pieces:
+            self.assertEqual(TEXT[offset : offset + len(sentence)], sentence)
@@ -0,0 +1,60 @@
+import csv
+import tempfile
+import unittest
+from pathlib import Path
+
+from flora.pylib.writers.csv_writer import CsvWriter
+
+
+def row(taxon, treatment, colors):
+    formatted = {
+        ("taxon", 1): {"taxon": taxon},
+        ("treatment", 1): {"treatment": treatment},
+    }
+    for i, color in enumerate(colors, 1):
+        formatted[("flowerColor", i)] = {"dwc:flowerColor": color}
+    return formatted
+
+
+ROWS = [
+    row("Cuscuta", "t1", ["red"]),
+    row("Astragalus", "t2", ["white", "pink"]),
+    row("Cuscuta", "t3", []),
+    row("Abies", "t4", ["blue"]),
+    row("Astragalus", "t5", ["green"]),
+]
+
+
+class TestCsvWriter(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.csv_file = Path(self.temp_dir.name) / "traits.csv"
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def write(self, run_size):
+        with CsvWriter(self.csv_file, run_size=run_size) as writer:
+            for r in ROWS:
+                writer.add_row(r)
+        with self.csv_file.open() as f:
+            return list(csv.reader(f))
+
+    def test_csv_writer_01(self):
+        """Rows are sorted by taxon and keep their order within a taxon."""
+        rows = self.write(run_size=2)
+        self.assertEqual(
+            rows,
+            [
+                ["taxon", "treatment", "dwc:flowerColor_1", "dwc:flowerColor_2"],
+                ["Abies", "t4", "blue", ""],
+                ["Astragalus", "t2", "white", "pink"],
+                ["Astragalus", "t5", "green", ""],
+                ["Cuscuta", "t1", "red", ""],
+                ["Cuscuta", "t3", "", ""],
+            ],
+        )
+
+    def test_csv_writer_02(self):
+        """Spilling rows to temporary files does not change the output."""
+        self.assertEqual(self.write(run_size=1), self.write(run_size=1000))
@@ -0,0 +1,56 @@
+import unittest
+
+from flora.pylib.dedupe import Dedupe
+
+
+class DictCache:
+    """Stand in for the parse cache."""
+
+    def __init__(self):
+        self.entries = {}
+
+    def get(self, text):
+        return self.entries.get(text)
+
+    def put(self, text, traits):
+        self.entries[text] = traits
+
+
+class TestDedupe(unittest.TestCase):
+    def test_dedupe_01(self):
+        """A text is only parsed once and every copy gets its traits."""
+        dedupe = Dedupe()
+        self.assertIsNone(dedupe.get("Petals 5."))
+        dedupe.put("Petals 5.", [{"count": 5}])
+        self.assertEqual(dedupe.get("Petals 5."), [{"count": 5}])
+        self.assertEqual(dedupe.get("Petals 5."), [{"count": 5}])
+        self.assertEqual(dedupe.skipped, 2)
+
+    def test_dedupe_02(self):
+        """Copies do not share trait objects."""
+        dedupe = Dedupe()
+        dedupe.put("Petals 5.", [{"count": 5}])
+        self.assertIsNot(dedupe.get("Petals 5."), dedupe.get("Petals 5."))
+
+    def test_dedupe_03(self):
+        """Texts from the parse cache are not counted as duplicates the first time."""
+        cache = DictCache()
+        cache.put("Petals 5.", [{"count": 5}])
+        dedupe = Dedupe().over(cache)
+        self.assertEqual(dedupe.get("Petals 5."), [{"count": 5}])
+        self.assertEqual(dedupe.skipped, 0)
+        dedupe.put("Sepals 3.", [{"count": 3}])
+        self.assertEqual(cache.get("Sepals 3."), [{"count": 3}])
+
+    def test_dedupe_04(self):
+        """Only the most recently used traits are kept."""
+        dedupe = Dedupe()
+        dedupe.put("t1", ["x" * 100])
+        dedupe.max_bytes = dedupe.total * 2.5
+        dedupe.put("t2", ["x" * 100])
+        dedupe.get("t1")  # Now t2 is the oldest
+        dedupe.put("t3", ["x" * 100])
+        self.assertIsNone(dedupe.get("t2"))
+        self.assertEqual(dedupe.get("t1"), ["x" * 100])
+        self.assertEqual(dedupe.get("t3"), ["x" * 100])
+        self.assertLessEqual(dedupe.total, dedupe.max_bytes)
@@ -0,0 +1,71 @@
+import json
+import unittest
+
+from flora.pylib import const
+from flora.pylib.writers.html_pages_writer import HtmlPagesWriter
+from tests.setup import temp_dir, treatments
+
+
+class TestHtmlPagesWriter(unittest.TestCase):
+    def setUp(self):
+        dir_ = temp_dir(self)
+        self.html_file = dir_ / "report.html"
+        self.pages_dir = dir_ / "report_pages"
+
+    def writer(self, page_size):
+        return HtmlPagesWriter(
+            template_dir=f"{const.ROOT_DIR}/flora/pylib/writers/templates",
+            template="treatment_html_writer.html",
+            html_file=self.html_file,
+            page_size=page_size,
+        )
+
+    def contents(self):
+        html = self.html_file.read_text()
+        blob = html.split('type="application/json">')[1].split("</script>")[0]
+        return json.loads(blob)
+
+    def test_html_pages_writer_01(self):
+        """Every page gets page size treatments and the last one gets the rest."""
+        self.writer(2).write(treatments())
+        pages = sorted(p.name for p in self.pages_dir.glob("*"))
+        self.assertEqual(pages, ["page_0001.html", "page_0002.html"])
+        first = (self.pages_dir / "page_0001.html").read_text()
+        self.assertIn('id="t1"', first)
+        self.assertIn('id="t2"', first)
+        self.assertNotIn('id="t3"', first)
+
+    def test_html_pages_writer_02(self):
+        """Pages link to the index page and to the pages next to them."""
+        self.writer(1).write(treatments())
+        middle = (self.pages_dir / "page_0002.html").read_text()
+        self.assertIn('href="../report.html"', middle)
+        self.assertIn('href="page_0001.html"', middle)
+        self.assertIn('href="page_0003.html"', middle)
+        last = (self.pages_dir / "page_0003.html").read_text()
+        self.assertNotIn("page_0004.html", last)
+
+    def test_html_pages_writer_03(self):
+        """The contents link every treatment to its page."""
+        self.writer(2).write(treatments())
+        links = {e[1]: e[2] for e in self.contents()}
+        self.assertEqual(
+            links,
+            {
+                "t1": "report_pages/page_0001.html",
+                "t2": "report_pages/page_0001.html",
+                "t3": "report_pages/page_0002.html",
+            },
+        )
+
+    def test_html_pages_writer_04(self):
+        """Pages left over from a longer report are removed."""
+        self.writer(1).write(treatments())
+        writer = self.writer(2)
+        for treatment in treatments():
+            writer.add(treatment)
+        writer.remove("t3")
+        writer.finish()
+        pages = sorted(p.name for p in self.pages_dir.glob("*"))
+        self.assertEqual(pages, ["page_0001.html"])
+        self.assertEqual(len(self.contents()), 2)
@@ -0,0 +1,36 @@
+import unittest
+
+from flora.pylib import const
+from flora.pylib.writers.html_writer import HtmlWriter
+from tests.setup import TEXTS, temp_dir, treatments
+
+
+class TestHtmlWriter(unittest.TestCase):
+    def setUp(self):
+        self.html_file = temp_dir(self) / "report.html"
+        self.writer = HtmlWriter(
+            template_dir=f"{const.ROOT_DIR}/flora/pylib/writers/templates",
+            template="treatment_html_writer.html",
+            html_file=self.html_file,
+        )
+
+    def test_html_writer_01(self):
+        """The report is rendered from an iterator without keeping the rows."""
+        self.writer.write(iter(treatments()))
+        html = self.html_file.read_text()
+        self.assertEqual(self.writer.formatted, [])
+        for name in TEXTS:
+            self.assertIn(f'data-text-id="{name}"', html)
+        self.assertIn('[data-summary="1"]\').textContent = 3;', html)
+        self.assertTrue(html.rstrip().endswith("</html>"))
+
+    def test_html_writer_02(self):
+        """Streaming renders the same rows as adding them one at a time."""
+        self.writer.write(treatments())
+        streamed = self.html_file.read_text()
+        for treatment in treatments():
+            self.writer.add(treatment)
+        self.writer.finish()
+        added = self.html_file.read_text()
+        body = streamed.split("<tbody>")[1].split("</tbody>")[0]
+        self.assertEqual(body, added.split("<tbody>")[1].split("</tbody>")[0])
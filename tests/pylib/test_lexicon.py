@@ -0,0 +1,54 @@
+import tempfile
+import unittest
+from pathlib import Path
+from zipfile import ZipFile
+
+from flora.pylib import term_registry
+from flora.pylib.lexicon import Lexicon, is_current
+from flora.pylib.rules import terms
+from flora.pylib.rules.taxon import lexicon_or_table
+
+MONOMIAL_CSV = Path(terms.__file__).parent / "mock_monomial_terms.csv"
+OTHER_CSV = Path(terms.__file__).parent / "other_taxa.csv"
+
+
+class TestLexicon(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        cls.path = Path(cls.temp_dir.name) / "monomial_terms.lex"
+        cls.table = term_registry.look_up_table(MONOMIAL_CSV, "ranks")
+        Lexicon.write(cls.path, cls.table.items(), MONOMIAL_CSV)
+        cls.lexicon = Lexicon(cls.path)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.temp_dir.cleanup()
+
+    def test_lexicon_01(self):
+        """The lexicon returns the same values as the lookup table."""
+        self.assertEqual(len(self.lexicon), len(self.table))
+        for key, value in self.table.items():
+            self.assertEqual(self.lexicon.get(key), value)
+
+    def test_lexicon_02(self):
+        """Missing keys fall back to the default."""
+        self.assertIsNone(self.lexicon.get("not a taxon"))
+        self.assertEqual(self.lexicon.get("", "none"), "none")
+
+    def test_lexicon_03(self):
+        """The lexicon is only used with the term file it was built from."""
+        self.assertTrue(is_current(self.path, MONOMIAL_CSV))
+        self.assertFalse(is_current(self.path, OTHER_CSV))
+
+    def test_lexicon_04(self):
+        """The lexicon is built from a term zip the first time it is used."""
+        source = Path(self.temp_dir.name) / "monomial_terms.zip"
+        with ZipFile(source, "w") as zippy:
+            zippy.write(MONOMIAL_CSV, arcname="monomial_terms.csv")
+
+        lexicon = lexicon_or_table(source, term_registry.look_up_table, "ranks")
+
+        self.assertIsInstance(lexicon, Lexicon)
+        self.assertTrue(is_current(source.with_suffix(".lex"), source))
+        self.assertEqual(dict(self.table), {k: lexicon[k] for k in self.table})
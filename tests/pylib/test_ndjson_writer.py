@@ -0,0 +1,47 @@
+import gzip
+import json
+import lzma
+import unittest
+
+from flora.pylib.writers.ndjson_writer import NdjsonWriter
+from tests.setup import TEXTS, temp_dir, treatments
+
+
+class TestNdjsonWriter(unittest.TestCase):
+    def setUp(self):
+        self.dir = temp_dir(self)
+
+    def write(self, name, *, text_hash=False):
+        path = self.dir / name
+        writer = NdjsonWriter(path, text_hash=text_hash)
+        for treatment in treatments():
+            writer.add(treatment)
+        writer.finish()
+        return path
+
+    def test_ndjson_writer_01(self):
+        """There is one compact JSON object per line."""
+        path = self.write("traits.ndjson")
+        lines = path.read_text().splitlines()
+        self.assertEqual(len(lines), len(TEXTS))
+        for line, (name, text) in zip(lines, TEXTS.items(), strict=True):
+            obj = json.loads(line)
+            self.assertEqual(obj["treatment"], name)
+            self.assertEqual(obj["text"], text)
+            compact = json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+            self.assertEqual(line, compact)
+
+    def test_ndjson_writer_02(self):
+        """The file is compressed according to its suffix."""
+        plain = self.write("traits.ndjson").read_text()
+        with gzip.open(self.write("traits.ndjson.gz"), "rt") as f:
+            self.assertEqual(f.read(), plain)
+        with lzma.open(self.write("traits.ndjson.xz"), "rt") as f:
+            self.assertEqual(f.read(), plain)
+
+    def test_ndjson_writer_03(self):
+        """A hash can stand in for the text."""
+        path = self.write("traits.ndjson", text_hash=True)
+        obj = json.loads(path.read_text().splitlines()[0])
+        self.assertNotIn("text", obj)
+        self.assertEqual(len(obj["text_sha256"]), 64)
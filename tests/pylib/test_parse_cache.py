@@ -0,0 +1,81 @@
+import itertools
+import pickle
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from flora.pylib.parse_cache import ParseCache
+
+TRAITS = ["x" * 100]
+SIZE = len(pickle.dumps(TRAITS, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+class TestParseCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = Path(self.temp_dir.name)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def cache(self, fingerprint="a"):
+        with patch("flora.pylib.parse_cache.pipeline_fingerprint") as mock:
+            mock.return_value = fingerprint
+            return ParseCache(self.cache_dir)
+
+    def test_parse_cache_01(self):
+        """A text is a miss until its traits are put into the cache."""
+        cache = self.cache()
+        self.assertIsNone(cache.get("Petals 5"))
+        cache.put("Petals 5", TRAITS)
+        self.assertEqual(cache.get("Petals 5"), TRAITS)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_parse_cache_02(self):
+        """Entries from another version of the pipeline are purged."""
+        old = self.cache("a")
+        old.put("Petals 5", TRAITS)
+        old.cxn.close()
+
+        new = self.cache("b")
+        self.assertIsNone(new.get("Petals 5"))
+        self.assertEqual(new.size(), 0)
+
+    def test_parse_cache_03(self):
+        """The least recently used entries are evicted first."""
+        cache = self.cache()
+        cache.max_bytes = SIZE * 3.5
+
+        with patch("flora.pylib.parse_cache.time.time") as mock:
+            mock.side_effect = itertools.count()
+            for text in ("t1", "t2", "t3"):
+                cache.put(text, TRAITS)
+            cache.get("t1")  # Now t2 is the oldest
+            cache.put("t4", TRAITS)
+
+        self.assertIsNone(cache.get("t2"))
+        for text in ("t1", "t3", "t4"):
+            self.assertEqual(cache.get(text), TRAITS)
+        self.assertLessEqual(cache.size(), cache.max_bytes)
+
+    def test_parse_cache_04(self):
+        """Replacing an entry does not count its size twice."""
+        cache = self.cache()
+        for _ in range(5):
+            cache.put("Petals 5", TRAITS)
+        self.assertEqual(cache.total, cache.size())
+
+    def test_parse_cache_05(self):
+        """The use times of hits are written together, not one at a time."""
+        cache = self.cache()
+        cache.put("Petals 5", TRAITS)
+        (before,) = cache.cxn.execute("select used from parses").fetchone()
+
+        cache.get("Petals 5")
+        (used,) = cache.cxn.execute("select used from parses").fetchone()
+        self.assertEqual(used, before)
+
+        cache.close()
+        (after,) = self.cache().cxn.execute("select used from parses").fetchone()
+        self.assertGreater(after, before)
@@ -0,0 +1,40 @@
+import unittest
+
+from traiter.pylib.util import compress
+
+from flora.pylib.pipe_gate import PipeGate
+from flora.pylib.pipelines import flora_pipeline
+from tests.setup import PIPELINE, parse
+
+GATE = PipeGate(PIPELINE, flora_pipeline.gates())
+
+TEXTS = [
+    "Leaf (12-)23-34 × 45-56 cm",
+    "Petals 5, white to pale pink, glabrous; sepals 3-5 mm.",
+    "Astragalus cobrensis A. Gray var. maguirei Kearney",
+    "Stems often caespitose",
+    "Plants perennial, deciduous; flowers unisexual, fragrant.",
+    "It is similar to Cuscuta jepsonii.",
+    """Leaves ovate, apex acute, 3-5 mm long. Stems often caespitose. Petals 5,
+        white to pale pink, glabrous; sepals 3-5 mm.""",
+]
+
+
+class TestPipeGate(unittest.TestCase):
+    def test_pipe_gate_01(self):
+        """Gating components does not change the traits."""
+        for text in TEXTS:
+            doc = GATE(compress(text))
+            self.assertEqual([e._.trait for e in doc.ents], parse(text))
+
+    def test_pipe_gate_02(self):
+        """Components are skipped when their labels are missing."""
+        GATE("Stems often caespitose")
+        self.assertGreater(GATE.skips["size_patterns"], 0)
+
+    def test_pipe_gate_03(self):
+        """Sentences without their labels are skipped even when the doc has them."""
+        gate = PipeGate(PIPELINE, flora_pipeline.gates())
+        gate(compress("Leaf 3-5 mm long. Stems often caespitose."))
+        self.assertEqual(gate.runs["size_patterns"], 1)
+        self.assertEqual(gate.skips["size_patterns"], 1)
@@ -0,0 +1,29 @@
+import unittest
+
+from flora.pylib.pipe_profiler import PipeStats
+
+
+class TestPipeProfiler(unittest.TestCase):
+    def test_pipe_profiler_01(self):
+        """Entities that are new after a component are counted as added."""
+        stats = PipeStats("part")
+        stats.add(0.5, {(0, 4, "part")}, {(0, 4, "part"), (5, 9, "color")})
+        self.assertEqual((stats.added, stats.removed), (1, 0))
+
+    def test_pipe_profiler_02(self):
+        """Entities that are gone after a component are counted as removed."""
+        stats = PipeStats("cleanup")
+        stats.add(0.5, {(0, 4, "part"), (5, 9, "range")}, {(0, 4, "part")})
+        stats.add(0.5, {(0, 3, "range")}, {(0, 3, "size")})
+        self.assertEqual((stats.added, stats.removed), (1, 2))
+
+    def test_pipe_profiler_03(self):
+        """Timings add up over calls and keep the slowest one."""
+        stats = PipeStats("size")
+        stats.add(0.25, set(), set())
+        stats.add(0.75, set(), set())
+        self.assertEqual(stats.calls, 2)
+        self.assertAlmostEqual(stats.total, 1.0)
+        self.assertAlmostEqual(stats.longest, 0.75)
+        self.assertAlmostEqual(stats.per_doc, 0.5)
+        self.assertEqual(PipeStats("new").per_doc, 0.0)
@@ -0,0 +1,52 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from flora.pylib.fingerprint import pipeline_fingerprint
+from flora.pylib.pipelines import flora_pipeline
+from tests.setup import PIPELINE
+
+
+class TestPipelineCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        cls.cache_dir = Path(cls.temp_dir.name)
+        flora_pipeline.build(cache_dir=cls.cache_dir)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.temp_dir.cleanup()
+
+    def test_pipeline_cache_01(self):
+        """A saved pipeline parses like a freshly built one."""
+        fingerprint = (self.cache_dir / "fingerprint.txt").read_text()
+        self.assertNotIn(flora_pipeline.UNUSABLE, fingerprint)
+
+        nlp = flora_pipeline.load_cached(self.cache_dir)
+        self.assertIsNotNone(nlp)
+        for probe in flora_pipeline.PROBES:
+            self.assertEqual(
+                flora_pipeline.ents(nlp(probe)), flora_pipeline.ents(PIPELINE(probe))
+            )
+
+    def test_pipeline_cache_02(self):
+        """A changed rule or term file means the pipeline is built again."""
+        with patch("flora.pylib.pipelines.flora_pipeline.pipeline_fingerprint") as fp:
+            fp.return_value = "changed"
+            self.assertIsNone(flora_pipeline.load_cached(self.cache_dir))
+
+    def test_pipeline_cache_03(self):
+        """A pipeline that could not be saved is not saved again."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache_dir = Path(temp_dir)
+            fingerprint = cache_dir / "fingerprint.txt"
+            fingerprint.write_text(
+                f"{pipeline_fingerprint()} {flora_pipeline.UNUSABLE}\n"
+            )
+
+            flora_pipeline.save_cached(PIPELINE, cache_dir)
+
+            self.assertFalse((cache_dir / "pipeline").exists())
+            self.assertIsNone(flora_pipeline.load_cached(cache_dir))
@@ -0,0 +1,36 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from flora.pylib.prefetch import read_ahead
+from flora.pylib.treatment import Treatment
+
+
+class TestPrefetch(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        cls.paths = []
+        for i in range(20):
+            path = Path(cls.temp_dir.name) / f"treatment_{i:02d}.txt"
+            path.write_text(f"Petals {i},\n\n  white – pink.")
+            cls.paths.append(path)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.temp_dir.cleanup()
+
+    def test_prefetch_01(self):
+        """Treatments are read like they are without prefetching and stay in order."""
+        expect = [Treatment(p).read() for p in self.paths]
+        for depth in (0, 1, 4, 50):
+            treatments = read_ahead([Treatment(p) for p in self.paths], depth=depth)
+            self.assertEqual([t.text for t in treatments], expect)
+
+    def test_prefetch_02(self):
+        """Only a limited number of treatments are read ahead."""
+        treatments = [Treatment(p) for p in self.paths]
+        reader = read_ahead(treatments, depth=4)
+        next(reader)
+        self.assertTrue(treatments[0].text)
+        self.assertFalse(any(t.text for t in treatments[4:]))
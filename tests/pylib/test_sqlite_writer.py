@@ -0,0 +1,49 @@
+import sqlite3
+import unittest
+
+from flora.pylib.writers.sqlite_writer import SqliteWriter
+from tests.setup import TEXTS, parse, temp_dir, treatments
+
+
+class TestSqliteWriter(unittest.TestCase):
+    def setUp(self):
+        self.path = temp_dir(self) / "traits.sqlite"
+        self.writer = SqliteWriter(self.path)
+        self.addCleanup(self.writer.close)
+        for treatment in treatments():
+            self.writer.add(treatment)
+        self.writer.commit()
+
+    def query(self, sql, params=()):
+        with sqlite3.connect(self.path) as cxn:
+            return cxn.execute(sql, params).fetchall()
+
+    def test_sqlite_writer_01(self):
+        """Every trait gets a row with its treatment, taxon, and offsets."""
+        rows = self.query("select treatment, taxon, start, end from traits")
+        self.assertEqual(len(rows), sum(len(parse(t)) for t in TEXTS.values()))
+        for name, taxon, start, end in rows:
+            self.assertLess(start, end)
+            self.assertLessEqual(end, len(TEXTS[name]))
+            if name == "t1":
+                self.assertTrue(taxon.startswith("Astragalus cobrensis"))
+
+    def test_sqlite_writer_02(self):
+        """Fields can be queried by value with the index."""
+        plan = self.query(
+            "explain query plan select * from fields where field = ? and value > ?",
+            ("x", 10),
+        )
+        self.assertIn("fields_field_value", " ".join(r[-1] for r in plan))
+
+    def test_sqlite_writer_03(self):
+        """Traits of a treatment can be replaced."""
+        self.writer.remove("t2")
+        self.writer.commit()
+        rows = self.query("select distinct treatment from traits order by treatment")
+        self.assertEqual(rows, [(n,) for n in TEXTS if n != "t2"])
+        orphans = self.query(
+            "select count(*) from fields where trait_id not in "
+            "(select trait_id from traits)"
+        )
+        self.assertEqual(orphans, [(0,)])
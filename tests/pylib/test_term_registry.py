@@ -0,0 +1,32 @@
+import unittest
+from pathlib import Path
+
+from traiter.pylib.rules import terms as t_terms
+
+from flora.pylib import term_registry
+from flora.pylib.rules.count import Count
+from flora.pylib.rules.range import Range
+
+NUMERIC_CSV = Path(t_terms.__file__).parent / "numeric_terms.csv"
+
+
+class TestTermRegistry(unittest.TestCase):
+    def test_term_registry_01(self):
+        """Every consumer of a term file gets the same parsed rows."""
+        first = term_registry.read_terms(NUMERIC_CSV)
+        second = term_registry.read_terms([NUMERIC_CSV])
+        self.assertTrue(all(a is b for a, b in zip(first, second, strict=True)))
+
+    def test_term_registry_02(self):
+        """Identical lookup tables are built once and shared."""
+        self.assertIs(
+            term_registry.look_up_table(Count.all_csvs, "replace"),
+            Count.replace,
+        )
+
+    def test_term_registry_03(self):
+        """A file used by several rules is parsed only once."""
+        term_registry.read_terms(Range.all_csvs)
+        term_registry.read_terms(Count.all_csvs)
+        names = [r["name"] for r in term_registry.report() if r["kind"] == "rows"]
+        self.assertEqual(names.count(NUMERIC_CSV.name), 1)
@@ -0,0 +1,20 @@
+import unittest
+
+from flora import audit_tokens
+from flora.pylib import token_audit
+from flora.pylib.pipelines import flora_pipeline
+
+USES = token_audit.audit(token_audit.source_files(audit_tokens.SCAN_DIRS))
+RULES = token_audit.audit(token_audit.source_files(audit_tokens.RULE_DIRS))
+
+
+class TestTokenAudit(unittest.TestCase):
+    def test_token_audit_01(self):
+        """The pipeline excludes exactly the model components that nothing reads."""
+        self.assertEqual(
+            sorted(flora_pipeline.MODEL_EXCLUDE), sorted(token_audit.unused(USES))
+        )
+
+    def test_token_audit_02(self):
+        """Rule class variables are not mistaken for token attributes."""
+        self.assertNotIn("HEAD", RULES)
@@ -0,0 +1,34 @@
+import unittest
+
+from traiter.pylib.darwin_core import DarwinCore
+
+from tests.setup import treatments
+
+
+class TestTraitDwc(unittest.TestCase):
+    def test_trait_dwc_01(self):
+        """It converts each trait once and reuses it."""
+        treat = treatments()[1]
+        self.assertIs(treat.dwc, treat.dwc)
+        self.assertEqual(len(treat.dwc), len(treat.traits))
+
+    def test_trait_dwc_02(self):
+        """It gives the same DarwinCore as converting every trait."""
+        treat = treatments()[1]
+        for trait, dwc in zip(treat.traits, treat.dwc, strict=True):
+            self.assertEqual(dwc.to_dict(), trait.to_dwc(DarwinCore()).to_dict())
+
+    def test_trait_dwc_03(self):
+        """It merges the traits just like converting them all into one."""
+        treat = treatments()[1]
+        expect = DarwinCore()
+        for trait in treat.traits:
+            trait.to_dwc(expect)
+        self.assertEqual(treat.dwc_dict(), expect.to_dict())
+
+    def test_trait_dwc_04(self):
+        """It drops the conversions when the treatment is released."""
+        treat = treatments()[1]
+        _ = treat.dwc
+        treat.release()
+        self.assertEqual(treat.dwc, [])
@@ -0,0 +1,79 @@
+import unittest
+
+from traiter.pylib.darwin_core import DYN, DarwinCore
+from traiter.pylib.util import compress
+
+from flora.pylib.pipelines import flora_pipeline
+from tests.setup import parse
+
+SIZE_PIPELINE = flora_pipeline.build(traits=["size"])
+SHAPE_PIPELINE = flora_pipeline.build(traits=["shape"])
+
+
+def dwc_keys(traits: list, label: str) -> list:
+    return [
+        list(t.to_dwc(DarwinCore()).to_dict().get(DYN, {}))
+        for t in traits
+        if t._trait == label
+    ]
+
+
+class TestTraitSelection(unittest.TestCase):
+    def test_trait_selection_01(self):
+        """Selecting a trait also selects the traits it needs."""
+        self.assertEqual(
+            flora_pipeline.required(["size"]),
+            {"size", "range", "sex", "part", "subpart", "part_location"},
+        )
+
+    def test_trait_selection_02(self):
+        self.assertEqual(
+            flora_pipeline.required(["taxon_like"]),
+            {
+                "taxon_like",
+                "taxon",
+                "name",
+                "color",
+                "sex",
+                "part",
+                "subpart",
+                "part_location",
+            },
+        )
+
+    def test_trait_selection_03(self):
+        """A smaller pipeline parses the selected traits like the full one."""
+        text = "Leaf (12-)23-34 × 45-56 cm"
+        doc = SIZE_PIPELINE(compress(text))
+        self.assertEqual([e._.trait for e in doc.ents], parse(text))
+
+    def test_trait_selection_04(self):
+        """Unselected rules are not in the pipeline."""
+        self.assertNotIn("taxon_like_patterns", SIZE_PIPELINE.pipe_names)
+        self.assertNotIn("shared_terms", SIZE_PIPELINE.pipe_names)
+
+    def test_trait_selection_05(self):
+        """Traits linked to parts and subparts get the same keys as in a full build."""
+        text = "Leaves ovate, apex acute, 3-5 mm long."
+        traits = [e._.trait for e in SIZE_PIPELINE(compress(text)).ents]
+        self.assertEqual(dwc_keys(traits, "size"), dwc_keys(parse(text), "size"))
+
+    def test_trait_selection_06(self):
+        text = "Leaves ovate, apex acute, 3-5 mm long."
+        traits = [e._.trait for e in SHAPE_PIPELINE(compress(text)).ents]
+        expect = dwc_keys(parse(text), "shape")
+        self.assertEqual(dwc_keys(traits, "shape"), expect)
+        self.assertNotIn(["shape"], expect)
+
+    def test_trait_selection_07(self):
+        """Parse results from other pipelines are kept apart."""
+        variants = {
+            flora_pipeline.variant(),
+            flora_pipeline.variant(["size"]),
+            flora_pipeline.variant(model=False),
+            flora_pipeline.variant(["size"], model=False),
+        }
+        self.assertEqual(len(variants), 4)
+        self.assertEqual(
+            flora_pipeline.variant(["size", "range"]), flora_pipeline.variant(["size"])
+        )
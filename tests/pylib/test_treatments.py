@@ -0,0 +1,84 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from flora.pylib.treatments import Treatments
+
+TEXTS = [
+    "Leaf (12-)23-34 × 45-56 cm",
+    "Petals 5, white to pale pink, glabrous; sepals 3-5 mm.",
+    "Astragalus cobrensis A. Gray var. maguirei Kearney",
+    """Leaves ovate, apex acute, 3-5 mm long. Petals 5, white to pale pink,
+        glabrous; sepals 3-5 mm. Stems often caespitose.""",
+    "Perennial herbs; flowers white.",
+]
+
+
+class TestTreatments(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        cls.treatment_dir = Path(cls.temp_dir.name)
+        for i, text in enumerate(TEXTS * 3):
+            path = cls.treatment_dir / f"treatment_{i:02d}.txt"
+            path.write_text(text)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.temp_dir.cleanup()
+
+    def parse(self, batch_size=0, workers=0, chunk_size=1000) -> list[tuple]:
+        treatments = Treatments(self.treatment_dir, None, 0, chunk_size=chunk_size)
+        return [
+            (t.path.name, t.text, t.traits)
+            for t in treatments.parsed(batch_size=batch_size, workers=workers)
+        ]
+
+    def dedupe(self, batch_size=0, workers=0) -> tuple[list[tuple], int]:
+        treatments = Treatments(self.treatment_dir, None, 0, dedupe=True)
+        parsed = [
+            (t.path.name, t.text, t.traits)
+            for t in treatments.parsed(batch_size=batch_size, workers=workers)
+        ]
+        return parsed, treatments.dedupe.skipped
+
+    def test_treatments_01(self):
+        """Worker processes give the same results as one process, in order."""
+        self.assertEqual(self.parse(workers=2), self.parse())
+
+    def test_treatments_02(self):
+        """Long treatments split among workers give the same results."""
+        self.assertEqual(
+            self.parse(workers=2, chunk_size=60), self.parse(chunk_size=60)
+        )
+
+    def test_treatments_03(self):
+        """Long treatments are only read when their jobs are due."""
+        treatments = Treatments(self.treatment_dir, None, 0, chunk_size=10)
+        parsed = treatments.parsed(workers=1)
+        next(parsed)
+        self.assertFalse(treatments.treatments[-1].text)
+        parsed.close()
+
+    def test_treatments_04(self):
+        """Parsing in batches gives the same results as one at a time."""
+        self.assertEqual(self.parse(batch_size=2), self.parse())
+        self.assertEqual(self.parse(batch_size=2, workers=2), self.parse())
+
+    def test_treatments_05(self):
+        """Duplicates in a batch are parsed once and copied to the others."""
+        parsed, skipped = self.dedupe(batch_size=8)
+        self.assertEqual(parsed, self.parse())
+        self.assertEqual(skipped, 10)
+
+    def test_treatments_06(self):
+        """Duplicates skipped by workers are counted."""
+        parsed, skipped = self.dedupe(workers=2)
+        self.assertEqual(parsed, self.parse())
+        self.assertEqual(skipped, 10)
+
+    def test_treatments_07(self):
+        """Workers that only see some of the duplicates still copy their traits."""
+        parsed, skipped = self.dedupe(batch_size=2, workers=2)
+        self.assertEqual(parsed, self.parse())
+        self.assertLessEqual(skipped, 10)
@@ -0,0 +1,46 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from flora.pylib.watcher import Watcher
+
+
+class TestWatcher(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.dir = Path(self.temp_dir.name)
+        (self.dir / "old.txt").write_text("Leaves green.")
+        self.watcher = Watcher(self.dir)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_watcher_01(self):
+        """Files that are there at the start are parsed on the first poll."""
+        self.assertEqual(self.watcher.poll(), ([self.dir / "old.txt"], []))
+        self.assertEqual(self.watcher.poll(), ([], []))
+
+    def test_watcher_02(self):
+        """New files are parsed once they stop changing."""
+        self.watcher.poll()
+        (self.dir / "new.txt").write_text("Petals 5.")
+        self.assertEqual(self.watcher.poll(), ([], []))
+        self.assertEqual(self.watcher.poll(), ([self.dir / "new.txt"], []))
+
+    def test_watcher_03(self):
+        self.watcher.poll()
+        (self.dir / "old.txt").write_text("Leaves green or red.")
+        self.watcher.poll()
+        self.assertEqual(self.watcher.poll(), ([self.dir / "old.txt"], []))
+
+    def test_watcher_04(self):
+        self.watcher.poll()
+        (self.dir / "old.txt").unlink()
+        self.assertEqual(self.watcher.poll(), ([], [self.dir / "old.txt"]))
+
+    def test_watcher_05(self):
+        """Only the files in the limit and offset are watched."""
+        for name in ("a.txt", "b.txt", "c.txt"):
+            (self.dir / name).write_text("Petals 5.")
+        watcher = Watcher(self.dir, limit=2, offset=1)
+        self.assertEqual(watcher.poll(), ([self.dir / "b.txt", self.dir / "c.txt"], []))
@@ -0,0 +1,61 @@
+import json
+import subprocess
+import sys
+import textwrap
+import unittest
+from dataclasses import dataclass
+from typing import ClassVar
+
+from flora.pylib.rules.lazy_terms import LazyTerms
+
+SCRIPT = textwrap.dedent(
+    """
+    import importlib
+    import inspect
+    import json
+    import pkgutil
+
+    from flora.pylib import rules
+    from flora.pylib.rules.lazy_terms import LazyTerms
+
+    modules = [
+        importlib.import_module(f"{rules.__name__}.{m.name}")
+        for m in pkgutil.iter_modules(rules.__path__)
+    ]
+
+    loaded = [
+        v.name
+        for module in modules
+        for _, cls in inspect.getmembers(module, inspect.isclass)
+        for v in vars(cls).values()
+        if isinstance(v, LazyTerms) and v.loaded
+    ]
+
+    print(json.dumps(loaded))
+    """
+)
+
+
+class TestLazyTerms(unittest.TestCase):
+    def test_lazy_terms_01(self):
+        """Importing the rules does not read any term tables."""
+        # Use a fresh interpreter so the other tests have not loaded anything yet
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", SCRIPT], capture_output=True, text=True, check=True
+        )
+        self.assertEqual(json.loads(result.stdout), [])
+
+    def test_lazy_terms_02(self):
+        """A table is loaded the first time it is used and only then."""
+        calls = []
+
+        @dataclass(eq=False)
+        class Rule:
+            csv: ClassVar[str] = "terms.csv"
+            table = LazyTerms(lambda: calls.append(Rule.csv) or {"a": "b"})
+            rule: str = None
+
+        self.assertEqual(calls, [])
+        self.assertEqual(Rule.table, {"a": "b"})
+        self.assertEqual(Rule(rule="x").table, {"a": "b"})
+        self.assertEqual(calls, ["terms.csv"])
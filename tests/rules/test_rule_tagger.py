@@ -0,0 +1,32 @@
+import unittest
+
+from traiter.pylib.util import compress
+
+from flora.pylib.pipelines import flora_pipeline
+from tests.setup import parse
+
+MODEL_FREE = flora_pipeline.build(model=False)
+
+
+def tags(text: str) -> list[str]:
+    return [t.pos_ for t in MODEL_FREE(compress(text))]
+
+
+class TestRuleTagger(unittest.TestCase):
+    def test_rule_tagger_01(self):
+        self.assertEqual(
+            tags("similar to Cuscuta jepsonii"), ["ADJ", "ADP", "PROPN", "NOUN"]
+        )
+
+    def test_rule_tagger_02(self):
+        self.assertEqual(tags("pink or white"), ["NOUN", "CCONJ", "NOUN"])
+
+    def test_rule_tagger_03(self):
+        """The model-free pipeline parses plain traits like the full one."""
+        for text in [
+            "Leaf (12-)23-34 × 45-56 cm",
+            "Petals 5, white to pale pink, glabrous; sepals 3-5 mm.",
+            "It is similar to Cuscuta jepsonii.",
+        ]:
+            doc = MODEL_FREE(compress(text))
+            self.assertEqual([e._.trait for e in doc.ents], parse(text))
@@ -1,9 +1,25 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
 import traiter.pylib.darwin_core as t_dwc
 from traiter.pylib.util import compress
 
 from flora.pylib.pipelines import flora_pipeline
+from flora.pylib.treatment import Treatment
+
+CACHE_DIR = os.getenv("FLORA_PIPELINE_CACHE")
+CACHE_DIR = Path(CACHE_DIR) if CACHE_DIR else None
 
-PIPELINE = flora_pipeline.build()
+PIPELINE = flora_pipeline.build(cache_dir=CACHE_DIR)
+
+# Treatments for testing the writers
+TEXTS = {
+    "t1": "Astragalus cobrensis A. Gray var. maguirei Kearney. Leaf 12-34 cm.",
+    "t2": "Petals 5, white to pale pink, glabrous; sepals 3-5 mm.",
+    "t3": "Sepals 3-5 mm, glabrous.",
+}
 
 
 def parse(text: str) -> list:
@@ -27,3 +43,17 @@ def to_dwc(label: str, text: str):
             return ent._.trait.to_dwc(dwc).to_dict()
 
     return {}
+
+
+def treatments() -> list[Treatment]:
+    return [
+        Treatment(Path(f"{name}.txt"), text=text, traits=parse(text))
+        for name, text in TEXTS.items()
+    ]
+
+
+def temp_dir(test: unittest.TestCase) -> Path:
+    """Make a temporary directory that is removed after the test."""
+    dir_ = tempfile.TemporaryDirectory()
+    test.addCleanup(dir_.cleanup)
+    return Path(dir_.name)